@@ -1,4 +1,72 @@
 import re
+import hashlib
+from pathlib import Path
+from typing import Callable, Union
+Invoker = mod('NoNode').Invoker # signature-aware callback invocation shared with NoNode
+NameFilter = mod('NoNode').NameFilter # precompiled name/wildcard matcher shared with NoNode
+
+
+class _LazyProperty:
+    """
+    Placeholder of an eval<Name>/par<Name>/evalGroup<Name>/parGroup<Name> property on the extension class.
+
+    It is swapped for the real property on first get or set, so only these names are hooked and every other
+    attribute of the extension is accessed as usual.
+    """
+    __slots__ = ('name', 'resolve')
+
+    def __init__(self, name: str, resolve: Callable) -> None:
+        self.name = name
+        self.resolve = resolve
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if not self.resolve(self.name):
+            raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'")
+        return getattr(instance, self.name)
+
+    def __set__(self, instance, value) -> None:
+        if self.resolve(self.name):
+            setattr(instance, self.name, value)
+        else:
+            instance.__dict__[self.name] = value
+
+
+class _ScopedProperty:
+    """
+    Property of an extension class shared by scoped owners (eg. replicas), see Init(scoped=True).
+
+    Looks up the scope of the instance's ownerComp and delegates to the property (or placeholder) in its table, so
+    every replica reads and sets the parameters of its own owner.
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __scopeProperty(self, instance):
+        scope = CustomParHelper.SCOPES.get(getattr(instance, 'ownerComp', None))
+        return scope.PROPERTIES.get(self.name) if scope is not None else None
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        prop = self.__scopeProperty(instance)
+        if prop is not None:
+            return prop.__get__(instance, owner)
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'") from None
+
+    def __set__(self, instance, value) -> None:
+        prop = self.__scopeProperty(instance)
+        if prop is not None:
+            prop.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
 
 class CustomParHelper:
     """
@@ -33,7 +101,7 @@ class CustomParHelper:
        CustomParHelper.Init(self, ownerComp, enable_properties: bool = True, enable_callbacks: bool = True, enable_parGroups: bool = True, enable_seq: bool = True, expose_public: bool = False,
              par_properties: list[str] = ['*'], par_callbacks: list[str] = ['*'], 
              except_properties: list[str] = [], except_sequences: list[str] = [], except_callbacks: list[str] = [], except_pages: list[str] = [], 
-             enable_stubs: bool = False, general_callback_enable: bool = True)
+             enable_stubs: bool = False, general_callback_enable: bool = True, cache_constants: bool = False, use_mixin: bool = False, scoped: bool = False)
        ```
 
         Additional options:
@@ -48,8 +116,15 @@ class CustomParHelper:
         - `except_callbacks`: List of parameter names to exclude from callback handling
         - `except_pages`: List of parameter pages to exclude from property and callback handling
         - `except_sequences`: List of sequence names to exclude from property and callback handling
+          The lists above take tdu.match patterns: wildcards, and `^` to exclude names from the patterns before it (eg. `par_callbacks=['Color*', '^Colora']`)
         - `enable_stubs`: If True, automatically creates and updates stubs for the extension (default: False) (thanks to AlphaMoonbase.berlin for Stubser)
         - `general_callback_enable`: If True, enables general callbacks that catch all parameter changes (default: True)
+        - `cache_constants`: If True, `eval<ParamName>` of parameters in CONSTANT mode is served from a cache invalidated on value and mode changes, see `CustomParHelper.EvalCacheStats()` (default: False, needs enable_callbacks)
+        - `use_mixin`: If True, properties and callbacks come from a generated `<ExtClass>Mixin` DAT next to the extension, see `CustomParHelper.GenerateMixin()` (default: False).
+          Inherit from its class to get real properties reading `self.ownerComp` (then Init installs none, and cache_constants does not apply to them).
+          Init only compares the mixin with the layout hash stored on the owner, the mixin is generated the frame after Init if missing and regenerated on parameter layout changes
+        - `scoped`: If True, the owner gets its own helper state (a CustomParScope with the same methods, returned by Init), so many components sharing the same ExtUtils do not overwrite each other (default: False).
+          The exec DATs of the package are shared: they watch all owners and route each event to the scope of the parameter's owner
 
     3. Access and set custom parameters as properties (if enable_properties=True (default)):
        
@@ -89,6 +164,9 @@ class CustomParHelper:
          ```
 
        > NOTE: to expose public properties, eg. self.Par<ParamName> instead of self.par<ParamName>, set expose_public=True in the Init function
+       > NOTE: Init only puts a placeholder per name on the extension class, the parameter lookup, filtering and property are resolved on first access and cached.
+         Placing the placeholders still touches every custom parameter on Init and on parameter table changes, for an Init that doesn't
+         grow with the parameter count use use_mixin=True and inherit the generated mixin class, see GenerateMixin
 
     4. Implement callbacks (if enable_callbacks=True (default)):
        a) Parameter-specific callbacks:
@@ -138,12 +216,25 @@ class CustomParHelper:
            # _par can be omitted if not needed
          ```
 
+       c) Callbacks are resolved once per parameter on Init and whenever the custom parameters change. If you add
+       callback methods to the extension at runtime, refresh the table:
+         ```python
+         CustomParHelper.UpdateCallbackTable()
+         ```
+
+       d) Aggregated callback, called once per frame with all custom parameter changes of the frame (opt-in by implementing it):
+         ```python
+         def onParsChanged(self, changes):
+           # changes: {par_name: (val, prev), ...}, eg. to rebuild state that depends on several parameters once
+         ```
+
     > NOTE: This class is part of the extUtils package, and is designed to work with the QuickExt framework.
     > NOTE: The reason this is implemented with static methods, is to omit the need to instantiate the class, providing a simpler interface (arguably).
     """
     
     EXT_SELF = None
     EXT_OWNERCOMP = None
+    SCOPES: dict[COMP, 'CustomParScope'] = {} # owner COMP -> its own helper state, see Init(scoped=True)
 
     PAR_EXEC = op('extParExec')
     DAT_EXEC = op('extParPropDatExec')
@@ -154,22 +245,73 @@ class CustomParHelper:
     EXCEPT_PAGES_STATIC: list[str]  = ['Version Ctrl', 'About', 'Info']
     EXCEPT_PAGES: list[str] = EXCEPT_PAGES_STATIC
     EXCEPT_PROPS: list[str] = []
-    EXCEPT_CALLBACKS: list[str] = [] # handled outside in extParExec DAT
+    EXCEPT_CALLBACKS: list[str] = [] # applied to the callback table, see UpdateCallbackTable
     EXCEPT_SEQUENCES: list[str] = [] # handled outside in extSeqParExec DAT
     PAR_PROPS: list[str] = ['*']
-    PAR_CALLBACKS: list[str] = ['*'] # handled outside in extParExec DAT
+    PAR_CALLBACKS: list[str] = ['*'] # applied to the callback table, see UpdateCallbackTable
     SEQUENCE_PATTERN: str = r'(\w+?)(\d+)(.+)'
+    SEQUENCE_MATCH: Callable = re.compile(SEQUENCE_PATTERN).match
+
+    # the include/exclude options above, compiled in Init
+    PAR_PROPS_FILTER: NameFilter = NameFilter(PAR_PROPS)
+    PAR_CALLBACKS_FILTER: NameFilter = NameFilter(PAR_CALLBACKS)
+    EXCEPT_PROPS_FILTER: NameFilter = NameFilter(EXCEPT_PROPS)
+    EXCEPT_CALLBACKS_FILTER: NameFilter = NameFilter(EXCEPT_CALLBACKS)
+    EXCEPT_PAGES_FILTER: NameFilter = NameFilter(EXCEPT_PAGES)
+    EXCEPT_SEQUENCES_FILTER: NameFilter = NameFilter(EXCEPT_SEQUENCES)
     IS_EXPOSE_PUBLIC: bool = False
     STUBS_ENABLED: bool = False
     GENERAL_CALLBACK_ENABLE: bool = True
+    ENABLE_PARGROUPS: bool = True
+
+    # eval<Name>/par<Name>/evalGroup<Name>/parGroup<Name> properties are resolved on first access
+    PROPERTY_CLASS: type = None # extension class carrying the properties
+    PROPERTIES_RESOLVED: set[str] = set() # property names installed on PROPERTY_CLASS, _LazyProperty placeholders included
+    PROPERTIES_MISSING: set[str] = set() # prefixed names that turned out not to be custom parameters
+
+    # eval<Name> values of CONSTANT mode parameters, invalidated through extParExec, see Init(cache_constants=True)
+    EVAL_CACHE_ENABLED: bool = False
+    EVAL_CACHE: dict[str, object] = {}
+    EVAL_CACHE_HITS: int = 0
+    EVAL_CACHE_MISSES: int = 0
+
+    # argument forms per number of accepted arguments (excluding self), see Invoker
+    SEQ_VALUE_FORMS: tuple = (None, (1,), (1, 2), (0, 1, 2), (0, 1, 2, 3)) # (par, idx, val, prev)
+    PAR_VALUE_FORMS: tuple = (None, (1,), (0, 1), (0, 1, 2)) # (par, val, prev)
+    GENERAL_VALUE_FORMS: tuple = (None, (0,), (0, 1), (0, 1, 2)) # (par, val, prev)
+    SEQ_PULSE_FORMS: tuple = (None, (1,), (1, 0)) # (par, idx)
+    PAR_PULSE_FORMS: tuple = ((), (0,)) # (par,)
+    PARGROUP_FORMS: tuple = (None, (1,), (0, 1)) # (parGroup, val)
+    SEQ_BLOCK_FORMS: tuple = (None, (0,)) # (idx,)
+    PARS_CHANGED_FORMS: tuple = (None, (0,)) # (changes,)
+
+    # parameter name -> resolved handler (or None), rebuilt on Init and on custom parameter table change
+    VALUE_HANDLERS: dict[str, Callable] = {} # handler(par, prev)
+    PULSE_HANDLERS: dict[str, Callable] = {} # handler(par)
+    PARS_CHANGED_HANDLER: Callable = None # onParsChanged(changes), if the extension implements it
+
+    # ahead-of-time generated property and callback tables, see GenerateMixin and Init(use_mixin=True)
+    USE_MIXIN: bool = False
+    MIXIN_STORAGE_KEY: str = 'CustomParHelperLayoutHash' # layout hash of the last generated mixin, stored on the owner
+    MIXIN_PROPERTIES: dict[str, tuple] = None # property name -> (kind, parameter or parGroup name)
+    MIXIN_CALLBACKS: dict[str, tuple] = None # parameter name -> (callback method name, sequence block index) or None
+    MIXIN_EVAL_TYPES: dict[str, str] = {'Float': 'float', 'Int': 'int', 'Toggle': 'bool', 'Momentary': 'bool', 'Pulse': 'bool',
+                                        'Str': 'str', 'StrMenu': 'str', 'Menu': 'str', 'File': 'str', 'FileSave': 'str', 'Folder': 'str',
+                                        'OP': 'OP', 'COMP': 'COMP', 'TOP': 'TOP', 'CHOP': 'CHOP', 'SOP': 'SOP', 'DAT': 'DAT', 'MAT': 'MAT'}
 
 
     @classmethod
     def Init(cls, extension_self, ownerComp: COMP, enable_properties: bool = True, enable_callbacks: bool = True, enable_parGroups: bool = True, enable_seq: bool = True, expose_public: bool = False,
              par_properties: list[str] = ['*'], par_callbacks: list[str] = ['*'], 
              except_properties: list[str] = [], except_sequences: list[str] = [], except_callbacks: list[str] = [], except_pages: list[str] = [],
-             enable_stubs: bool = False, general_callback_enable: bool = True) -> None:
-        """Initialize the CustomParHelper."""
+             enable_stubs: bool = False, general_callback_enable: bool = True, cache_constants: bool = False, use_mixin: bool = False,
+             scoped: bool = False) -> Union['CustomParScope', None]:
+        """Initialize the CustomParHelper. With scoped=True the owner gets its own helper state, which is returned."""
+        if scoped:
+            return cls.__initScope(extension_self, ownerComp, enable_properties, enable_callbacks, enable_parGroups, enable_seq, expose_public,
+                                   par_properties, par_callbacks, except_properties, except_sequences, except_callbacks, except_pages,
+                                   enable_stubs, general_callback_enable, cache_constants, use_mixin)
+        is_scope = cls is not CustomParHelper
         cls.EXT_SELF = extension_self
         cls.EXT_OWNERCOMP = ownerComp
         cls.IS_EXPOSE_PUBLIC = expose_public
@@ -179,18 +321,39 @@ class CustomParHelper:
         cls.EXCEPT_PROPS = except_properties
         cls.EXCEPT_CALLBACKS = except_callbacks
         cls.EXCEPT_SEQUENCES = except_sequences
+        cls.PAR_PROPS_FILTER = NameFilter(cls.PAR_PROPS)
+        cls.PAR_CALLBACKS_FILTER = NameFilter(cls.PAR_CALLBACKS)
+        cls.EXCEPT_PROPS_FILTER = NameFilter(cls.EXCEPT_PROPS)
+        cls.EXCEPT_CALLBACKS_FILTER = NameFilter(cls.EXCEPT_CALLBACKS)
+        cls.EXCEPT_PAGES_FILTER = NameFilter(cls.EXCEPT_PAGES)
+        cls.EXCEPT_SEQUENCES_FILTER = NameFilter(cls.EXCEPT_SEQUENCES)
         cls.GENERAL_CALLBACK_ENABLE = general_callback_enable
+        cls.ENABLE_PARGROUPS = enable_parGroups
+        # the cache is only kept valid while value and mode changes reach extParExec
+        cls.EVAL_CACHE_ENABLED = cache_constants and enable_callbacks
+        cls.ResetEvalCache()
+        if cls.EVAL_CACHE_ENABLED and hasattr(cls.PAR_EXEC.par, 'modechange'):
+            cls.PAR_EXEC.par.modechange = True
+
+        cls.USE_MIXIN = use_mixin
+        cls.__loadMixin()
 
         cls.__setOwnerCompToDocked(ownerComp)
+        cls.UpdateCallbackTable()
 
-        cls.DAT_EXEC.par.active = enable_properties
+        if enable_properties or not is_scope: # scopes share the exec DATs, they only switch them on
+            cls.DAT_EXEC.par.active = enable_properties
 
         if enable_properties:
             cls.CustomParsAsProperties(extension_self, ownerComp, enable_parGroups=enable_parGroups)
+        else:
+            cls.__clearProperties()
+            cls.PROPERTY_CLASS = None
 
         if enable_callbacks:
-            cls.EnableCallbacks(enable_parGroups, enable_seq)
-        else:
+            # onParsChanged is delivered through the end of frame exec of parGroups
+            cls.EnableCallbacks(enable_parGroups or cls.PARS_CHANGED_HANDLER is not None, enable_seq)
+        elif not is_scope:
             cls.DisableCallbacks(not enable_parGroups, not enable_seq)
 
         if enable_stubs:
@@ -199,8 +362,29 @@ class CustomParHelper:
             cls.DisableStubs()
 
 
+    @classmethod
+    def __initScope(cls, extension_self, ownerComp: COMP, *args) -> 'CustomParScope':
+        """Initialize the helper state of one owner component, leaving the other owners sharing this package alone."""
+        for owner in [owner for owner in CustomParHelper.SCOPES if not owner.valid]:
+            del CustomParHelper.SCOPES[owner]
+        scope = CustomParHelper.SCOPES.get(ownerComp)
+        if scope is None:
+            scope = CustomParHelper.SCOPES[ownerComp] = CustomParScope()
+        scope.Init(extension_self, ownerComp, *args)
+        return scope
+
+    @classmethod
+    def __scopeOf(cls, _par: Par) -> Union[type, 'CustomParScope']:
+        """Return the helper handling a parameter, the scope of its owner if any."""
+        return CustomParHelper.SCOPES.get(_par.owner, CustomParHelper)
+
     @classmethod
     def __setOwnerCompToDocked(cls, ownerComp: COMP) -> None:
+        if CustomParHelper.SCOPES:
+            # scopes share the exec DATs of the package: they watch every owner and the On* methods
+            # route each event to the scope of the parameter's owner
+            owners = [owner for owner in [CustomParHelper.EXT_OWNERCOMP, *CustomParHelper.SCOPES] if owner is not None and owner.valid]
+            ownerComp = ' '.join(dict.fromkeys(owner.path for owner in owners))
         for _op in me.docked:
             if hasattr(_op.par, 'ops'):
                 _op.par.ops.val = ownerComp
@@ -210,70 +394,348 @@ class CustomParHelper:
 
     @classmethod
     def CustomParsAsProperties(cls, extension_self, ownerComp: COMP, enable_parGroups: bool = True) -> None:
-        """Create properties for custom parameters."""
+        """Expose custom parameters as properties, resolved lazily on first access."""
         if ownerComp is None:
             return
-        for _par in ownerComp.customPars:
-            if (not tdu.match(' '.join(cls.PAR_PROPS), [_par.name]) or
-                tdu.match(' '.join(cls.EXCEPT_PAGES), [_par.page.name]) or
-                tdu.match(' '.join(cls.EXCEPT_PROPS), [_par.name])):
-                continue
-            # Check if the parameter belongs to an excepted sequence
-            sequence_match = re.match(cls.SEQUENCE_PATTERN, _par.name)
-            if sequence_match and sequence_match.group(1) in cls.EXCEPT_SEQUENCES:
-                continue
-
-            cls._create_propertyEval(extension_self, ownerComp, _par.name, enable_parGroups=enable_parGroups)
-            cls._create_propertyPar(extension_self, ownerComp, _par.name, enable_parGroups=enable_parGroups)
+        cls.ENABLE_PARGROUPS = enable_parGroups
+        cls.__clearProperties()
+        cls.PROPERTY_CLASS = extension_self.__class__
+        cls.__installPlaceholders(cls.PROPERTY_CLASS)
 
     @classmethod
     def UpdateCustomParsAsProperties(cls) -> None:
         """Update the properties for custom parameters."""
-        cls.CustomParsAsProperties(cls.EXT_SELF, cls.EXT_OWNERCOMP)
+        if cls is CustomParHelper:
+            for scope in list(cls.SCOPES.values()):
+                scope.UpdateCustomParsAsProperties()
+        cls.__loadMixin(check_layout=True)
+        cls.CustomParsAsProperties(cls.EXT_SELF, cls.EXT_OWNERCOMP, enable_parGroups=cls.ENABLE_PARGROUPS)
+        cls.UpdateCallbackTable()
+        cls.EVAL_CACHE = {}
+
+    @classmethod
+    def ResolveAllProperties(cls) -> None:
+        """Install the properties of all custom parameters right away, e.g. for stubs or autocompletion."""
+        if cls.PROPERTY_CLASS is None or cls.EXT_OWNERCOMP is None:
+            return
+        if cls.MIXIN_PROPERTIES is not None:
+            for name in cls.MIXIN_PROPERTIES:
+                cls.__resolveProperty(name)
+            return
+        eval_prefix, par_prefix = ('Eval', 'Par') if cls.IS_EXPOSE_PUBLIC else ('eval', 'par')
+        for _par in cls.EXT_OWNERCOMP.customPars:
+            names = [_par.name]
+            if cls.ENABLE_PARGROUPS and cls.__isParGroup(_par):
+                names.append(f'Group{_par.parGroup.name}')
+            for name in names:
+                cls.__resolveProperty(f'{eval_prefix}{name}')
+                cls.__resolveProperty(f'{par_prefix}{name}')
+
+    @classmethod
+    def __installPlaceholders(cls, ext_class: type) -> None:
+        """
+        Put a _LazyProperty on the extension class for every prefixed custom parameter and parGroup name, leaving its own attributes alone.
+        Without a mixin this touches every custom parameter, an extension inheriting the generated mixin class needs no placeholders.
+        """
+        if cls.MIXIN_PROPERTIES is not None:
+            if f'{ext_class.__name__}Mixin' in (base.__name__ for base in ext_class.__mro__[1:]):
+                return
+            names = list(cls.MIXIN_PROPERTIES)
+        else:
+            eval_prefix, par_prefix = ('Eval', 'Par') if cls.IS_EXPOSE_PUBLIC else ('eval', 'par')
+            parnames = [_par.name for _par in cls.EXT_OWNERCOMP.customPars]
+            if cls.ENABLE_PARGROUPS:
+                parnames += [f'Group{pargroup.name}' for pargroup in cls.EXT_OWNERCOMP.customParGroups if len(pargroup) > 1]
+            names = [f'{prefix}{parname}' for parname in parnames for prefix in (eval_prefix, par_prefix)]
+        for name in names:
+            if not hasattr(ext_class, name) or isinstance(ext_class.__dict__.get(name), _ScopedProperty):
+                cls.__setProperty(name, _LazyProperty(name, cls.__resolveProperty))
+
+    @classmethod
+    def __setProperty(cls, name: str, prop) -> None:
+        """Install a property or placeholder on the extension class, scopes put it in their own table behind a _ScopedProperty."""
+        if cls is CustomParHelper:
+            setattr(cls.PROPERTY_CLASS, name, prop)
+        else:
+            cls.PROPERTIES[name] = prop
+            if not isinstance(cls.PROPERTY_CLASS.__dict__.get(name), _ScopedProperty):
+                setattr(cls.PROPERTY_CLASS, name, _ScopedProperty(name))
+        cls.PROPERTIES_RESOLVED.add(name)
+
+    @classmethod
+    def __installedProperty(cls, name: str):
+        """Return the property or placeholder installed for a name, None if there is none."""
+        if cls is CustomParHelper:
+            return cls.PROPERTY_CLASS.__dict__.get(name)
+        return cls.PROPERTIES.get(name)
+
+    @classmethod
+    def __clearProperties(cls) -> None:
+        """Drop the resolved properties, they are resolved again against the current custom parameters on next access."""
+        if cls is not CustomParHelper:
+            cls.PROPERTIES = {} # the _ScopedProperty descriptors stay, other scopes may share the class
+        elif cls.PROPERTY_CLASS is not None:
+            for name in cls.PROPERTIES_RESOLVED:
+                if name in cls.PROPERTY_CLASS.__dict__:
+                    delattr(cls.PROPERTY_CLASS, name)
+        cls.PROPERTIES_RESOLVED = set()
+        cls.PROPERTIES_MISSING = set()
+
+    @classmethod
+    def __resolveProperty(cls, name: str) -> bool:
+        """Install the property for a prefixed custom parameter or parGroup name, caching its Par handle. Returns False if there is none."""
+        if cls.PROPERTY_CLASS is None or name in cls.PROPERTIES_MISSING:
+            return False
+        current = cls.__installedProperty(name)
+        if current is not None and not isinstance(current, _LazyProperty):
+            return True
+        if cls.MIXIN_PROPERTIES is not None:
+            return cls.__resolveMixinProperty(name)
+        eval_prefix, par_prefix = ('Eval', 'Par') if cls.IS_EXPOSE_PUBLIC else ('eval', 'par')
+        prop = None
+        for prefix, is_eval in ((eval_prefix, True), (par_prefix, False)):
+            if not name.startswith(prefix):
+                continue
+            parname = name[len(prefix):]
+            _par = cls.__propertyPar(parname)
+            if _par is not None:
+                prop = cls._create_propertyEval(_par) if is_eval else cls._create_propertyPar(_par)
+            elif cls.ENABLE_PARGROUPS and parname.startswith('Group'):
+                pargroup = cls.__propertyParGroup(parname[len('Group'):])
+                if pargroup is not None:
+                    prop = cls._create_propertyEvalGroup(pargroup) if is_eval else cls._create_propertyParGroup(pargroup)
+            break
+        if prop is None:
+            return cls.__missingProperty(name)
+        cls.__setProperty(name, prop)
+        return True
+
+    @classmethod
+    def __missingProperty(cls, name: str) -> bool:
+        """Remember a name that is not a property (eg. excluded by the options) and drop its placeholder. Returns False."""
+        cls.PROPERTIES_MISSING.add(name)
+        if isinstance(cls.__installedProperty(name), _LazyProperty):
+            if cls is CustomParHelper:
+                delattr(cls.PROPERTY_CLASS, name)
+            else:
+                del cls.PROPERTIES[name]
+            cls.PROPERTIES_RESOLVED.discard(name)
+        return False
+
+    @classmethod
+    def __resolveMixinProperty(cls, name: str) -> bool:
+        """Install a property from the generated table, without matching the include/exclude options again."""
+        kind, target = cls.MIXIN_PROPERTIES.get(name, (None, None))
+        if kind in ('eval', 'par'):
+            _par = getattr(cls.EXT_OWNERCOMP.par, target, None)
+            prop = None if _par is None else cls._create_propertyEval(_par) if kind == 'eval' else cls._create_propertyPar(_par)
+        elif kind in ('evalGroup', 'parGroup'):
+            pargroup = getattr(cls.EXT_OWNERCOMP.parGroup, target, None)
+            prop = None if pargroup is None else cls._create_propertyEvalGroup(pargroup) if kind == 'evalGroup' else cls._create_propertyParGroup(pargroup)
+        else:
+            prop = None
+        if prop is None:
+            return cls.__missingProperty(name)
+        cls.__setProperty(name, prop)
+        return True
+
+    @classmethod
+    def __propertyPar(cls, parname: str) -> Union[Par, None]:
+        """Return the custom parameter of the owner if properties are enabled for it."""
+        _par = getattr(cls.EXT_OWNERCOMP.par, parname, None) if cls.EXT_OWNERCOMP is not None else None
+        if _par is None or not _par.isCustom or not cls.__includesProperty(_par):
+            return None
+        return _par
+
+    @classmethod
+    def __propertyParGroup(cls, groupname: str) -> Union[ParGroup, None]:
+        """Return the custom parGroup of the owner if properties are enabled for its first parameter."""
+        pargroup = getattr(cls.EXT_OWNERCOMP.parGroup, groupname, None) if cls.EXT_OWNERCOMP is not None else None
+        if pargroup is None or not pargroup[0].isCustom or not cls.__isParGroup(pargroup[0]) or not cls.__includesProperty(pargroup[0]):
+            return None
+        return pargroup
+
+    @classmethod
+    def __includesProperty(cls, _par: Par) -> bool:
+        """Apply par_properties, except_properties, except_pages and except_sequences to a parameter."""
+        if (not cls.PAR_PROPS_FILTER(_par.name) or
+            cls.EXCEPT_PAGES_FILTER(_par.page.name) or
+            cls.EXCEPT_PROPS_FILTER(_par.name)):
+            return False
+        # Check if the parameter belongs to an excepted sequence
+        sequence_match = cls.SEQUENCE_MATCH(_par.name)
+        return not (sequence_match and cls.EXCEPT_SEQUENCES_FILTER(sequence_match.group(1)))
 
     @classmethod
-    def _create_propertyEval(cls, extension_self, owner_comp: COMP, Parname: str, enable_parGroups: bool = True) -> None:
-        """Create a property for the evaluated value of a parameter."""
+    def _create_propertyEval(cls, _par: Par) -> property:
+        """Create a property for the evaluated value of a parameter, served from the eval cache while it is in CONSTANT mode."""
+        if not cls.EVAL_CACHE_ENABLED or not cls.__includesCallback(_par):
+            def getter(instance):
+                return _par.eval()
+            def setter(instance, value):
+                _par.val = value
+        else:
+            name = _par.name
+            def getter(instance):
+                try:
+                    value = cls.EVAL_CACHE[name]
+                    cls.EVAL_CACHE_HITS += 1
+                    return value
+                except KeyError:
+                    cls.EVAL_CACHE_MISSES += 1
+                value = _par.eval()
+                if _par.mode == ParMode.CONSTANT:
+                    cls.EVAL_CACHE[name] = value
+                return value
+            def setter(instance, value):
+                cls.EVAL_CACHE.pop(name, None)
+                _par.val = value
+        return property(getter, setter)
+
+    @classmethod
+    def __includesCallback(cls, _par: Par) -> bool:
+        """Check if a parameter gets callbacks, applying par_callbacks, except_callbacks and except_pages."""
+        return (cls.PAR_CALLBACKS_FILTER(_par.name) and
+                not cls.EXCEPT_CALLBACKS_FILTER(_par.name) and
+                not cls.EXCEPT_PAGES_FILTER(_par.page.name))
+
+    @classmethod
+    def ResetEvalCache(cls) -> None:
+        """Drop the cached eval<Name> values and reset the hit/miss counters."""
+        cls.EVAL_CACHE = {}
+        cls.EVAL_CACHE_HITS = 0
+        cls.EVAL_CACHE_MISSES = 0
+
+    @classmethod
+    def EvalCacheStats(cls) -> dict:
+        """Return the hits, misses and size of the eval cache, for tuning."""
+        return {'hits': cls.EVAL_CACHE_HITS, 'misses': cls.EVAL_CACHE_MISSES, 'size': len(cls.EVAL_CACHE)}
+
+    @classmethod
+    def _create_propertyEvalGroup(cls, pargroup: ParGroup) -> property:
+        """Create a property for the evaluated values of a parameter group."""
         def getter(instance):
-            return getattr(owner_comp.par, Parname).eval()
+            return pargroup.eval()
         def setter(instance, value):
-            getattr(owner_comp.par, Parname).val = value
-        def getter_group(instance):
-            return getattr(owner_comp.parGroup, Parname[:-1]).eval()
-        def setter_group(instance, value):
             for i, val in enumerate(value):
-                getattr(owner_comp.parGroup, Parname[:-1])[i].val = val
-
-        property_name = f'{"Eval" if cls.IS_EXPOSE_PUBLIC else "eval"}{Parname}'
-        setattr(extension_self.__class__, property_name, property(getter, setter))
-        
-        if enable_parGroups and cls.__isParGroup(getattr(owner_comp.par, Parname)):
-            setattr(extension_self.__class__, f'{"EvalGroup" if cls.IS_EXPOSE_PUBLIC else "evalGroup"}{Parname[:-1]}', property(getter_group, setter_group))
-        
+                cls.EVAL_CACHE.pop(pargroup[i].name, None)
+                pargroup[i].val = val
+        return property(getter, setter)
 
     @classmethod
-    def _create_propertyPar(cls, extension_self, owner_comp: COMP, Parname: str, enable_parGroups: bool = True) -> None:
+    def _create_propertyPar(cls, _par: Par) -> property:
         """Create a property for the parameter object."""
+        name = _par.name
+        def getter(instance):
+            return _par
+        def setter(instance, value):
+            if _par.mode in [ParMode.BIND, ParMode.CONSTANT]:
+                cls.EVAL_CACHE.pop(name, None)
+                _par.val = value
+        return property(getter, setter)
+
+    @classmethod
+    def _create_propertyParGroup(cls, pargroup: ParGroup) -> property:
+        """Create a property for the parameter group object."""
         def getter(instance):
-            return getattr(owner_comp.par, Parname)
+            return pargroup
         def setter(instance, value):
-            par = getattr(owner_comp.par, Parname)
-            if par.mode in [ParMode.BIND, ParMode.CONSTANT]:
-                par.val = value
-        def getter_group(instance):
-            return getattr(owner_comp.parGroup, Parname[:-1])
-        def setter_group(instance, value):
-            pargroup = getattr(owner_comp.parGroup, Parname[:-1])
             for i, val in enumerate(value):
                 if pargroup[i].mode in [ParMode.BIND, ParMode.CONSTANT]:
+                    cls.EVAL_CACHE.pop(pargroup[i].name, None)
                     pargroup[i].val = val
+        return property(getter, setter)
+
+    @classmethod
+    def UpdateCallbackTable(cls) -> None:
+        """
+        Resolve the callback of every custom parameter up front, so dispatching an event is a single dict lookup.
+        Parameters excluded by par_callbacks, except_callbacks or except_pages get no callback.
+        """
+        cls.VALUE_HANDLERS = {}
+        cls.PULSE_HANDLERS = {}
+        cls.PARS_CHANGED_HANDLER = None
+        if cls.EXT_OWNERCOMP is None:
+            return
+        method = getattr(cls.EXT_SELF, f'{"OnParsChanged" if cls.IS_EXPOSE_PUBLIC else "onParsChanged"}', None)
+        if method is not None:
+            cls.PARS_CHANGED_HANDLER = Invoker.Adapt(method, cls.PARS_CHANGED_FORMS)
+        if cls.MIXIN_CALLBACKS is not None:
+            return # resolved from the generated table on the first event of each parameter
+        for _par in cls.EXT_OWNERCOMP.customPars:
+            if _par.isPulse:
+                cls.__resolvePulseHandler(_par)
+            else:
+                cls.__resolveValueHandler(_par)
+
+    @classmethod
+    def __resolveValueHandler(cls, _par: Par) -> Union[Callable, None]:
+        """Find the value change callback of a parameter and cache it with its invoker bound."""
+        handler = None
+        if not cls.__includesCallback(_par):
+            cls.VALUE_HANDLERS[_par.name] = None
+            return None
+        sequence_method, sequence_index = cls.__sequenceMethod(_par)
+        if sequence_method is not None:
+            if sequence_method:
+                adapter = Invoker.Adapt(sequence_method, cls.SEQ_VALUE_FORMS)
+                handler = lambda _par, prev: adapter(_par, sequence_index, _par.eval(), prev)
+        else:
+            method = getattr(cls.EXT_SELF, f'{"OnPar" if cls.IS_EXPOSE_PUBLIC else "onPar"}{_par.name}', None)
+            forms = cls.PAR_VALUE_FORMS
+            if method is None and cls.GENERAL_CALLBACK_ENABLE:
+                # if not caught by any other callbacks, check if there is a general callback
+                method = getattr(cls.EXT_SELF, f'{"OnValueChange" if cls.IS_EXPOSE_PUBLIC else "onValueChange"}', None)
+                forms = cls.GENERAL_VALUE_FORMS
+            if method is not None:
+                adapter = Invoker.Adapt(method, forms)
+                handler = lambda _par, prev: adapter(_par, _par.eval(), prev)
+        cls.VALUE_HANDLERS[_par.name] = handler
+        return handler
 
-        property_name = f'{"Par" if cls.IS_EXPOSE_PUBLIC else "par"}{Parname}'
-        setattr(extension_self.__class__, property_name, property(getter, setter))
-        
-        if enable_parGroups and cls.__isParGroup(getattr(owner_comp.par, Parname)):
-            setattr(extension_self.__class__, f'{"ParGroup" if cls.IS_EXPOSE_PUBLIC else "parGroup"}{Parname[:-1]}', property(getter_group, setter_group))
+    @classmethod
+    def __resolvePulseHandler(cls, _par: Par) -> Union[Callable, None]:
+        """Find the pulse callback of a parameter and cache it with its invoker bound."""
+        handler = None
+        if not cls.__includesCallback(_par):
+            cls.PULSE_HANDLERS[_par.name] = None
+            return None
+        sequence_method, sequence_index = cls.__sequenceMethod(_par)
+        if sequence_method is not None:
+            if sequence_method:
+                adapter = Invoker.Adapt(sequence_method, cls.SEQ_PULSE_FORMS)
+                handler = lambda _par: adapter(_par, sequence_index)
+        else:
+            method = getattr(cls.EXT_SELF, f'{"OnPar" if cls.IS_EXPOSE_PUBLIC else "onPar"}{_par.name}', None)
+            if method is None and cls.GENERAL_CALLBACK_ENABLE:
+                # if not caught by any other callbacks, check if there is a general callback
+                method = getattr(cls.EXT_SELF, f'{"OnPulse" if cls.IS_EXPOSE_PUBLIC else "onPulse"}', None)
+            if method is not None:
+                handler = Invoker.Adapt(method, cls.PAR_PULSE_FORMS)
+        cls.PULSE_HANDLERS[_par.name] = handler
+        return handler
 
+    @classmethod
+    def __sequenceMethod(cls, _par: Par) -> tuple:
+        """Return (onSeq<SeqName>N<Parname> method or False, block index) for sequence parameters, (None, None) otherwise."""
+        if cls.MIXIN_CALLBACKS is not None and _par.name in cls.MIXIN_CALLBACKS:
+            entry = cls.MIXIN_CALLBACKS[_par.name]
+            if entry is None:
+                return False, None
+            method_name, sequence_index = entry
+            if sequence_index is None:
+                return None, None
+            return getattr(cls.EXT_SELF, method_name, None) or False, sequence_index
+        match = None
+        if _par.sequence is not None:
+            match = cls.SEQUENCE_MATCH(_par.name)
+        if not match:
+            return None, None
+        sequence_name, sequence_index, parameter_name = match.groups()
+        if cls.EXCEPT_SEQUENCES_FILTER(sequence_name):
+            return False, None
+        method_name = f'{"OnSeq" if cls.IS_EXPOSE_PUBLIC else "onSeq"}{sequence_name}N{parameter_name.capitalize()}'
+        return getattr(cls.EXT_SELF, method_name, None) or False, int(sequence_index)
 
     @classmethod
     def EnableCallbacks(cls, enable_parGroups: bool = True, enable_seq: bool = True) -> None:
@@ -298,107 +760,50 @@ class CustomParHelper:
     @classmethod
     def OnValueChange(cls, comp: COMP, _par: Par, prev: Par) -> None:
         """Handle value change events for custom parameters."""
-        # exceptions are handled in the parExec itself
-        # except for sequence parameters
-
-        comp = cls.EXT_SELF # a bit hacky to be able to call non-exposed methods too
-
-        # check if we are a sequence parameter first
-        match = None
-        if _par.sequence is not None:
-            match = re.match(cls.SEQUENCE_PATTERN, _par.name)
-        if match:
-            sequence_name, sequence_index, parameter_name = match.groups()
-            parameter_name = parameter_name.capitalize()
-            sequence_index = int(sequence_index)
-            if sequence_name in cls.EXCEPT_SEQUENCES:
-                return
-            method_name = f'{"OnSeq" if cls.IS_EXPOSE_PUBLIC else "onSeq"}{sequence_name}N{parameter_name}'
-            if hasattr(comp, method_name):
-                method = getattr(comp, method_name)
-                arg_count = method.__code__.co_argcount
-                if arg_count == 2:
-                    method(sequence_index)
-                if arg_count == 3:
-                    method(sequence_index, _par.eval())
-                elif arg_count == 4:
-                    method(_par, sequence_index, _par.eval())
-                elif arg_count == 5:
-                    method(_par, sequence_index, _par.eval(), prev)
-        elif hasattr(comp, f'{"OnPar" if cls.IS_EXPOSE_PUBLIC else "onPar"}{_par.name}'):
-            method = getattr(comp, f'{"OnPar" if cls.IS_EXPOSE_PUBLIC else "onPar"}{_par.name}')
-            arg_count = method.__code__.co_argcount  # Total number of arguments
-            if arg_count == 2:
-                method(_par.eval())
-            elif arg_count == 3:
-                method(_par, _par.eval())
-            elif arg_count == 4:
-                method(_par, _par.eval(), prev)
-        elif cls.GENERAL_CALLBACK_ENABLE:
-            # if not caught by any other callbacks, check if there is a general callback
-            method_check = f'{"OnValueChange" if cls.IS_EXPOSE_PUBLIC else "onValueChange"}'
-            if hasattr(comp, method_check):
-                method = getattr(comp, method_check)
-                arg_count = method.__code__.co_argcount
-                if arg_count == 2:
-                    method(_par)
-                elif arg_count == 3:
-                    method(_par, _par.eval())
-                elif arg_count == 4:
-                    method(_par, _par.eval(), prev)
+        # exceptions are resolved in the callback table
+        if cls.SCOPES and cls is CustomParHelper:
+            cls = cls.__scopeOf(_par)
+        if cls.EVAL_CACHE:
+            cls.EVAL_CACHE.pop(_par.name, None)
+        try:
+            handler = cls.VALUE_HANDLERS[_par.name]
+        except KeyError: # parameter added since the table was built, e.g. a new sequence block
+            handler = cls.__resolveValueHandler(_par)
+        if handler is not None:
+            handler(_par, prev)
 
 
     @classmethod
     def OnPulse(cls, comp: COMP, _par: Par) -> None:
         """Handle pulse events for custom parameters."""
-        # exceptions are handled in the parExec itself
-        # except for sequence parameters
-        
-        comp = cls.EXT_SELF # a bit hacky to be able to call non-exposed methods too
+        # exceptions are resolved in the callback table
+        if cls.SCOPES and cls is CustomParHelper:
+            cls = cls.__scopeOf(_par)
+        try:
+            handler = cls.PULSE_HANDLERS[_par.name]
+        except KeyError:
+            handler = cls.__resolvePulseHandler(_par)
+        if handler is not None:
+            handler(_par)
 
-        # check if we are a sequence parameter first
-        match = None
-        if _par.sequence is not None:
-            match = re.match(cls.SEQUENCE_PATTERN, _par.name)
-        if match:
-            sequence_name, sequence_index, parameter_name = match.groups()
-            parameter_name = parameter_name.capitalize()
-            sequence_index = int(sequence_index)
-            if sequence_name in cls.EXCEPT_SEQUENCES:
-                return
-            method_name = f'{"OnSeq" if cls.IS_EXPOSE_PUBLIC else "onSeq"}{sequence_name}N{parameter_name}'
-            if hasattr(comp, method_name):
-                method = getattr(comp, method_name)
-                arg_count = method.__code__.co_argcount
-                if arg_count == 2:
-                    method(sequence_index)
-                elif arg_count == 3:
-                    method(sequence_index, _par)
-        elif hasattr(comp, f'{"OnPar" if cls.IS_EXPOSE_PUBLIC else "onPar"}{_par.name}'):
-            method = getattr(comp, f'{"OnPar" if cls.IS_EXPOSE_PUBLIC else "onPar"}{_par.name}')
-            arg_count = method.__code__.co_argcount  # Total number of arguments
-            if arg_count == 1:
-                method()
-            elif arg_count == 2:
-                method(_par)
-        elif cls.GENERAL_CALLBACK_ENABLE:
-            # if not caught by any other callbacks, check if there is a general callback
-            method_check = f'{"OnPulse" if cls.IS_EXPOSE_PUBLIC else "onPulse"}'
-            if hasattr(comp, method_check):
-                method = getattr(comp, method_check)
-                arg_count = method.__code__.co_argcount
-                if arg_count == 1:
-                    method()
-                elif arg_count == 2:
-                    method(_par)
+
+    @classmethod
+    def OnModeChange(cls, comp: COMP, _par: Par) -> None:
+        """Handle mode change events for custom parameters, a parameter leaving CONSTANT mode must not be served from the eval cache."""
+        if cls.SCOPES and cls is CustomParHelper:
+            cls = cls.__scopeOf(_par)
+        cls.EVAL_CACHE.pop(_par.name, None)
 
 
     @classmethod
     def OnValuesChanged(cls, changes: list[tuple[Par, Par]]) -> None:
-        """Handle value change events for ParGroups."""
+        """Handle value change events for ParGroups, and deliver all changes of the frame to onParsChanged."""
         # exceptions are handled in the parExec itself
         # except for sequence parameters
-        parGroupsCalled = []
+        if cls.SCOPES and cls is CustomParHelper:
+            changes = cls.__forwardToScopes('OnValuesChanged', changes)
+        parGroupsCalled = set()
+        parsChanged = {} if cls.PARS_CHANGED_HANDLER is not None else None
         for change in changes:
             _par = change[0]
             # _prev = change[1]
@@ -408,15 +813,17 @@ class CustomParHelper:
             # check if we are a sequence parameter first
             match = None
             if _par.sequence is not None:
-                match = re.match(cls.SEQUENCE_PATTERN, _par.name)
+                match = cls.SEQUENCE_MATCH(_par.name)
             if match:
                 sequence_name, sequence_index, parameter_name = match.groups()
                 sequence_index = int(sequence_index)
-                if sequence_name in cls.EXCEPT_SEQUENCES:
+                if cls.EXCEPT_SEQUENCES_FILTER(sequence_name):
                     continue
-            if cls.__isParGroup(_par):
+            if parsChanged is not None:
+                parsChanged[_par.name] = (_par.eval(), change[1])
+            if cls.ENABLE_PARGROUPS and cls.__isParGroup(_par):
                 if _par.name[:-1] not in parGroupsCalled: # prevent calling parGroups multiple times
-                    parGroupsCalled.append(_par.name[:-1])
+                    parGroupsCalled.add(_par.name[:-1])
                 else:
                     continue
                 # fetch the parGroup and ParName if it's a parGroup
@@ -426,17 +833,17 @@ class CustomParHelper:
                     _par = _comp.ownerComp.parGroup[ParGroup] 
                     method_name = f'{"OnParGroup" if cls.IS_EXPOSE_PUBLIC else "onParGroup"}{ParGroup}'
                     if hasattr(_comp, method_name):
-                        method = getattr(_comp, method_name)
-                        arg_count = method.__code__.co_argcount
-                        if arg_count == 2:
-                            method(_par.eval())
-                        elif arg_count == 3:
-                            method(_par, _par.eval())
+                        Invoker.Call(getattr(_comp, method_name), cls.PARGROUP_FORMS, _par, _par.eval())
+
+        if parsChanged:
+            cls.PARS_CHANGED_HANDLER(parsChanged)
 
     @classmethod
     def OnSeqValuesChanged(cls, changes: list[tuple[Par, Par]]) -> None:
         """Handle value change events for Sequence blocks."""
-        seqsCalled = []
+        if cls.SCOPES and cls is CustomParHelper:
+            changes = cls.__forwardToScopes('OnSeqValuesChanged', changes)
+        seqsCalled = set()
         for change in changes:
             _par = change[0]
             # _prev = change[1]
@@ -444,23 +851,31 @@ class CustomParHelper:
             _comp = cls.EXT_SELF # a bit hacky to be able to call non-exposed methods too
             # handle sequence exceptions
             # check if we are a sequence parameter first
-            match = re.match(cls.SEQUENCE_PATTERN, _par.name)
+            match = cls.SEQUENCE_MATCH(_par.name)
             if match:
                 sequence_name, sequence_index, parameter_name = match.groups()
                 sequence_index = int(sequence_index)
-                if sequence_name in cls.EXCEPT_SEQUENCES:
+                if cls.EXCEPT_SEQUENCES_FILTER(sequence_name):
                     return
-                if f'{sequence_name}{sequence_index}' not in seqsCalled:
-                    seqsCalled.append(f'{sequence_name}{sequence_index}')
+                if (sequence_name, sequence_index) not in seqsCalled:
+                    seqsCalled.add((sequence_name, sequence_index))
                 else:
                     continue
                 method_name = f'{"OnSeq" if cls.IS_EXPOSE_PUBLIC else "onSeq"}{sequence_name}N'
                 if hasattr(_comp, method_name):
-                    method = getattr(_comp, method_name)
-                    arg_count = method.__code__.co_argcount
-                    if arg_count == 2:
-                        method(sequence_index)
-                        
+                    Invoker.Call(getattr(_comp, method_name), cls.SEQ_BLOCK_FORMS, sequence_index)
+
+    @classmethod
+    def __forwardToScopes(cls, method_name: str, changes: list[tuple[Par, Par]]) -> list[tuple[Par, Par]]:
+        """Hand the changes of scoped owners to their scopes, return the ones left for this class."""
+        by_scope = {}
+        for change in changes:
+            by_scope.setdefault(cls.__scopeOf(change[0]), []).append(change)
+        for scope, scope_changes in by_scope.items():
+            if scope is not cls:
+                getattr(scope, method_name)(scope_changes)
+        return by_scope.get(cls, [])
+
     @classmethod
     def __isParGroup(cls, _par: Par) -> bool:
         """Check if a parameter is a ParGroup. Is there no better way?"""
@@ -481,7 +896,188 @@ class CustomParHelper:
     def UpdateStubs(cls) -> None:
         """Update the stubs for the extension."""
         if cls.STUBS_ENABLED and cls.STUBSER is not None:
+            cls.ResolveAllProperties()
             # get class name from extension object
             class_name = cls.EXT_SELF.__class__.__name__
             op_ext = cls.EXT_OWNERCOMP.op(class_name)
             cls.STUBSER.StubifyDat(op_ext)
+
+    @classmethod
+    def LayoutHash(cls) -> str:
+        """Return a hash of the custom parameter layout of the owner and of the options the generated mixin depends on."""
+        layout = [(_par.name, _par.style, _par.page.name, _par.sequence.name if _par.sequence is not None else '', len(_par.parGroup))
+                  for _par in cls.EXT_OWNERCOMP.customPars]
+        return hashlib.sha1(repr((layout, cls.__mixinOptions())).encode()).hexdigest()[:16]
+
+    @classmethod
+    def __mixinOptions(cls) -> tuple:
+        """Return the options the generated mixin depends on."""
+        return (cls.IS_EXPOSE_PUBLIC, cls.ENABLE_PARGROUPS, cls.PAR_PROPS, cls.EXCEPT_PROPS, cls.EXCEPT_PAGES, cls.EXCEPT_SEQUENCES)
+
+    @classmethod
+    def GenerateMixin(cls) -> Union[DAT, None]:
+        """
+        Write the mixin module of the extension next to it: the property and callback tables, a mixin class with the
+        properties and the layout hash, which is also stored on the owner. If the extension DAT is synced to a file, a .pyi
+        stub is written next to it. Called after Init when the mixin is missing and on custom parameter layout changes.
+        """
+        if cls.EXT_SELF is None or cls.EXT_OWNERCOMP is None or not cls.EXT_OWNERCOMP.valid:
+            return None
+        class_name = cls.EXT_SELF.__class__.__name__
+        op_ext = cls.EXT_OWNERCOMP.op(class_name)
+        parent = op_ext.parent() if op_ext is not None else cls.EXT_OWNERCOMP
+        mixin_name = f'{class_name}Mixin'
+        layout_hash = cls.LayoutHash()
+        properties, callbacks = cls.__mixinTables()
+        source = '\n'.join([
+            f'# Generated by CustomParHelper.GenerateMixin() for {cls.EXT_OWNERCOMP.path}, do not edit.',
+            '# Regenerated when the custom parameter layout changes, see LAYOUT_HASH.',
+            'from __future__ import annotations',
+            '',
+            f'LAYOUT_HASH = {layout_hash!r}',
+            f'OPTIONS = {cls.__mixinOptions()!r}',
+            '',
+            '# property name -> (kind, parameter or parGroup name)',
+            'PROPERTIES = {',
+            *(f'    {name!r}: {entry!r},' for name, entry in properties.items()),
+            '}',
+            '',
+            '# parameter name -> (callback method name, sequence block index) or None if excluded',
+            'CALLBACKS = {',
+            *(f'    {name!r}: {entry!r},' for name, entry in callbacks.items()),
+            '}',
+            '',
+            cls.__mixinClassSource(mixin_name, properties),
+        ])
+        dat = parent.op(mixin_name) or parent.create(textDAT, mixin_name)
+        if dat.text != source:
+            dat.text = source
+        cls.EXT_OWNERCOMP.store(cls.MIXIN_STORAGE_KEY, layout_hash)
+        ext_file = op_ext.par.file.eval() if op_ext is not None and hasattr(op_ext.par, 'file') else ''
+        if ext_file:
+            Path(ext_file).with_name(f'{mixin_name}.pyi').write_text(cls.__mixinClassSource(mixin_name, properties, stub=True))
+        return dat
+
+    @classmethod
+    def __loadMixin(cls, check_layout: bool = False) -> None:
+        """
+        Use the generated mixin tables if the mixin matches the layout hash stored on the owner and the current options.
+        Init only compares the hashes, the parameters are hashed on layout changes (check_layout=True), where a stale mixin
+        is regenerated. A missing mixin is generated after Init, until then properties and callbacks are resolved as usual.
+        """
+        cls.MIXIN_PROPERTIES = cls.MIXIN_CALLBACKS = None
+        if not cls.USE_MIXIN or cls.EXT_SELF is None or cls.EXT_OWNERCOMP is None:
+            return
+        stored_hash = cls.EXT_OWNERCOMP.fetch(cls.MIXIN_STORAGE_KEY, None, search=False)
+        if check_layout and cls.LayoutHash() != stored_hash:
+            cls.GenerateMixin()
+            stored_hash = cls.EXT_OWNERCOMP.fetch(cls.MIXIN_STORAGE_KEY, None, search=False)
+        op_ext = cls.EXT_OWNERCOMP.op(cls.EXT_SELF.__class__.__name__)
+        parent = op_ext.parent() if op_ext is not None else cls.EXT_OWNERCOMP
+        dat = parent.op(f'{cls.EXT_SELF.__class__.__name__}Mixin')
+        module = dat.module if dat is not None else None
+        if (module is None or getattr(module, 'LAYOUT_HASH', None) != stored_hash or
+                getattr(module, 'OPTIONS', None) != cls.__mixinOptions()):
+            # creating operators while the extension initializes is left to the next frame
+            run('args[0]()', cls.GenerateMixin, delayFrames=1)
+            return
+        cls.MIXIN_PROPERTIES = module.PROPERTIES
+        cls.MIXIN_CALLBACKS = module.CALLBACKS
+
+    @classmethod
+    def __mixinTables(cls) -> tuple:
+        """Apply the include/exclude options to all custom parameters once, for the generated mixin."""
+        eval_prefix, par_prefix = ('Eval', 'Par') if cls.IS_EXPOSE_PUBLIC else ('eval', 'par')
+        properties, callbacks = {}, {}
+        for _par in cls.EXT_OWNERCOMP.customPars:
+            if cls.__includesProperty(_par):
+                properties[f'{eval_prefix}{_par.name}'] = ('eval', _par.name)
+                properties[f'{par_prefix}{_par.name}'] = ('par', _par.name)
+                if cls.ENABLE_PARGROUPS and cls.__isParGroup(_par) and _par.parGroup[0].name == _par.name:
+                    properties[f'{eval_prefix}Group{_par.parGroup.name}'] = ('evalGroup', _par.parGroup.name)
+                    properties[f'{par_prefix}Group{_par.parGroup.name}'] = ('parGroup', _par.parGroup.name)
+            match = cls.SEQUENCE_MATCH(_par.name) if _par.sequence is not None else None
+            if not match:
+                callbacks[_par.name] = (f'{"OnPar" if cls.IS_EXPOSE_PUBLIC else "onPar"}{_par.name}', None)
+                continue
+            sequence_name, sequence_index, parameter_name = match.groups()
+            if cls.EXCEPT_SEQUENCES_FILTER(sequence_name):
+                callbacks[_par.name] = None
+            else:
+                method_name = f'{"OnSeq" if cls.IS_EXPOSE_PUBLIC else "onSeq"}{sequence_name}N{parameter_name.capitalize()}'
+                callbacks[_par.name] = (method_name, int(sequence_index))
+        return properties, callbacks
+
+    @classmethod
+    def __mixinClassSource(cls, mixin_name: str, properties: dict, stub: bool = False) -> str:
+        """
+        Return the mixin class, the extension inherits its properties (reading the parameters of self.ownerComp) and
+        CustomParHelper leaves these names alone. With stub=True only the annotations are returned, for the .pyi stub.
+        """
+        lines = [f'class {mixin_name}:',
+                 f'    """Custom parameter properties of {cls.EXT_OWNERCOMP.path}, generated by CustomParHelper."""']
+        for name, (kind, target) in properties.items():
+            if kind == 'eval':
+                annotation = cls.MIXIN_EVAL_TYPES.get(getattr(cls.EXT_OWNERCOMP.par, target).style, 'object')
+            else:
+                annotation = {'par': 'Par', 'evalGroup': 'tuple', 'parGroup': 'ParGroup'}[kind]
+            if stub:
+                lines.append(f'    {name}: {annotation}')
+                continue
+            source = 'self.ownerComp.par.' if kind in ('eval', 'par') else 'self.ownerComp.parGroup.'
+            getter, setter = {
+                'eval': (f'{source}{target}.eval()', [f'{source}{target}.val = value']),
+                'par': (f'{source}{target}', [f'if {source}{target}.mode in (ParMode.BIND, ParMode.CONSTANT):',
+                                              f'    {source}{target}.val = value']),
+                'evalGroup': (f'{source}{target}.eval()', [f'for _par, val in zip({source}{target}, value):',
+                                                           '    _par.val = val']),
+                'parGroup': (f'{source}{target}', [f'for _par, val in zip({source}{target}, value):',
+                                                   '    if _par.mode in (ParMode.BIND, ParMode.CONSTANT):',
+                                                   '        _par.val = val']),
+            }[kind]
+            lines += ['',
+                      '    @property',
+                      f'    def {name}(self) -> {annotation}:',
+                      f'        return {getter}',
+                      '',
+                      f'    @{name}.setter',
+                      f'    def {name}(self, value) -> None:',
+                      *(f'        {line}' for line in setter)]
+        if not properties:
+            lines.append('    pass')
+        return '\n'.join(lines) + '\n'
+
+
+class CustomParScope:
+    """
+    Helper state of one owner component, returned by CustomParHelper.Init(..., scoped=True).
+
+    Holds the per-owner attributes of CustomParHelper in slots and shares its methods and constants, so a scope is
+    used like the class itself (eg. scope.UpdateCallbackTable(), scope.EvalCacheStats()).
+    """
+    __slots__ = ('EXT_SELF', 'EXT_OWNERCOMP', 'IS_EXPOSE_PUBLIC', 'STUBS_ENABLED', 'GENERAL_CALLBACK_ENABLE', 'ENABLE_PARGROUPS',
+                 'PAR_PROPS', 'PAR_CALLBACKS', 'EXCEPT_PAGES', 'EXCEPT_PROPS', 'EXCEPT_CALLBACKS', 'EXCEPT_SEQUENCES',
+                 'PAR_PROPS_FILTER', 'PAR_CALLBACKS_FILTER', 'EXCEPT_PROPS_FILTER', 'EXCEPT_CALLBACKS_FILTER', 'EXCEPT_PAGES_FILTER', 'EXCEPT_SEQUENCES_FILTER',
+                 'PROPERTY_CLASS', 'PROPERTIES', 'PROPERTIES_RESOLVED', 'PROPERTIES_MISSING',
+                 'EVAL_CACHE_ENABLED', 'EVAL_CACHE', 'EVAL_CACHE_HITS', 'EVAL_CACHE_MISSES',
+                 'VALUE_HANDLERS', 'PULSE_HANDLERS', 'PARS_CHANGED_HANDLER', 'USE_MIXIN', 'MIXIN_PROPERTIES', 'MIXIN_CALLBACKS')
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, getattr(CustomParHelper, name, None))
+        # mutable state of its own, the rest is set by Init
+        self.PROPERTY_CLASS = None
+        self.PROPERTIES = {} # property name -> property or _LazyProperty of this owner, see _ScopedProperty
+        self.PROPERTIES_RESOLVED = set()
+        self.PROPERTIES_MISSING = set()
+        self.EVAL_CACHE = {}
+        self.VALUE_HANDLERS = {}
+        self.PULSE_HANDLERS = {}
+
+
+# the classmethods of CustomParHelper run against a scope as their `cls`
+for _name, _attr in vars(CustomParHelper).items():
+    if isinstance(_attr, classmethod):
+        setattr(CustomParScope, _name, _attr.__func__)
+    elif isinstance(_attr, staticmethod) or (_name.isupper() and _name not in CustomParScope.__slots__):
+        setattr(CustomParScope, _name, _attr)
@@ -15,4 +15,9 @@ def onPulse(par):
 	# def On<Insert Paramname Here>(self, _par):
 	# 	...
 	package = mod(me.dock.name)
-	package.CustomParHelper.OnPulse(me.par.op.eval(), par)
\ No newline at end of file
+	package.CustomParHelper.OnPulse(me.par.op.eval(), par)
+
+def onModeChange(par, val, prev):
+	# keeps the eval cache of CustomParHelper (cache_constants=True) valid
+	package = mod(me.dock.name)
+	package.CustomParHelper.OnModeChange(me.par.op.eval(), par)
\ No newline at end of file
@@ -14,6 +14,8 @@
 def onTableChange(dat):
 	package = mod(me.dock.dock.name)
 	package.CustomParHelper.UpdateCustomParsAsProperties()
+	# parameter execs registered by page or sequence have to be matched again
+	mod('NoNode').NoNode.RefreshParExec()
 	return
 
 def onRowChange(dat, rows):
@@ -16,6 +16,9 @@ class ExtTest:
 		NoNode.RegisterChopExec(NoNode.ChopExecType.OnToOff, self.ownerComp.op('null_test_chopexec'), ['v1', 'v2'], self.onTestChopOnToOff)
 		#NoNode.RegisterChopExec(NoNode.ChopExecType.WhileOn, self.ownerComp.op('null_test_chopexec'), '*', self.onTestChopWhileOn)
 		#NoNode.RegisterChopExec(NoNode.ChopExecType.WhileOff, self.ownerComp.op('null_test_chopexec'), '*', self.onTestChopWhileOff)
+		NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChangeBatch, self.ownerComp.op('null_test_chopexec'), '*', self.onTestChopValueChangeBatch)
+		NoNode.RegisterChopExec(NoNode.ChopExecType.WhileOnBatch, self.ownerComp.op('null_test_chopexec'), '*', self.onTestChopWhileOnBatch)
+		NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, self.ownerComp.op('null_test_chopexec'), 'v2', self.onTestChopValueChange2, max_rate=5)
 		#NoNode.DisableChopExec()
 
 		# DAT Exec tests
@@ -24,6 +27,7 @@ class ExtTest:
 		NoNode.RegisterDatExec(NoNode.DatExecType.ColChange, self.ownerComp.op('null_test_datexec'), self.onTestDatExecColChange)
 		NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, self.ownerComp.op('null_test_datexec'), self.onTestDatExecCellChange)
 		NoNode.RegisterDatExec(NoNode.DatExecType.SizeChange, self.ownerComp.op('null_test_datexec'), self.onTestDatExecSizeChange)
+		NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, self.ownerComp.op('null_test_datexec'), self.onTestDatExecRegionChange, cols='*')
 		#NoNode.DisableDatExec()
 
 		# Parexec tests
@@ -38,6 +42,9 @@ class ExtTest:
 		NoNode.RegisterKeyboardShortcut('ctrl.t', self.onTestKeyboardShortcut)
 		NoNode.DisableKeyboardShortcuts()
 
+		# Profiling test
+		#NoNode.EnableProfiling()
+
 
 	# CHOP Exec callbacks
 	def onTestChopValueChange(self, _channel, _sampleIndex, _val, _prev):
@@ -58,6 +65,12 @@ class ExtTest:
 	def onTestChopWhileOff(self, _channel, _sampleIndex, _val, _prev):
 		debug(f'onTestChopWhileOff: {_channel.name} {_sampleIndex} {_val} {_prev}')
 
+	def onTestChopValueChangeBatch(self, _chop, _indices, _vals, _prevs):
+		debug(f'onTestChopValueChangeBatch: {_chop.name} {_indices} {_vals} {_prevs}')
+
+	def onTestChopWhileOnBatch(self, _indices, _vals):
+		debug(f'onTestChopWhileOnBatch: {_indices} {_vals}')
+
 
 	# DAT Exec callbacks
 	def onTestDatExecTableChange(self, _dat):
@@ -75,6 +88,9 @@ class ExtTest:
 	def onTestDatExecSizeChange(self, _dat):
 		debug(f'onTestDatExecSizeChange: {_dat}')
 
+	def onTestDatExecRegionChange(self, _diffs):
+		debug(f'onTestDatExecRegionChange: {_diffs}')
+
 
 	# Existing parameter callbacks
 	def onParFloat(self, _par, _val, _prev):
@@ -97,6 +113,9 @@ class ExtTest:
 	def onSeqTestseqNstr(self, _par, idx, _val, _prev):
 		debug(f'onSeqTestNStr: {_par} {idx} {_val} {_prev}')
 
+	def onParsChanged(self, changes):
+		debug(f'onParsChanged: {changes}')
+
 
 	# Parexec callbacks
 	def onTestParValueChange(self, _par, _val):
@@ -1,9 +1,508 @@
 import re
-import TDStoreTools
+import sys
+import time
+import weakref
+import fnmatch
+import inspect
+import operator
+import functools
+import threading
+import importlib.util
+from pathlib import Path
+from collections import deque
+import numpy as np
 from typing import Callable, Dict, Union, List
 from enum import Enum, auto
 
 
+def _ensureModule(name: str) -> None:
+    """
+    Make a helper module of NoNode importable. Components saved before it shipped as a DAT next to NoNode
+    load it from the folder NoNode is synced to, adding a text DAT of that name next to NoNode fixes them for good.
+    """
+    try:
+        __import__(name)
+        return
+    except ImportError:
+        pass
+    synced = me.par.file.eval() if hasattr(me.par, 'file') else ''
+    path = Path(synced).with_name(f'{name}.py') if synced else None
+    if path is None or not path.is_file():
+        raise ImportError(f"{name} not found, add a text DAT named '{name}' next to {me.path} with the contents of {name}.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = sys.modules[name] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+
+_ensureModule('NoNodeScheduling')
+from NoNodeScheduling import CallPolicy, FrameScheduler, Offloader, to_plain
+
+
+class Invoker:
+    '''
+    Signature-aware callback invocation, shared by NoNode and CustomParHelper.
+
+    Callbacks may omit arguments from their signature. Instead of reading `__code__.co_argcount`
+    on every event, a callback is inspected once and the arguments it accepts are cached as a plan.
+    `forms` describe the accepted argument forms of an event: `forms[n]` holds the indices into the
+    full event arguments that a callback taking `n` positional arguments receives (None if unsupported).
+    Works with bound methods, functions, `functools.partial`, callable objects, `*args` and decorated callables.
+
+    Plans are keyed weakly by the code object of the callback (or the class of a callable object), so caching
+    never keeps a callback or its owner alive and the cache shrinks when extensions are reloaded. Partials and
+    decorated callables expose a signature their code does not have, so their plans are keyed by the object itself.
+    '''
+    PLANS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary() # code object, class or callable -> {(forms, signature): plan}
+
+    @classmethod
+    def Plan(cls, callback: Callable, forms: tuple) -> Union[tuple, None]:
+        """Return the argument indices a callback receives for the given forms, inspecting it only once."""
+        owner, signature = cls.__planKey(callback)
+        if owner is None:
+            return cls.__resolvePlan(callback, forms)
+        try:
+            plans = cls.PLANS[owner]
+        except KeyError:
+            plans = cls.PLANS[owner] = {}
+        except TypeError: # not weak referenceable
+            return cls.__resolvePlan(callback, forms)
+        key = (forms, signature)
+        try:
+            return plans[key]
+        except KeyError:
+            plan = plans[key] = cls.__resolvePlan(callback, forms)
+            return plan
+
+    @staticmethod
+    def __planKey(callback: Callable) -> tuple:
+        """Return the object a plan is cached under and what distinguishes signatures sharing it, (None, None) if uncacheable."""
+        func = getattr(callback, '__func__', callback) # bound methods are created anew on every attribute access
+        bound = func is not callback # binding consumes the first argument
+        if hasattr(func, '__wrapped__') or isinstance(func, functools.partial):
+            return func, (bound,)
+        code = getattr(func, '__code__', None)
+        if code is not None:
+            # functions sharing code can still differ in defaults
+            return code, (bound, len(getattr(func, '__defaults__', None) or ()))
+        if inspect.isroutine(callback):
+            return None, None # builtins
+        return type(callback), None # callable objects share the signature of their class' __call__
+
+    @classmethod
+    def Adapt(cls, callback: Callable, forms: tuple) -> Callable:
+        """Return a ready-made adapter that takes the full event arguments and calls the callback with what it accepts."""
+        plan = cls.Plan(callback, forms)
+        if plan is None:
+            return lambda *args: None
+        if not plan:
+            return lambda *args: callback()
+        if plan == tuple(range(len(plan))):
+            count = len(plan)
+            return lambda *args: callback(*args[:count])
+        if len(plan) == 1:
+            index = plan[0]
+            return lambda *args: callback(args[index])
+        pick = operator.itemgetter(*plan)
+        return lambda *args: callback(*pick(args))
+
+    @classmethod
+    def Call(cls, callback: Callable, forms: tuple, *args):
+        """Call a callback with the arguments it accepts, using the cached plan."""
+        plan = cls.Plan(callback, forms)
+        if plan is not None:
+            return callback(*[args[i] for i in plan])
+
+    @classmethod
+    def __resolvePlan(cls, callback: Callable, forms: tuple) -> Union[tuple, None]:
+        try:
+            params = list(inspect.signature(callback).parameters.values())
+        except (TypeError, ValueError): # builtins without a signature get the full form
+            return forms[-1]
+        positional = [p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+        required = sum(p.default is p.empty for p in positional)
+        most = len(forms) - 1
+        if not any(p.kind is p.VAR_POSITIONAL for p in params):
+            most = min(most, len(positional))
+        # prefer the richest form the callback can take
+        for arity in range(most, required - 1, -1):
+            if forms[arity] is not None:
+                return forms[arity]
+        return None
+
+
+def _runScheduler(callback: Callable, frames: int = 0, ms: float = 0.0) -> None:
+    """Defer a call of the NoNodeScheduling helpers with run(), to the end of the current frame without a delay."""
+    run('args[0]()', callback, delayFrames=frames, delayMilliSeconds=ms, endFrame=not (frames or ms))
+
+
+class _ScheduledCallback:
+    '''Registry entry wrapper deferring calls to a FrameScheduler with a priority.'''
+    __slots__ = ('callback', 'priority', 'scheduler')
+
+    def __init__(self, callback: Callable, priority: int, scheduler: Callable) -> None:
+        self.callback = callback
+        self.priority = priority
+        self.scheduler = scheduler
+
+    @property
+    def alive(self) -> bool:
+        return getattr(self.callback, 'alive', True)
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, 'name', type(self).__name__)
+
+    def __call__(self, *args) -> None:
+        self.scheduler().Submit(self.callback, args, self.priority)
+
+
+class _OffloadedCallback:
+    '''
+    Wraps a _WeakCallback registry entry to run its calls in an Offloader, a newer call of the same key supersedes the running one.
+
+    The callback is resolved and its arguments are turned into plain values (see to_plain) on the main thread,
+    the worker never sees a TouchDesigner object or a dead registry entry.
+    '''
+    __slots__ = ('callback', 'onResult', 'key', 'offloader')
+
+    def __init__(self, callback: Callable, on_result: Callable, key: Callable, offloader: Callable) -> None:
+        self.callback = callback
+        self.onResult = on_result
+        self.key = key
+        self.offloader = offloader
+
+    @property
+    def alive(self) -> bool:
+        return getattr(self.callback, 'alive', True)
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, 'name', type(self).__name__)
+
+    def __call__(self, *args) -> None:
+        profiled = self.callback if isinstance(self.callback, _ProfiledCallback) else None
+        weak = profiled.callback if profiled is not None else self.callback
+        target = weak.Resolve()
+        if target is None:
+            return # reported dead, the entry is swept at the end of the frame
+        job = functools.partial(weak.Call, target)
+        if profiled is not None:
+            job = _ProfiledCallback(job, profiled.stats) # timed in the worker
+        key = (self, self.key(args) if self.key else None)
+        self.offloader().Submit(job, (to_plain(args),), key=key, on_result=self.onResult)
+
+
+class _WeakCallback:
+    '''
+    Registry entry for a NoNode callback, called with the full event arguments.
+
+    Bound methods are held through `weakref.WeakMethod`, so a registration doesn't keep a reinitialized
+    extension alive. Once the method is gone the entry turns into a no-op and reports itself through `on_dead`,
+    which must only schedule the cleanup (NoNode runs Sweep at the end of the frame).
+    '''
+    __slots__ = ('ref', 'plan', 'name', 'method', 'extension', 'options', 'alive', 'onDead')
+
+    def __init__(self, callback: Callable, forms: tuple, on_dead: Callable = None) -> None:
+        self.plan = Invoker.Plan(callback, forms)
+        self.name = getattr(callback, '__qualname__', type(callback).__name__)
+        self.method = self.extension = None # method and class name, for NoNode.Snapshot
+        self.options: dict = {} # registration options, for NoNode.Snapshot
+        if inspect.ismethod(callback):
+            self.ref = weakref.WeakMethod(callback)
+            self.method = callback.__func__.__name__
+            self.extension = type(callback.__self__).__qualname__
+        else:
+            self.ref = lambda: callback
+        self.alive = True
+        self.onDead = on_dead
+
+    def __call__(self, *args):
+        callback = self.Resolve()
+        if callback is not None:
+            return self.Call(callback, args)
+
+    def Resolve(self) -> Union[Callable, None]:
+        """Return the callback, or None once it is gone, reporting the entry dead the first time."""
+        callback = self.ref()
+        if callback is None and self.alive:
+            self.alive = False
+            if self.onDead is not None:
+                self.onDead()
+        return callback
+
+    def Call(self, callback: Callable, args: tuple):
+        """Call a resolved callback with the event arguments it accepts."""
+        if self.plan is not None:
+            return callback(*[args[i] for i in self.plan])
+
+
+class _CallStats:
+    '''Call count and total duration of a callback, plus its latest durations in a fixed-size ring buffer.'''
+    __slots__ = ('count', 'total', 'samples')
+
+    def __init__(self, window: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=window)
+
+    def Reset(self, window: int = None) -> None:
+        """Drop all collected durations, optionally resizing the ring buffer."""
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=window or self.samples.maxlen)
+
+    def Add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.samples.append(duration)
+
+    def Summary(self) -> dict:
+        """Count, total and mean duration, and the p95 duration of the ring buffer, in milliseconds."""
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000.0,
+            'mean_ms': self.total * 1000.0 / self.count if self.count else 0.0,
+            'p95_ms': float(np.percentile(self.samples, 95)) * 1000.0 if self.samples else 0.0,
+        }
+
+
+class _ProfiledCallback:
+    '''
+    Registry entry wrapper timing every call, only installed while NoNode profiling is enabled.
+
+    It wraps the callback itself, inside any rate limiting, deferral or offloading, so the stats hold the duration
+    of the callback and not of its submission. Offloaded callbacks are timed in their worker thread, `on_call` only
+    runs on the main thread.
+    '''
+    __slots__ = ('callback', 'stats', 'onCall')
+
+    def __init__(self, callback: Callable, stats: _CallStats, on_call: Callable = None) -> None:
+        self.callback = callback
+        self.stats = stats
+        self.onCall = on_call
+
+    @property
+    def alive(self) -> bool:
+        return getattr(self.callback, 'alive', True)
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, 'name', type(self).__name__)
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.callback(*args)
+        finally:
+            self.stats.Add(time.perf_counter() - start)
+            if self.onCall is not None and threading.current_thread() is threading.main_thread():
+                self.onCall()
+
+
+class _ChannelIndex:
+    '''
+    Precompiled channel lookup for one CHOP and event type.
+
+    Exact channel names go into a dict, the patterns of a callback using wildcards or `^` exclusions are compiled
+    once into a NameFilter, and the callbacks a channel name resolves to are cached, so dispatch is a dict lookup.
+    '''
+    __slots__ = ('exact', 'wildcards', 'resolved', 'adapters')
+
+    def __init__(self, patterns: Dict[str, Callable], forms: tuple) -> None:
+        self.exact: Dict[str, List[Callable]] = {}
+        self.wildcards: List[tuple] = []
+        self.resolved: Dict[str, tuple] = {}
+        self.adapters: Dict[Callable, Callable] = {}
+        by_callback: Dict[Callable, List[str]] = {}
+        for pattern, callback in patterns.items():
+            by_callback.setdefault(callback, []).append(pattern)
+        for callback, callback_patterns in by_callback.items():
+            self.adapters[callback] = Invoker.Adapt(callback, forms)
+            if any(NameFilter.IsPattern(pattern) for pattern in callback_patterns):
+                # exclusions apply to the patterns registered before them for the same callback
+                self.wildcards.append((NameFilter(callback_patterns), callback))
+            else:
+                for pattern in callback_patterns:
+                    self.exact.setdefault(pattern, []).append(callback)
+
+    def Resolve(self, name: str) -> tuple:
+        """Return the adapted callbacks registered for a channel name, resolving it only once."""
+        callbacks = self.resolved.get(name)
+        if callbacks is None:
+            # dict keeps order and avoids executing the same callback twice for a channel
+            matched = dict.fromkeys(self.exact.get(name, ()))
+            for name_filter, callback in self.wildcards:
+                if name_filter(name):
+                    matched[callback] = None
+            callbacks = self.resolved[name] = tuple(self.adapters[callback] for callback in matched)
+        return callbacks
+
+
+class NameFilter:
+    '''
+    Match names like tdu.match, shared by NoNode and CustomParHelper.
+
+    `*`, `?` and `[]` are wildcards and a pattern starting with `^` excludes the names it matches from the patterns
+    before it (eg. 'Color* ^Colora'). A string is split at whitespace and commas, list items are single patterns, so
+    names containing spaces (eg. the 'Version Ctrl' page) can be listed. Compiled once: without exclusions exact names
+    go into a frozenset, everything else into a single regex. Results are cached per name.
+    '''
+    __slots__ = ('exact', 'wildcard', 'resolved')
+
+    def __init__(self, patterns: Union[str, List[str]]) -> None:
+        if isinstance(patterns, str):
+            patterns = re.split(r'[,\s]+', patterns.strip())
+        patterns = [pattern for pattern in patterns if pattern]
+        if any(pattern.startswith('^') for pattern in patterns):
+            self.exact = frozenset()
+        else:
+            self.exact = frozenset(pattern for pattern in patterns if not self.IsPattern(pattern))
+        alternatives = []
+        for i, pattern in enumerate(patterns):
+            if pattern.startswith('^') or pattern in self.exact:
+                continue
+            # a name matching this pattern counts unless an exclusion after it matches too
+            exclusions = [fnmatch.translate(later[1:]) for later in patterns[i + 1:] if later.startswith('^')]
+            guard = f'(?!{"|".join(exclusions)})' if exclusions else ''
+            alternatives.append(guard + fnmatch.translate(pattern))
+        self.wildcard = re.compile('|'.join(alternatives)).match if alternatives else None
+        self.resolved: Dict[str, bool] = {}
+
+    @staticmethod
+    def IsPattern(pattern: str) -> bool:
+        """Return whether a pattern has wildcards or is an exclusion, rather than being an exact name."""
+        return pattern.startswith('^') or any(c in pattern for c in '*?[')
+
+    def __call__(self, name: str) -> bool:
+        matched = self.resolved.get(name)
+        if matched is None:
+            matched = self.resolved[name] = name in self.exact or (self.wildcard is not None and self.wildcard(name) is not None)
+        return matched
+
+
+class _DatRegion:
+    '''
+    A filtered DAT subscription, watching rows by key (first column), columns by name (first row) and/or single cells.
+
+    A cell is watched if it lies in the rows and columns given (either one alone selects whole rows or columns),
+    or matches one of the (row, col) cell patterns.
+    '''
+    __slots__ = ('rows', 'cols', 'cells', 'callback', 'filters', 'key', 'watched')
+
+    def __init__(self, callback: Callable, rows: Union[str, List[str]] = None, cols: Union[str, List[str]] = None,
+                 cells: List[tuple] = None) -> None:
+        self.callback = callback
+        self.filters = {'rows': rows, 'cols': cols, 'cells': [list(cell) for cell in cells] if cells else None}
+        self.key = self.FilterKey(rows, cols, cells)
+        self.rows = NameFilter(rows) if rows else None
+        self.cols = NameFilter(cols) if cols else None
+        self.cells = [(NameFilter([row]), NameFilter([col])) for row, col in cells or ()]
+        self.watched: Dict[tuple, bool] = {}
+
+    def Watches(self, row: str, col: str) -> bool:
+        """Return whether the cell at row key and column name is in the region."""
+        watched = self.watched.get((row, col))
+        if watched is None:
+            in_area = (self.rows is not None or self.cols is not None) and \
+                      (self.rows is None or self.rows(row)) and (self.cols is None or self.cols(col))
+            watched = self.watched[(row, col)] = in_area or any(
+                row_filter(row) and col_filter(col) for row_filter, col_filter in self.cells)
+        return watched
+
+    @staticmethod
+    def FilterKey(rows: Union[str, List[str]] = None, cols: Union[str, List[str]] = None, cells: List[tuple] = None) -> tuple:
+        """Return a comparable form of the filters, equal for the same region however the patterns were written."""
+        def patterns(names):
+            if isinstance(names, str):
+                names = re.split(r'[,\s]+', names.strip())
+            return tuple(sorted(set(names or ())))
+        return patterns(rows), patterns(cols), tuple(sorted({tuple(cell) for cell in cells or ()}))
+
+
+class _ChopBatchWatcher:
+    '''
+    Frame-batched evaluation of one CHOP for the batched ChopExecTypes.
+
+    The CHOP is read once per frame with `numpyArray()` (last sample of every channel), compared
+    against the values of the previous frame, and every subscribed callback is called once with
+    numpy arrays of the affected channel indices, their current and their previous values.
+    Selections are resolved again whenever the channel names of the CHOP change, including renames and reorders.
+    '''
+    __slots__ = ('chop', 'prev', 'names', 'indexes', 'subscriptions')
+
+    def __init__(self, chop: CHOP) -> None:
+        self.chop = chop
+        self.prev = None
+        self.names: Union[tuple, None] = None
+        self.indexes: Dict[object, _ChannelIndex] = {}
+        self.subscriptions: Dict[object, list] = {}
+
+    def SetIndex(self, event_type, index: _ChannelIndex = None) -> None:
+        """Set or remove the channel index of an event type, selections are resolved on the next tick."""
+        if index is None:
+            self.indexes.pop(event_type, None)
+        else:
+            self.indexes[event_type] = index
+        self.names = None
+
+    def __resolveSubscriptions(self, names: tuple) -> None:
+        # group channel indices per callback, None selects all channels without fancy indexing
+        self.subscriptions = {}
+        for event_type, index in self.indexes.items():
+            selections: Dict[Callable, list] = {}
+            for i, name in enumerate(names):
+                for callback in index.Resolve(name):
+                    selections.setdefault(callback, []).append(i)
+            self.subscriptions[event_type] = [
+                (None if len(selection) == len(names) else np.array(selection, dtype=np.intp), callback)
+                for callback, selection in selections.items()
+            ]
+        self.names = names
+
+    def Tick(self, threshold: float) -> None:
+        """Evaluate the CHOP for this frame and call the subscribed callbacks."""
+        chop = self.chop
+        names = tuple(chan.name for chan in chop.chans())
+        if names != self.names:
+            self.__resolveSubscriptions(names)
+            self.prev = None
+        if not names or not chop.numSamples:
+            return
+        vals = chop.numpyArray()[:, -1]
+        prev = self.prev if self.prev is not None else vals
+        self.prev = vals
+
+        masks = {}
+        for event_type, subscriptions in self.subscriptions.items():
+            if not subscriptions:
+                continue
+            mask = masks.get(event_type)
+            if mask is None:
+                mask = masks[event_type] = self.__mask(event_type, vals, prev, threshold)
+            for selection, callback in subscriptions:
+                if selection is None:
+                    indices = np.flatnonzero(mask)
+                else:
+                    indices = selection[mask[selection]]
+                if indices.size:
+                    callback(chop, indices, vals[indices], prev[indices])
+
+    @staticmethod
+    def __mask(event_type, vals, prev, threshold: float):
+        name = event_type.name
+        if name == 'ValueChangeBatch':
+            return vals != prev
+        is_on = vals > threshold
+        if name == 'WhileOnBatch':
+            return is_on
+        if name == 'WhileOffBatch':
+            return ~is_on
+        was_on = prev > threshold
+        if name == 'OffToOnBatch':
+            return is_on & ~was_on
+        return was_on & ~is_on # OnToOffBatch
+
+
 class NoNode:
     '''
     ## NoNode
@@ -30,6 +529,18 @@ class NoNode:
     ```python
     NoNode.Init(enable_chopexec=True, enable_datexec=True, enable_parexec=True, enable_keyboard_shortcuts=True)
     ```
+    To make extension reloads faster and avoid exec DATs turning off and on, restore the previous registrations in one step:
+    ```python
+    if not NoNode.Init(ownerComp, extension_self=self, restore=True): # or restore=<dict from NoNode.Snapshot()>
+        NoNode.RegisterChopExec(...) # only needed on the first run
+    ```
+    When many components (eg. replicas) share the same ExtUtils, give each owner its own scope instead of calling Init.
+    A scope has the same Register/Deregister methods on tables of its own, dispatch walks all scopes, so reinitializing
+    one owner (or calling Init) only drops its own registrations:
+    ```python
+    self.NoNode = NoNode.Scope(ownerComp)
+    self.NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop_op, channel_name(s), self.on_value_change_function)
+    ```
 
     4. CHOP executions:
     - Register a callback for CHOP value changes:
@@ -44,6 +555,35 @@ class NoNode:
         # callback signature: def on_activate_function(self, channel: Channel, sampleIndex: int, val: float, prev: float):
         # can omit parameters from the right side of the signature if not needed
         ```
+    - Handle wide CHOPs in one call per frame with numpy arrays (ValueChangeBatch, OffToOnBatch, OnToOffBatch, WhileOnBatch, WhileOffBatch):
+        ```python
+        NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChangeBatch, chop_op, channel_name(s), self.on_batch_function)
+        # callback signature: def on_batch_function(self, chop: CHOP, indices: np.ndarray, vals: np.ndarray, prevs: np.ndarray):
+        # can omit parameters from the left side of the signature if not needed, eg. def on_batch_function(self, indices, vals):
+        ```
+
+    - Limit how often expensive callbacks run (also for RegisterDatExec and RegisterParExec):
+        ```python
+        NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop_op, channel_name(s), self.on_value_change_function, max_rate=10) # at most 10 Hz
+        # debounce=<ms> or debounce_frames=<n> waits for the events to settle, coalesce=True calls once at the end of the frame
+        # only the latest value per channel is delivered
+        ```
+    - Keep heavy handlers from causing frame drops with priorities and a frame budget (also for RegisterDatExec and RegisterParExec):
+        ```python
+        NoNode.SetFrameBudget(4) # ms per frame for callbacks registered with a priority, default no limit
+        NoNode.RegisterChopExec(NoNode.ChopExecType.OffToOn, chop_op, channel_name(s), self.on_cue_function, priority=10)
+        NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop_op, channel_name(s), self.on_ui_function, priority=-10)
+        # prioritized callbacks run at the end of the frame, highest priority first, the rest carries over to the next frame
+        ```
+    - Run slow handlers (file parsing, hashing, subprocesses) in a thread pool (also for RegisterDatExec and RegisterParExec):
+        ```python
+        NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, dat_op, self.parse_function, offload=self.apply_function)
+        # parse_function runs in a worker thread and gets plain values instead of TouchDesigner objects: the DAT as a list
+        # of rows of strings, channels and parameters as (owner path, name, ...) and cells as (row, col, val) tuples, see to_plain
+        # def parse_function(self, rows: list[list[str]]): return {row[0]: float(row[1]) for row in rows[1:]}
+        # its return value is passed to apply_function on the main thread at the end of the frame, exceptions are re-raised there
+        # a newer event supersedes a still running call, offload=True discards the return value
+        ```
 
     5. DAT executions:
     - React to table changes in a DAT:
@@ -56,6 +596,14 @@ class NoNode:
         NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_cell_change_function)
         # callback signature depends on the event type, eg.: def on_cell_change_function(self, dat: DAT, cells: list[Cell], prev: Cell):
         ```
+    - Watch only a region of a table, by row keys (first column), column names (first row) and/or single cells:
+        ```python
+        NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_region_change_function, rows='speed gain*', cols='value')
+        NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_region_change_function, cells=[('speed', 'value'), ('*', 'enabled')])
+        # callback signature: def on_region_change_function(self, dat: DAT, diffs: list[tuple]): with (row, col, old, new) diffs of the watched cells
+        # called only when the watched region changes, any number of callbacks can watch the same DAT
+        # filters are CellChange only, registering the same callback and filters again replaces the subscription
+        ```
 
     6. Parameter executions:
     - Register a callback for parameter value changes:
@@ -64,6 +612,12 @@ class NoNode:
         # callback signature depends on the event type, eg.: def on_value_change_function(self, par: Par, val: float, prev: float):
         # can omit prev, or use val only
         ```
+    - Watch many parameters with one registration, by name patterns, pages or sequences, on one or more operators:
+        ```python
+        NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, [par_op1, par_op2], 'Color* Speed', self.on_value_change_function)
+        NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, par_op, [par_op.customPages[0], par_op.seq.Points], self.on_value_change_function)
+        # parameters are resolved by name on their first event and matched again after moving between pages or sequences
+        ```
     - Handle pulse parameters:
         ```python
         NoNode.RegisterParExec(NoNode.ParExecType.OnPulse, par_op, par_name, self.on_pulse_function)
@@ -86,6 +640,8 @@ class NoNode:
     - Deregister a DAT execution:
         ```python
         NoNode.DeregisterDatExec(NoNode.DatExecType.TableChange, dat_op)
+        # a single callback or region, keeping the other subscriptions of the DAT
+        NoNode.DeregisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_region_change_function, rows='speed gain*', cols='value')
         ```
     - Deregister a parameter execution:
         ```python
@@ -95,6 +651,16 @@ class NoNode:
         ```python
         NoNode.DeregisterKeyboardShortcut('ctrl.k')
         ```
+    - Callbacks are held weakly (bound methods via weakref.WeakMethod), registrations of deleted operators and of
+        reinitialized extensions are dropped automatically. To drop them right away:
+        ```python
+        NoNode.Sweep()
+        ```
+    - Registrations are plain dicts; NoNode.REGISTRY_VERSION is a tdu.Dependency bumped once at the end of every frame
+        in which registrations changed, so expressions or UIs listing them can depend on it:
+        ```python
+        NoNode.REGISTRY_VERSION.val # an expression reading this re-evaluates when registrations change
+        ```
 
     8. Visual indication:
     - Operators with registered callbacks are marked with a color for easy identification
@@ -103,6 +669,14 @@ class NoNode:
         NoNode.SetMarkColor((r, g, b))
         ```
 
+    9. Profiling:
+    - Find the callbacks eating the frame budget (costs nothing while disabled):
+        ```python
+        NoNode.EnableProfiling(dat=op('table_stats')) # dat is optional
+        NoNode.Stats() # {'ChopExec.ValueChange MyExt.on_value_change_function': {'count', 'total_ms', 'mean_ms', 'p95_ms'}, ...}
+        NoNode.DisableProfiling()
+        ```
+
     '''
 
     class ChopExecType(Enum):
@@ -111,6 +685,12 @@ class NoNode:
         OnToOff = auto()
         WhileOff = auto()
         ValueChange = auto()
+        # frame-batched, called once per frame per CHOP with numpy arrays, see RegisterChopExec
+        ValueChangeBatch = auto()
+        OffToOnBatch = auto()
+        OnToOffBatch = auto()
+        WhileOnBatch = auto()
+        WhileOffBatch = auto()
 
     class DatExecType(Enum):
         TableChange = auto()
@@ -123,6 +703,27 @@ class NoNode:
         ValueChange = auto()
         OnPulse = auto()
 
+    # argument forms per number of accepted arguments, see Invoker
+    # chop: (channel, sampleIndex, val, prev)
+    CHOP_FORMS: tuple = ((), (2,), (0, 2), (0, 1, 2), (0, 1, 2, 3))
+    # chop batch: (chop, indices, vals, prevs)
+    CHOP_BATCH_FORMS: tuple = ((), (1,), (1, 2), (1, 2, 3), (0, 1, 2, 3))
+    # dat: (dat, rows, cols, cells, prev)
+    DAT_FORMS: Dict[DatExecType, tuple] = {
+        DatExecType.TableChange: ((), (0,)),
+        DatExecType.RowChange: ((), (0,), (0, 1)),
+        DatExecType.ColChange: ((), (0,), (0, 2)),
+        DatExecType.CellChange: ((), (0,), (0, 3), (0, 3, 4)),
+        DatExecType.SizeChange: ((), (0,))
+    }
+    # dat region: (dat, diffs)
+    DAT_REGION_FORMS: tuple = ((), (1,), (0, 1))
+    # par: (par, val, prev)
+    PAR_FORMS: Dict[ParExecType, tuple] = {
+        ParExecType.ValueChange: ((), (1,), (0, 1), (0, 1, 2)),
+        ParExecType.OnPulse: ((), (0,), (0, 1), (0, 1, 2))
+    }
+
     MARK_COLOR = (0.5, 0.05, 0.5)
 
     CHOP_VALUECHANGE_EXEC: DAT = op('extChopValueChangeExec')
@@ -158,9 +759,20 @@ class NoNode:
         DatExecType.SizeChange: DAT_SIZECHANGE_EXEC
     }
 
-    CHOPEXEC_CALLBACKS: TDStoreTools.DependDict[ChopExecType, dict[CHOP, dict[str, Callable]]] = TDStoreTools.DependDict()
-    DATEXEC_CALLBACKS: TDStoreTools.DependDict[DatExecType, dict[DAT, Callable]] = TDStoreTools.DependDict()
-    KEYBOARD_CALLBACKS: TDStoreTools.DependDict[str, Callable] = TDStoreTools.DependDict()
+    CHOPEXEC_CALLBACKS: Dict[ChopExecType, Dict[CHOP, Dict[str, Callable]]] = {}
+    CHOPEXEC_INDEX: Dict[ChopExecType, Dict[CHOP, _ChannelIndex]] = {}
+    CHOPEXEC_DIRTY: set[tuple] = set() # (event_type, chop) whose index is rebuilt before the next dispatch
+    CHOP_BATCH_TYPES: set[ChopExecType] = {ChopExecType.ValueChangeBatch, ChopExecType.OffToOnBatch, ChopExecType.OnToOffBatch,
+                                           ChopExecType.WhileOnBatch, ChopExecType.WhileOffBatch}
+    CHOP_BATCH_WATCHERS: Dict[CHOP, _ChopBatchWatcher] = {}
+    CHOP_BATCH_THRESHOLD: float = 0.0 # channels above this value are considered on
+    FRAME_PUMP_SCHEDULED: bool = False
+    SWEEP_SCHEDULED: bool = False
+    REGISTRY_VERSION: tdu.Dependency = tdu.Dependency(0) # bumped once per frame in which registrations changed
+    REGISTRY_CHANGE_SCHEDULED: bool = False
+    DATEXEC_CALLBACKS: Dict[DatExecType, Dict[DAT, Callable]] = {}
+    DATEXEC_REGIONS: Dict[DAT, List[_DatRegion]] = {} # filtered cell change subscriptions
+    KEYBOARD_CALLBACKS: Dict[str, Callable] = {}
     CHOPEXEC_IS_ENABLED: bool = False
     DATEXEC_IS_ENABLED: bool = False
     KEYBOARD_IS_ENABLED: bool = False
@@ -176,33 +788,93 @@ class NoNode:
         ParExecType.OnPulse: PAR_ONPULSE_EXEC
     }
 
-    PAREXEC_CALLBACKS: TDStoreTools.DependDict[ParExecType, dict[OP, dict[Union[Par, str], Callable]]] = TDStoreTools.DependDict()
+    PAREXEC_CALLBACKS: Dict[ParExecType, Dict[OP, Dict[Union[str, tuple], Callable]]] = {}
+    PAREXEC_TABLE: Dict[ParExecType, Dict[tuple, tuple]] = {} # (owner, parName) -> callbacks, resolved on first event
+    PAREXEC_LAYOUT: Dict[ParExecType, Dict[tuple, tuple]] = {} # (owner, parName) -> (page, sequence) names, of entries resolved through page or sequence selectors
     PAREXEC_IS_ENABLED: bool = False
 
     # Update ALL_EXECS to include PAR_EXECS
     ALL_EXECS: list[DAT] = CHOP_EXECS + DAT_EXECS + PAR_EXECS + [KEYBOARD_EXEC]
     EXT_OWNER_COMP: COMP = None
+    SCOPES: Dict[COMP, 'NoNodeScope'] = {} # per owner component registrations, see Scope
+    REGISTRIES: tuple = () # NoNode itself (the global tables) followed by the scopes, walked by dispatch
+    WATCHED_OPS: Dict[OP, int] = {} # registration entries per operator, marked while > 0
+
+    SCHEDULER: FrameScheduler = FrameScheduler(_runScheduler) # deferred callbacks registered with a priority
+    OFFLOADER: Offloader = Offloader(_runScheduler) # thread pool for callbacks registered with offload
+
+    PROFILE_IS_ENABLED: bool = False
+    PROFILE_WINDOW: int = 256 # durations kept per callback for the p95
+    PROFILE_STATS: Dict[str, _CallStats] = {}
+    PROFILE_DAT: DAT = None
+    PROFILE_DAT_SCHEDULED: bool = False
 
     @classmethod
     def Init(cls, ownerComp, enable_chopexec: bool = True, enable_datexec: bool = True, enable_parexec: bool = True, 
-             enable_keyboard_shortcuts: bool = True) -> None:
-        """Initialize the NoNode functionality."""
+             enable_keyboard_shortcuts: bool = True, extension_self = None, restore: Union[bool, dict] = False) -> bool:
+        """
+        Initialize the NoNode functionality.
+
+        With extension_self and restore=True the registrations of the previous instance of the extension are restored
+        from the registry (or from a dict returned by Snapshot), keeping exec DATs that stay in use active.
+        Only the global tables are reset and restored, the registrations of scopes (see Scope) are left alone.
+        Returns True if registrations were restored, so the Register calls can be skipped:
+            if not NoNode.Init(ownerComp, extension_self=self, restore=True):
+                NoNode.RegisterChopExec(...)
+        """
+        snapshot = None
+        if restore and extension_self is not None:
+            snapshot = restore if isinstance(restore, dict) else cls.Snapshot()
+        previously_watched = list(cls.WATCHED_OPS)
+
         cls.EXT_OWNER_COMP = ownerComp
+        cls.__pruneScopes()
         cls.CHOPEXEC_IS_ENABLED = enable_chopexec
         cls.DATEXEC_IS_ENABLED = enable_datexec
         cls.KEYBOARD_IS_ENABLED = enable_keyboard_shortcuts
-        cls.CHOPEXEC_CALLBACKS = TDStoreTools.DependDict()
-        cls.DATEXEC_CALLBACKS = TDStoreTools.DependDict()
-        cls.KEYBOARD_CALLBACKS = TDStoreTools.DependDict()
+        cls.CHOPEXEC_CALLBACKS = {}
+        cls.CHOPEXEC_INDEX = {}
+        cls.CHOPEXEC_DIRTY = set()
+        cls.CHOP_BATCH_WATCHERS = {}
+        cls.DATEXEC_CALLBACKS = {}
+        cls.DATEXEC_REGIONS = {}
+        cls.KEYBOARD_CALLBACKS = {}
         cls.PAREXEC_IS_ENABLED = enable_parexec
-        cls.PAREXEC_CALLBACKS = TDStoreTools.DependDict()
+        cls.PAREXEC_CALLBACKS = {}
+        cls.PAREXEC_TABLE = {}
+        cls.PAREXEC_LAYOUT = {}
+        cls.SWEEP_SCHEDULED = False
+        cls.REGISTRY_CHANGE_SCHEDULED = False
+        if not cls.SCOPES:
+            # jobs and deferred calls of scopes keep running
+            cls.OFFLOADER.Shutdown()
+            cls.OFFLOADER = Offloader(_runScheduler, cls.OFFLOADER.maxWorkers)
+            cls.SCHEDULER = FrameScheduler(_runScheduler, budget_ms=cls.SCHEDULER.budget * 1000.0 if cls.SCHEDULER.budget else None)
+        if cls.PROFILE_IS_ENABLED:
+            cls.DisableProfiling()
+        cls.PROFILE_DAT = None
         
         #cls.__setOwnerCompToDocked(ownerComp)
 
-        # Disable all execute operators by default
+        restored = cls.__restore(snapshot, extension_self) if snapshot else 0
+        cls.__recountWatched()
+
+        # Activate the execute operators used by restored registrations and scopes only, the keyboard one is set below
+        in_use = set()
+        for reg in cls.REGISTRIES:
+            in_use |= {cls.CHOP_EXEC_MAP.get(event_type) for event_type in reg.CHOPEXEC_CALLBACKS} | \
+                      {cls.DAT_EXEC_MAP.get(event_type) for event_type in reg.DATEXEC_CALLBACKS} | \
+                      {cls.PAR_EXEC_MAP.get(event_type) for event_type in reg.PAREXEC_CALLBACKS}
+            if reg.DATEXEC_REGIONS:
+                in_use.add(cls.DAT_EXEC_MAP[cls.DatExecType.CellChange])
         for exec in cls.ALL_EXECS:
-            if exec is not None:
-                exec.par.active = False
+            if exec is not None and exec is not cls.KEYBOARD_EXEC:
+                exec.par.active = exec in in_use
+
+        # operators of the previous registrations that are not watched anymore
+        for _op in previously_watched:
+            if _op not in cls.WATCHED_OPS and _op.valid:
+                cls.__resetOperatorColor(_op)
 
         if enable_chopexec:
             cls.EnableChopExec()
@@ -224,6 +896,8 @@ class NoNode:
         else:
             cls.DisableParExec()
 
+        return bool(restored)
+
     @classmethod
     def __setOwnerCompToDocked(cls, ownerComp: COMP) -> None:
         for _op in me.docked:
@@ -265,7 +939,9 @@ class NoNode:
             cls.DAT_EXEC_MAP[event_type].par.active = False
 
     @classmethod
-    def RegisterChopExec(cls, event_type: ChopExecType, chop: CHOP, channels: Union[str, List[str]], callback: Callable) -> None:
+    def RegisterChopExec(cls, event_type: ChopExecType, chop: CHOP, channels: Union[str, List[str]], callback: Callable,
+                         max_rate: float = None, debounce: float = None, debounce_frames: int = None, coalesce: bool = False,
+                         priority: int = None, offload: Union[bool, Callable] = False, scope: 'NoNodeScope' = None) -> None:
         """
         Register a CHOP execute callback.
 
@@ -274,6 +950,17 @@ class NoNode:
             chop (CHOP): The CHOP operator to register the callback for.
             channels (Union[str, List[str]]): The channel(s) to listen to. Can be a whitespace and/or comma separated string, or a list. Use '*' for all channels.
             callback (Callable): The callback function to be called on CHOP execution.
+            max_rate (float, optional): Call the callback at most this many times per second (Hz).
+            debounce (float, optional): Call the callback only after no new events arrived for this many milliseconds.
+            debounce_frames (int, optional): Call the callback only after no new events arrived for this many frames.
+            coalesce (bool, optional): Collect the events of a frame and call the callback once at the end of the frame.
+            With any of these only the latest value per channel is delivered, see CallPolicy.
+            priority (int, optional): Defer the callback to the end of the frame, higher priorities run first. Calls left when
+            the frame budget (SetFrameBudget) is used up carry over to the next frame, see FrameScheduler.
+            offload (Union[bool, Callable], optional): Run the callback in a thread pool, see Offloader. Pass a callable to receive
+            its return value on the main thread. A newer event (per channel) supersedes a still running call. The callback runs
+            in a worker thread and gets plain values captured on the main thread instead of TouchDesigner objects, see to_plain.
+            scope (NoNodeScope, optional): Register in the tables of this scope instead of the global ones, see Scope.
 
         Example:
             def my_callback(event_type, channel, index, value, prev):
@@ -284,27 +971,267 @@ class NoNode:
             NoNode.RegisterChopExec(ChopExecType.VALUE_CHANGE, op('constant1'), ['chan1', 'chan2'], my_callback)
             # Or with comma and/or whitespace separated channels:
             NoNode.RegisterChopExec(ChopExecType.VALUE_CHANGE, op('constant1'), 'chan1, chan2 chan3,chan4', my_callback)
+
+        Batched event types (ValueChangeBatch, OffToOnBatch, OnToOffBatch, WhileOnBatch, WhileOffBatch) read the CHOP
+        once per frame and call the callback once with numpy arrays instead of once per channel:
+            def my_batch_callback(chop, indices, vals, prevs):
+                # indices of the changed channels, their current and previous values
+            
+            NoNode.RegisterChopExec(ChopExecType.ValueChangeBatch, op('midiin1'), '*', my_batch_callback)
+            # WhileOnBatch/WhileOffBatch are called every frame with the channels that are currently on/off
+            NoNode.RegisterChopExec(ChopExecType.WhileOnBatch, op('midiin1'), 'b*', my_batch_callback)
         """
-        if event_type not in cls.CHOPEXEC_CALLBACKS.getRaw():
-            cls.CHOPEXEC_CALLBACKS.setItem(event_type, {}, raw=True)
+        reg = scope or cls
+        current_callbacks = reg.CHOPEXEC_CALLBACKS.setdefault(event_type, {})
+        if chop not in current_callbacks:
+            current_callbacks[chop] = {}
+            cls.__retainOperator(chop)
 
-        current_callbacks = cls.CHOPEXEC_CALLBACKS.getDependency(event_type)
-        if chop not in current_callbacks.val:
-            current_callbacks.val[chop] = {}
-            cls.__markOperatorAsWatched(chop)
+        callback = cls.__entry(event_type, callback, max_rate=max_rate, debounce=debounce, debounce_frames=debounce_frames,
+                               coalesce=coalesce, priority=priority, offload=offload)
 
         if isinstance(channels, str):
             channels = re.split(r'[,\s]+', channels.strip())
         for channel in channels:
-            current_callbacks.val[chop][channel] = callback
-        cls.CHOPEXEC_CALLBACKS.setItem(event_type, current_callbacks)
+            current_callbacks[chop][channel] = callback
+        cls.__invalidateChopIndex(reg, event_type, chop)
+        cls.__registryChanged()
+        cls.__scheduleSweep() # drop registrations of operators deleted meanwhile
 
         # Enable the appropriate docked operator based on the event type
         if event_type in cls.CHOP_EXEC_MAP:
             cls.CHOP_EXEC_MAP[event_type].par.active = True
 
     @classmethod
-    def RegisterDatExec(cls, event_type: DatExecType, dat: DAT, callback: Callable) -> None:
+    def __entry(cls, event_type: Union[ChopExecType, DatExecType, ParExecType], callback: Callable, region: bool = False, **options) -> Callable:
+        """Create the registry entry of a callback with the argument forms, key and merge of its event type, see __wrapCallback for the options."""
+        key = merge = None
+        if isinstance(event_type, cls.ChopExecType):
+            if event_type in cls.CHOP_BATCH_TYPES:
+                forms = cls.CHOP_BATCH_FORMS
+            else:
+                forms, key = cls.CHOP_FORMS, lambda args: args[0].name
+        elif isinstance(event_type, cls.DatExecType):
+            if region:
+                forms, merge = cls.DAT_REGION_FORMS, cls.__mergeRegionDiffs
+            else:
+                forms = cls.DAT_FORMS[event_type]
+                merge = cls.__mergeCellChanges if event_type is cls.DatExecType.CellChange else None
+        else:
+            forms, key = cls.PAR_FORMS[event_type], lambda args: (args[0].owner, args[0].name)
+        label = f'{type(event_type).__name__[:-len("Type")]}.{event_type.name}'
+        return cls.__wrapCallback(callback, forms, key=key, merge=merge, label=label, **options)
+
+    @classmethod
+    def __wrapCallback(cls, callback: Callable, forms: tuple, max_rate: float = None, debounce: float = None, debounce_frames: int = None,
+                       coalesce: bool = False, priority: int = None, offload: Union[bool, Callable] = False, key: Callable = None,
+                       merge: Callable = None, label: str = None) -> Callable:
+        """Turn a callback into a weak registry entry taking the full event arguments, rate limited, deferred and/or offloaded if any option is given."""
+        callback = weak = _WeakCallback(callback, forms, on_dead=cls.__scheduleSweep)
+        weak.options = {name: value for name, value in (('max_rate', max_rate), ('debounce', debounce), ('debounce_frames', debounce_frames),
+                        ('coalesce', coalesce), ('priority', priority), ('offload', offload)) if value is not None and value is not False}
+        if offload:
+            on_result = _WeakCallback(offload, ((), (0,))) if callable(offload) else None
+            callback = _OffloadedCallback(callback, on_result, key, lambda: cls.OFFLOADER)
+        if max_rate or debounce or debounce_frames or coalesce:
+            callback = CallPolicy(callback, _runScheduler, max_rate=max_rate, debounce=debounce, debounce_frames=debounce_frames,
+                                  coalesce=coalesce, key=key, merge=merge, frame=lambda: absTime.frame)
+        if priority is not None:
+            callback = _ScheduledCallback(callback, priority, lambda: cls.SCHEDULER)
+        if cls.PROFILE_IS_ENABLED:
+            callback = cls.__instrument(callback, label)
+        return callback
+
+    @classmethod
+    def __scheduleSweep(cls) -> None:
+        """Run Sweep at the end of the current frame, if it is not scheduled already."""
+        if not cls.SWEEP_SCHEDULED:
+            cls.SWEEP_SCHEDULED = True
+            run('args[0]()', cls.Sweep, endFrame=True)
+
+    @classmethod
+    def __registryChanged(cls) -> None:
+        """Bump REGISTRY_VERSION at the end of the current frame, so several changes in a frame notify dependents once."""
+        if not cls.REGISTRY_CHANGE_SCHEDULED:
+            cls.REGISTRY_CHANGE_SCHEDULED = True
+            run('args[0]()', cls.__bumpRegistryVersion, endFrame=True)
+
+    @classmethod
+    def __bumpRegistryVersion(cls) -> None:
+        cls.REGISTRY_CHANGE_SCHEDULED = False
+        cls.REGISTRY_VERSION.val += 1
+
+    @classmethod
+    def Sweep(cls) -> None:
+        """Drop the registrations of deleted operators and of callbacks whose extension instance is gone, in every scope."""
+        cls.SWEEP_SCHEDULED = False
+        released = []
+        changed = False
+        for reg in cls.REGISTRIES:
+            changed = cls.__sweepRegistry(reg, released) or changed
+
+        for _op in released:
+            cls.__releaseOperator(_op)
+        if changed or released:
+            cls.__registryChanged()
+
+    @classmethod
+    def __sweepRegistry(cls, reg, released: list) -> bool:
+        """Drop the stale entries of one registry, collecting operators to release. Returns True if anything was dropped."""
+        is_stale = lambda _op, callback: not _op.valid or not getattr(callback, 'alive', True)
+        changed = False
+        emptied = [] # event types without registrations left in this registry
+        pruned_pars = set() # par exec event types whose resolved lookup table is stale
+
+        for event_type in list(reg.CHOPEXEC_CALLBACKS):
+            for chop, channels in list(reg.CHOPEXEC_CALLBACKS[event_type].items()):
+                stale = [channel for channel, callback in channels.items() if is_stale(chop, callback)]
+                if not stale:
+                    continue
+                changed = True
+                for channel in stale:
+                    del channels[channel]
+                if not channels:
+                    del reg.CHOPEXEC_CALLBACKS[event_type][chop]
+                    released.append(chop)
+                cls.__invalidateChopIndex(reg, event_type, chop)
+            if not reg.CHOPEXEC_CALLBACKS[event_type]:
+                del reg.CHOPEXEC_CALLBACKS[event_type]
+                emptied.append(event_type)
+
+        for event_type in list(reg.DATEXEC_CALLBACKS):
+            for dat, callback in list(reg.DATEXEC_CALLBACKS[event_type].items()):
+                if is_stale(dat, callback):
+                    del reg.DATEXEC_CALLBACKS[event_type][dat]
+                    released.append(dat)
+                    changed = True
+            if not reg.DATEXEC_CALLBACKS[event_type]:
+                del reg.DATEXEC_CALLBACKS[event_type]
+                emptied.append(event_type)
+
+        for dat, regions in list(reg.DATEXEC_REGIONS.items()):
+            for region in [region for region in regions if is_stale(dat, region.callback)]:
+                regions.remove(region)
+                released.append(dat)
+                changed = True
+            if not regions:
+                del reg.DATEXEC_REGIONS[dat]
+                emptied.append(cls.DatExecType.CellChange)
+
+        for event_type in list(reg.PAREXEC_CALLBACKS):
+            for owner, pars in list(reg.PAREXEC_CALLBACKS[event_type].items()):
+                for parameter in [parameter for parameter, callback in pars.items() if is_stale(owner, callback)]:
+                    del pars[parameter]
+                    pruned_pars.add(event_type)
+                if not pars:
+                    del reg.PAREXEC_CALLBACKS[event_type][owner]
+                    released.append(owner)
+            if not reg.PAREXEC_CALLBACKS[event_type]:
+                del reg.PAREXEC_CALLBACKS[event_type]
+                emptied.append(event_type)
+        for event_type in pruned_pars:
+            reg.PAREXEC_TABLE.pop(event_type, None)
+            reg.PAREXEC_LAYOUT.pop(event_type, None)
+
+        for event_type in emptied:
+            cls.__disableIfUnused(event_type)
+        return changed or bool(pruned_pars)
+
+    @classmethod
+    def __inUse(cls, event_type: Union[ChopExecType, DatExecType, ParExecType]) -> bool:
+        """Return whether the global tables or any scope have registrations for an event type."""
+        for reg in cls.REGISTRIES:
+            if event_type in reg.CHOPEXEC_CALLBACKS or event_type in reg.DATEXEC_CALLBACKS or event_type in reg.PAREXEC_CALLBACKS:
+                return True
+            if event_type is cls.DatExecType.CellChange and reg.DATEXEC_REGIONS:
+                return True
+        return False
+
+    @classmethod
+    def __disableIfUnused(cls, event_type: Union[ChopExecType, DatExecType, ParExecType]) -> None:
+        """Disable the execute operator of an event type once neither the global tables nor any scope use it."""
+        if cls.__inUse(event_type):
+            return
+        if isinstance(event_type, cls.ChopExecType):
+            cls.DisableChopExec(event_type)
+        elif isinstance(event_type, cls.DatExecType):
+            cls.DisableDatExec(event_type)
+        else:
+            cls.DisableParExec(event_type)
+
+    @classmethod
+    def __invalidateChopIndex(cls, reg, event_type: ChopExecType, chop: CHOP) -> None:
+        """Mark the channel index of a CHOP in a registry for a rebuild before the next dispatch, so registering N channels stays O(N)."""
+        reg.CHOPEXEC_DIRTY.add((event_type, chop))
+        if event_type in cls.CHOP_BATCH_TYPES:
+            cls.__scheduleFramePump()
+
+    @classmethod
+    def __rebuildChopIndexes(cls, reg) -> None:
+        """Rebuild the channel indexes marked by __invalidateChopIndex."""
+        dirty, reg.CHOPEXEC_DIRTY = reg.CHOPEXEC_DIRTY, set()
+        for event_type, chop in dirty:
+            cls.__rebuildChopIndex(reg, event_type, chop)
+
+    @classmethod
+    def __rebuildChopIndex(cls, reg, event_type: ChopExecType, chop: CHOP) -> None:
+        """Rebuild the precompiled channel index of a CHOP after its registrations changed."""
+        patterns = reg.CHOPEXEC_CALLBACKS[event_type].get(chop) if event_type in reg.CHOPEXEC_CALLBACKS else None
+        if event_type in cls.CHOP_BATCH_TYPES:
+            cls.__rebuildChopBatchWatcher(reg, event_type, chop, patterns)
+        elif patterns:
+            reg.CHOPEXEC_INDEX.setdefault(event_type, {})[chop] = _ChannelIndex(patterns, cls.CHOP_FORMS)
+        elif event_type in reg.CHOPEXEC_INDEX:
+            reg.CHOPEXEC_INDEX[event_type].pop(chop, None)
+            if not reg.CHOPEXEC_INDEX[event_type]:
+                del reg.CHOPEXEC_INDEX[event_type]
+
+    @classmethod
+    def __rebuildChopBatchWatcher(cls, reg, event_type: ChopExecType, chop: CHOP, patterns: Dict[str, Callable]) -> None:
+        """Update the frame-batched watcher of a CHOP and keep the frame pump running while there are watchers."""
+        watcher = reg.CHOP_BATCH_WATCHERS.get(chop)
+        if patterns:
+            if watcher is None:
+                watcher = reg.CHOP_BATCH_WATCHERS[chop] = _ChopBatchWatcher(chop)
+            watcher.SetIndex(event_type, _ChannelIndex(patterns, cls.CHOP_BATCH_FORMS))
+        elif watcher is not None:
+            watcher.SetIndex(event_type)
+            if not watcher.indexes:
+                del reg.CHOP_BATCH_WATCHERS[chop]
+
+    @classmethod
+    def __scheduleFramePump(cls) -> None:
+        """Run the frame pump on the next frame, if it is not scheduled already."""
+        if not cls.FRAME_PUMP_SCHEDULED:
+            cls.FRAME_PUMP_SCHEDULED = True
+            run('args[0]()', cls.__onFrame, delayFrames=1)
+
+    @classmethod
+    def __onFrame(cls) -> None:
+        """Frame pump: evaluate the batched CHOP watchers of every scope once per frame, one numpyArray() read per CHOP and scope."""
+        cls.FRAME_PUMP_SCHEDULED = False
+        watching = False
+        for reg in cls.REGISTRIES:
+            if reg.CHOPEXEC_DIRTY:
+                cls.__rebuildChopIndexes(reg)
+            if not reg.CHOP_BATCH_WATCHERS:
+                continue
+            watching = True
+            if cls.CHOPEXEC_IS_ENABLED:
+                for chop, watcher in list(reg.CHOP_BATCH_WATCHERS.items()):
+                    if not chop.valid:
+                        del reg.CHOP_BATCH_WATCHERS[chop]
+                        cls.__scheduleSweep()
+                        continue
+                    watcher.Tick(cls.CHOP_BATCH_THRESHOLD)
+        if watching:
+            cls.__scheduleFramePump()
+
+    @classmethod
+    def RegisterDatExec(cls, event_type: DatExecType, dat: DAT, callback: Callable,
+                        max_rate: float = None, debounce: float = None, debounce_frames: int = None, coalesce: bool = False,
+                        priority: int = None, offload: Union[bool, Callable] = False, rows: Union[str, List[str]] = None,
+                        cols: Union[str, List[str]] = None, cells: List[tuple] = None, scope: 'NoNodeScope' = None) -> None:
         """
         Register a DAT execute callback.
 
@@ -312,28 +1239,88 @@ class NoNode:
             event_type (DatExecType): The type of event to listen for.
             dat (DAT): The DAT operator to register the callback for.
             callback (Callable): The callback function to be called on DAT execution.
+            max_rate, debounce, debounce_frames, coalesce, priority, offload: Optional rate limiting, deferral and offloading, see RegisterChopExec.
+            Held back CellChange events are merged per cell: the callback gets every changed cell once, with its oldest previous value.
+            rows (Union[str, List[str]], optional): CellChange only (ValueError otherwise), row keys (first column) to watch, wildcards allowed.
+            cols (Union[str, List[str]], optional): CellChange only, column names (first row) to watch, wildcards allowed.
+            cells (List[tuple], optional): CellChange only, (row key, column name) patterns of single cells to watch.
+            With any filter the callback is only called when the watched region changes, with a list of
+            (row, col, old, new) diffs instead of the raw cells, and any number of callbacks can watch the same DAT.
+            Registering the same callback with the same filters again replaces the earlier subscription.
+            scope (NoNodeScope, optional): Register in the tables of this scope instead of the global ones, see Scope.
 
         Example:
             def my_callback(dat, rows, cols):
                 print(f"DAT {dat} changed. New size: {rows}x{cols}")
             
             NoNode.RegisterDatExec(DatExecType.SizeChange, op('table1'), my_callback)
+
+            def my_region_callback(dat, diffs):
+                for row, col, old, new in diffs:
+                    print(f"{row}/{col} changed from {old} to {new}")
+
+            NoNode.RegisterDatExec(DatExecType.CellChange, op('config'), my_region_callback, rows='speed gain*', cols='value')
         """
-        if event_type not in cls.DATEXEC_CALLBACKS.getRaw():
-            cls.DATEXEC_CALLBACKS.setItem(event_type, {}, raw=True)
+        reg = scope or cls
+        if rows or cols or cells:
+            cls.__registerDatRegion(reg, event_type, dat, callback, rows, cols, cells, max_rate, debounce, debounce_frames, coalesce, priority, offload)
+            return
 
-        current_callbacks = cls.DATEXEC_CALLBACKS.getDependency(event_type)
-        if dat not in current_callbacks.val:
-            current_callbacks.val[dat] = callback
-            cls.__markOperatorAsWatched(dat)
-        cls.DATEXEC_CALLBACKS.setItem(event_type, current_callbacks)
+        current_callbacks = reg.DATEXEC_CALLBACKS.setdefault(event_type, {})
+        if dat not in current_callbacks:
+            current_callbacks[dat] = cls.__entry(event_type, callback, max_rate=max_rate, debounce=debounce, debounce_frames=debounce_frames,
+                                                 coalesce=coalesce, priority=priority, offload=offload)
+            cls.__retainOperator(dat)
+            cls.__registryChanged()
+        cls.__scheduleSweep() # drop registrations of operators deleted meanwhile
 
         # Enable the appropriate docked operator based on the event type
         if event_type in cls.DAT_EXEC_MAP:
             cls.DAT_EXEC_MAP[event_type].par.active = True
 
     @classmethod
-    def DeregisterChopExec(cls, event_type: ChopExecType, chop: CHOP = None, channels: Union[str, List[str]] = None) -> None:
+    def __registerDatRegion(cls, reg, event_type: DatExecType, dat: DAT, callback: Callable, rows, cols, cells,
+                            max_rate: float, debounce: float, debounce_frames: int, coalesce: bool, priority: int,
+                            offload: Union[bool, Callable]) -> None:
+        """Add a filtered cell change subscription to a DAT, replacing an identical one."""
+        if event_type is not cls.DatExecType.CellChange:
+            raise ValueError(f"rows, cols and cells filters are only supported for CellChange, not {event_type.name}")
+        region = _DatRegion(callback, rows, cols, cells)
+        region.callback = cls.__entry(event_type, callback, region=True, max_rate=max_rate, debounce=debounce, debounce_frames=debounce_frames,
+                                      coalesce=coalesce, priority=priority, offload=offload)
+        regions = reg.DATEXEC_REGIONS.setdefault(dat, [])
+        for i, existing in enumerate(regions):
+            if existing.key == region.key and cls.__isCallback(existing.callback, callback):
+                regions[i] = region
+                break
+        else:
+            regions.append(region)
+            cls.__retainOperator(dat)
+        cls.__registryChanged()
+        cls.__scheduleSweep() # drop registrations of operators deleted meanwhile
+        cls.DAT_EXEC_MAP[event_type].par.active = True
+
+    @staticmethod
+    def __mergeCellChanges(pending: tuple, args: tuple) -> tuple:
+        """Merge two held back cell changes of a DAT by cell, keeping the oldest previous and the newest cell of each."""
+        dat, rows, cols, cells, prev = pending
+        changes = {(cell.row, cell.col): [cell, old] for cell, old in zip(cells, prev)}
+        for cell, old in zip(args[3], args[4]):
+            change = changes.setdefault((cell.row, cell.col), [cell, old])
+            change[0] = cell
+        return (args[0], args[1], args[2], [cell for cell, _ in changes.values()], [old for _, old in changes.values()])
+
+    @staticmethod
+    def __mergeRegionDiffs(pending: tuple, args: tuple) -> tuple:
+        """Merge two held back region diffs of a DAT by cell, keeping the oldest old and the newest new value of each."""
+        diffs = {(row, col): [row, col, old, new] for row, col, old, new in pending[1]}
+        for row, col, old, new in args[1]:
+            diffs.setdefault((row, col), [row, col, old, new])[3] = new
+        return (args[0], [tuple(diff) for diff in diffs.values()])
+
+    @classmethod
+    def DeregisterChopExec(cls, event_type: ChopExecType, chop: CHOP = None, channels: Union[str, List[str]] = None,
+                           scope: 'NoNodeScope' = None) -> None:
         """
         Deregister a chopExec callback
 
@@ -341,58 +1328,119 @@ class NoNode:
             event_type (ChopExecType): The event type to deregister.
             chop (CHOP, optional): The CHOP operator to deregister the callback for. If None, deregisters all CHOPs for the event type.
             channels (Union[str, List[str]], optional): The channel(s) to deregister. Can be a string (single channel, comma/space-separated list, or wildcard pattern) or a list of strings. If None, deregisters all channels for the specified CHOP.
+            scope (NoNodeScope, optional): Deregister from the tables of this scope instead of the global ones, see Scope.
         """
-        if event_type in cls.CHOPEXEC_CALLBACKS:
-            if chop is None:
-                for registered_chop in cls.CHOPEXEC_CALLBACKS[event_type]:
-                    cls.__checkAndResetOperatorColor(registered_chop)
-                del cls.CHOPEXEC_CALLBACKS[event_type]
-            elif chop in cls.CHOPEXEC_CALLBACKS[event_type]:
-                if channels is None:
-                    del cls.CHOPEXEC_CALLBACKS[event_type][chop]
-                    cls.__checkAndResetOperatorColor(chop)
-                else:
-                    if isinstance(channels, str):
-                        channels = re.split(r'[,\s]+', channels.strip())
-                    for channel in channels:
-                        for registered_channel in list(cls.CHOPEXEC_CALLBACKS[event_type][chop].keys()):
-                            if channel == '*' or tdu.match(channel, [registered_channel]):
-                                del cls.CHOPEXEC_CALLBACKS[event_type][chop][registered_channel]
-                
-                if not cls.CHOPEXEC_CALLBACKS[event_type][chop]:
-                    del cls.CHOPEXEC_CALLBACKS[event_type][chop]
-                    cls.__checkAndResetOperatorColor(chop)
-            
-            if not cls.CHOPEXEC_CALLBACKS[event_type]:
-                del cls.CHOPEXEC_CALLBACKS[event_type]
-            # check if there are any callbacks left for this event type if not disable the operator
-            if event_type in cls.CHOPEXEC_CALLBACKS:
-                for chop in cls.CHOPEXEC_CALLBACKS[event_type]:
-                    if cls.CHOPEXEC_CALLBACKS[event_type][chop]:
-                        return
-                cls.DisableChopExec(event_type)
+        reg = scope or cls
+        if event_type not in reg.CHOPEXEC_CALLBACKS:
+            return
+        cls.__registryChanged()
+        current_callbacks = reg.CHOPEXEC_CALLBACKS[event_type]
+        if chop is None:
+            for registered_chop in list(current_callbacks):
+                del current_callbacks[registered_chop]
+                cls.__releaseOperator(registered_chop)
+                cls.__invalidateChopIndex(reg, event_type, registered_chop)
+        elif chop in current_callbacks:
+            if channels is None:
+                current_callbacks[chop].clear()
+            else:
+                if isinstance(channels, str):
+                    channels = re.split(r'[,\s]+', channels.strip())
+                for channel in channels:
+                    for registered_channel in list(current_callbacks[chop].keys()):
+                        if channel == '*' or tdu.match(channel, [registered_channel]):
+                            del current_callbacks[chop][registered_channel]
+            if not current_callbacks[chop]:
+                del current_callbacks[chop]
+                cls.__releaseOperator(chop)
+            cls.__invalidateChopIndex(reg, event_type, chop)
+
+        # check if there are any callbacks left for this event type if not disable the operator
+        if not current_callbacks:
+            del reg.CHOPEXEC_CALLBACKS[event_type]
+            cls.__disableIfUnused(event_type)
 
     @classmethod
-    def DeregisterDatExec(cls, event_type: DatExecType, dat: DAT = None) -> None:
+    def DeregisterDatExec(cls, event_type: DatExecType, dat: DAT = None, callback: Callable = None,
+                          rows: Union[str, List[str]] = None, cols: Union[str, List[str]] = None, cells: List[tuple] = None,
+                          scope: 'NoNodeScope' = None) -> None:
         """
         Deregister a datExec callback
 
         Args:
             event_type (DatExecType): The event type to deregister.
             dat (DAT, optional): The DAT operator to deregister the callback for. If None, deregisters all DATs for the event type.
+            Deregistering CellChange also removes the filtered subscriptions (rows, cols, cells) of the DAT(s).
+            callback (Callable, optional): Only deregister this callback.
+            rows, cols, cells (optional): CellChange only, only remove the filtered subscriptions registered with these filters.
+            scope (NoNodeScope, optional): Deregister from the tables of this scope instead of the global ones, see Scope.
+
+        Example:
+            # remove one region, keeping the other subscriptions of the DAT
+            NoNode.DeregisterDatExec(DatExecType.CellChange, op('config'), self.onSpeed, rows='speed', cols='value')
         """
-        if event_type in cls.DATEXEC_CALLBACKS:
-            if dat is None:
-                for registered_dat in cls.DATEXEC_CALLBACKS[event_type]:
-                    cls.__checkAndResetOperatorColor(registered_dat)
-                del cls.DATEXEC_CALLBACKS[event_type]
-            elif dat in cls.DATEXEC_CALLBACKS[event_type]:
-                del cls.DATEXEC_CALLBACKS[event_type][dat]
-                cls.__checkAndResetOperatorColor(dat)
-            
-            if not cls.DATEXEC_CALLBACKS[event_type]:
-                del cls.DATEXEC_CALLBACKS[event_type]
-                cls.DisableDatExec(event_type)
+        reg = scope or cls
+        filtered = bool(rows or cols or cells)
+        if filtered and event_type is not cls.DatExecType.CellChange:
+            raise ValueError(f"rows, cols and cells filters are only supported for CellChange, not {event_type.name}")
+        if filtered or callback is not None:
+            cls.__deregisterDatCallback(reg, event_type, dat, callback, _DatRegion.FilterKey(rows, cols, cells) if filtered else None)
+            return
+
+        if event_type in reg.DATEXEC_CALLBACKS or (event_type is cls.DatExecType.CellChange and reg.DATEXEC_REGIONS):
+            cls.__registryChanged()
+
+        if event_type is cls.DatExecType.CellChange:
+            for registered_dat in ([dat] if dat is not None else list(reg.DATEXEC_REGIONS)):
+                for _ in reg.DATEXEC_REGIONS.pop(registered_dat, ()):
+                    cls.__releaseOperator(registered_dat)
+
+        if event_type in reg.DATEXEC_CALLBACKS:
+            current_callbacks = reg.DATEXEC_CALLBACKS[event_type]
+            for registered_dat in ([dat] if dat is not None else list(current_callbacks)):
+                if current_callbacks.pop(registered_dat, None) is not None:
+                    cls.__releaseOperator(registered_dat)
+            if not current_callbacks:
+                del reg.DATEXEC_CALLBACKS[event_type]
+        cls.__disableIfUnused(event_type)
+
+    @classmethod
+    def __deregisterDatCallback(cls, reg, event_type: DatExecType, dat: Union[DAT, None], callback: Union[Callable, None],
+                                filters: Union[tuple, None]) -> None:
+        """Remove the registrations of one callback and/or the filtered subscriptions with the given filters."""
+        removed = False
+        if filters is None:
+            dats = reg.DATEXEC_CALLBACKS.get(event_type, {})
+            for registered_dat in ([dat] if dat is not None else list(dats)):
+                if registered_dat in dats and cls.__isCallback(dats[registered_dat], callback):
+                    del dats[registered_dat]
+                    cls.__releaseOperator(registered_dat)
+                    removed = True
+            if event_type in reg.DATEXEC_CALLBACKS and not dats:
+                del reg.DATEXEC_CALLBACKS[event_type]
+        if event_type is cls.DatExecType.CellChange:
+            for registered_dat in ([dat] if dat is not None else list(reg.DATEXEC_REGIONS)):
+                regions = reg.DATEXEC_REGIONS.get(registered_dat, [])
+                for region in [region for region in regions if (filters is None or region.key == filters)
+                               and (callback is None or cls.__isCallback(region.callback, callback))]:
+                    regions.remove(region)
+                    cls.__releaseOperator(registered_dat)
+                    removed = True
+                if not regions:
+                    reg.DATEXEC_REGIONS.pop(registered_dat, None)
+        if removed:
+            cls.__registryChanged()
+            cls.__disableIfUnused(event_type)
+
+    @staticmethod
+    def __isCallback(entry: Callable, callback: Callable) -> bool:
+        """Return whether a registry entry, through any wrappers, calls the given callback."""
+        while not isinstance(entry, _WeakCallback):
+            entry = getattr(entry, 'callback', None)
+            if entry is None:
+                return False
+        target = entry.ref()
+        return target is not None and target == callback
 
     @classmethod
     def OnChopExec(cls, event_type: ChopExecType, channel: Channel, sampleIndex: int, val: float, prev: float) -> None:
@@ -400,31 +1448,16 @@ class NoNode:
         if not cls.CHOPEXEC_IS_ENABLED:
             return
 
-        def execute_callback(callback):
-            arg_count = callback.__code__.co_argcount
-            if arg_count == 1:
-                callback()
-            elif arg_count == 2:
-                callback(val)
-            elif arg_count == 3:
-                callback(channel, val)
-            elif arg_count == 4:
-                callback(channel, sampleIndex, val)
-            elif arg_count == 5:
-                callback(channel, sampleIndex, val, prev)
         chop = channel.owner
-
-        # execute the callback for the channel if it matches the event type
-        if event_type in cls.CHOPEXEC_CALLBACKS:
-            callbacks = cls.CHOPEXEC_CALLBACKS[event_type].get(chop, {})
-            executed_callbacks = set() # to avoid executing the same callback multiple times for the same channel
-            for ch, callback in callbacks.items():
-                channel_names = ch.split() if ch != '*' else ['*']
-                for channel_name in channel_names:
-                    if (channel_name == '*' or tdu.match(channel_name, [channel.name])) and (channel.name, callback) not in executed_callbacks:
-                        execute_callback(callback)
-                        executed_callbacks.add((channel.name, callback))
-                        break  # Exit the inner loop after executing the callback
+        for reg in cls.REGISTRIES:
+            if reg.CHOPEXEC_DIRTY:
+                cls.__rebuildChopIndexes(reg)
+            # execute the callbacks whose channel patterns match, resolved through the precompiled index
+            index = reg.CHOPEXEC_INDEX.get(event_type, {}).get(chop)
+            if index is None:
+                continue
+            for callback in index.Resolve(channel.name):
+                callback(channel, sampleIndex, val, prev)
 
     @classmethod
     def OnDatExec(cls, event_type: DatExecType, dat: DAT, rows: int = None, cols: int = None, cells: list[Cell] = None, prev = None) -> None:
@@ -432,23 +1465,24 @@ class NoNode:
         if not cls.DATEXEC_IS_ENABLED:
             return
 
-        if event_type in cls.DATEXEC_CALLBACKS and dat in cls.DATEXEC_CALLBACKS[event_type]:
-            callback = cls.DATEXEC_CALLBACKS[event_type][dat]
-            arg_count = callback.__code__.co_argcount
-            if arg_count == 1:
-                callback()
-            elif arg_count == 2:
-                callback(dat)
-            elif arg_count == 3:
-                if event_type == cls.DatExecType.RowChange:
-                    callback(dat, rows)
-                elif event_type == cls.DatExecType.ColChange:
-                    callback(dat, cols)
-                elif event_type == cls.DatExecType.CellChange:
-                    callback(dat, cells)
-            elif arg_count == 4:
-                callback(dat, cells, prev)
-
+        diffs = None
+        for reg in cls.REGISTRIES:
+            if event_type in reg.DATEXEC_CALLBACKS and dat in reg.DATEXEC_CALLBACKS[event_type]:
+                reg.DATEXEC_CALLBACKS[event_type][dat](dat, rows, cols, cells, prev)
+
+            regions = reg.DATEXEC_REGIONS.get(dat) if event_type is cls.DatExecType.CellChange else None
+            if not regions or not cells:
+                continue
+            if diffs is None:
+                # one (row key, column name, old, new) diff per changed cell, shared by all regions of the DAT
+                diffs = [
+                    (dat[cell.row, 0].val, dat[0, cell.col].val, getattr(old, 'val', old), cell.val)
+                    for cell, old in zip(cells, prev or [None] * len(cells))
+                ]
+            for region in regions:
+                watched = [diff for diff in diffs if region.Watches(diff[0], diff[1])]
+                if watched:
+                    region.callback(dat, watched)
 
     ### Keyboard Shortcuts ###
 
@@ -465,7 +1499,7 @@ class NoNode:
         cls.KEYBOARD_EXEC.par.active = False
 
     @classmethod
-    def RegisterKeyboardShortcut(cls, shortcut: str, callback: callable) -> None:
+    def RegisterKeyboardShortcut(cls, shortcut: str, callback: callable, scope: 'NoNodeScope' = None) -> None:
         """ Register a keyboard shortcut and its callback.
         Handle keyboard shortcuts (if enable_keyboard_shortcuts=True (default is False)):
        - Enable keyboard shortcuts:
@@ -476,46 +1510,82 @@ class NoNode:
          def onKeyboardShortcut(self):
            # This method will be called when the registered keyboard shortcut is pressed
         """
-        cls.KEYBOARD_CALLBACKS[shortcut] = callback
+        if cls.PROFILE_IS_ENABLED:
+            callback = cls.__instrument(callback, f'Keyboard.{shortcut}')
+        (scope or cls).KEYBOARD_CALLBACKS[shortcut] = callback
+        cls.__registryChanged()
 
     @classmethod
-    def DeregisterKeyboardShortcut(cls, shortcut: str) -> None:
-        """Unregister a keyboard shortcut."""
-        cls.KEYBOARD_CALLBACKS.pop(shortcut, None)
+    def DeregisterKeyboardShortcut(cls, shortcut: str, scope: 'NoNodeScope' = None) -> None:
+        """Unregister a keyboard shortcut, of a scope if given."""
+        if (scope or cls).KEYBOARD_CALLBACKS.pop(shortcut, None) is not None:
+            cls.__registryChanged()
 
 
     @classmethod
     def OnKeyboardShortcut(cls, shortcut: str) -> None:
         """Handle keyboard shortcut events."""
-        if cls.KEYBOARD_IS_ENABLED and shortcut in cls.KEYBOARD_CALLBACKS:
-            cls.KEYBOARD_CALLBACKS[shortcut]()
+        if not cls.KEYBOARD_IS_ENABLED:
+            return
+        for reg in cls.REGISTRIES:
+            if shortcut in reg.KEYBOARD_CALLBACKS:
+                reg.KEYBOARD_CALLBACKS[shortcut]()
+
+    @classmethod
+    def __retainOperator(cls, _op: OP) -> None:
+        """Count a new registration entry of an operator, marking it on the first one."""
+        count = cls.WATCHED_OPS.get(_op, 0)
+        cls.WATCHED_OPS[_op] = count + 1
+        if not count:
+            cls.__markOperatorAsWatched(_op)
+
+    @classmethod
+    def __releaseOperator(cls, _op: OP) -> None:
+        """Uncount a registration entry of an operator, resetting its color when it was the last one."""
+        count = cls.WATCHED_OPS.get(_op, 0)
+        if count > 1:
+            cls.WATCHED_OPS[_op] = count - 1
+            return
+        cls.WATCHED_OPS.pop(_op, None)
+        if count and _op.valid:
+            cls.__resetOperatorColor(_op)
+
+    @classmethod
+    def __recountWatched(cls) -> None:
+        """Recount the registration entries per operator of the global tables and all scopes in one pass, marking the watched ones."""
+        counts: Dict[OP, int] = {}
+        for reg in cls.REGISTRIES:
+            # one entry per event type and operator, and one per region, as the Register methods count them
+            for table in (*reg.CHOPEXEC_CALLBACKS.values(), *reg.DATEXEC_CALLBACKS.values(), *reg.PAREXEC_CALLBACKS.values()):
+                for _op in table:
+                    counts[_op] = counts.get(_op, 0) + 1
+            for dat, regions in reg.DATEXEC_REGIONS.items():
+                counts[dat] = counts.get(dat, 0) + len(regions)
+        cls.WATCHED_OPS = counts
+        for _op in counts:
+            if _op.valid:
+                cls.__markOperatorAsWatched(_op)
 
     @classmethod
     def __markOperatorAsWatched(cls, _op: OP) -> None:
         """Mark an operator as watched by changing its color."""
-        _op.color = cls.MARK_COLOR
+        if _op is not cls.EXT_OWNER_COMP:
+            _op.color = cls.MARK_COLOR
 
     @classmethod
     def __resetOperatorColor(cls, _op: OP) -> None:
         """Reset an operator's color to the default."""
-        _op.color = (0.55, 0.55, 0.55) # td default color, probably available somewhere in the TD API/vars
-
-    @classmethod
-    def __checkAndResetOperatorColor(cls, _op: OP) -> None:
-        """Check if an operator is still registered for any event type, and reset its color if not."""
-        for event_type in cls.CHOPEXEC_CALLBACKS.getRaw().keys() | cls.DATEXEC_CALLBACKS.getRaw().keys():
-            if _op in cls.CHOPEXEC_CALLBACKS.getRaw().get(event_type, {}) or _op in cls.DATEXEC_CALLBACKS.getRaw().get(event_type, {}):
-                return
-        cls.__resetOperatorColor(_op)
+        if _op is not cls.EXT_OWNER_COMP:
+            _op.color = (0.55, 0.55, 0.55) # td default color, probably available somewhere in the TD API/vars
 
     @classmethod
     def SetMarkColor(cls, color: tuple[float, float, float]) -> None:
         """Set the mark color."""
         cls.MARK_COLOR = color
-        # list all registered operators (chops and dats) and update their color
-        for event_type in cls.CHOPEXEC_CALLBACKS.getRaw().keys() | cls.DATEXEC_CALLBACKS.getRaw().keys():
-            for _op in cls.CHOPEXEC_CALLBACKS.getRaw().get(event_type, {}).keys() | cls.DATEXEC_CALLBACKS.getRaw().get(event_type, {}).keys():
-                _op.color = cls.MARK_COLOR
+        # update the color of all watched operators
+        for _op in cls.WATCHED_OPS:
+            if _op.valid:
+                cls.__markOperatorAsWatched(_op)
 
     ### Parameter Exec ###
 
@@ -534,15 +1604,24 @@ class NoNode:
             cls.PAR_EXEC_MAP[event_type].par.active = False
 
     @classmethod
-    def RegisterParExec(cls, event_type: ParExecType, owner: OP, parameter: Union[Par, str], callback: Callable) -> None:
+    def RegisterParExec(cls, event_type: ParExecType, owner: Union[OP, List[OP]], parameter: Union[Par, str, list], callback: Callable,
+                        max_rate: float = None, debounce: float = None, debounce_frames: int = None, coalesce: bool = False,
+                        priority: int = None, offload: Union[bool, Callable] = False, scope: 'NoNodeScope' = None) -> None:
         """
         Register a parameter execute callback.
 
         Args:   
             event_type (ParExecType): The type of event to listen for.
-            owner (OP): The operator that owns the parameter.
-            parameter (Union[Par, str]): The parameter to watch. Can be a Par object or parameter name.
+            owner (Union[OP, List[OP]]): The operator(s) that own the parameter(s).
+            parameter (Union[Par, str, list]): The parameter(s) to watch. Can be a Par object, a parameter name or pattern
+                (whitespace and/or comma separated), a parameter Page, a parameter Sequence, or a list of these.
             callback (Callable): The callback function to be called on parameter execution.
+            max_rate, debounce, debounce_frames, coalesce, priority, offload: Optional rate limiting, deferral and offloading, see RegisterChopExec.
+            scope (NoNodeScope, optional): Register in the tables of this scope instead of the global ones, see Scope.
+
+        Parameters are matched by name when their first event arrives, so custom parameters added later are picked up.
+        Parameters matched through a page or sequence are matched again once they moved to another page or sequence.
+        With rate limiting the latest value of every parameter is delivered, not only of the last one that changed.
 
         Example:
             def my_callback(par, prev):
@@ -550,77 +1629,140 @@ class NoNode:
             
             # Using Par object from any operator
             NoNode.RegisterParExec(op('base1'), ParExecType.ValueChange, op('base1').par.v, self.my_callback)
+            # Patterns, pages and sequences of several operators at once
+            NoNode.RegisterParExec(ParExecType.ValueChange, [op('base1'), op('base2')], ['Color*', op('base1').customPages[0]], self.my_callback)
         """
-        if event_type not in cls.PAREXEC_CALLBACKS.getRaw():
-            cls.PAREXEC_CALLBACKS.setItem(event_type, {}, raw=True)
-
-        current_callbacks = cls.PAREXEC_CALLBACKS.getDependency(event_type)
-        
-        # Handle owner resolution
-        owner = owner or cls.EXT_OWNER_COMP
-        if owner not in current_callbacks.val:
-            current_callbacks.val[owner] = {}
-        
-        # Convert string parameter reference to Par object if needed
-        if isinstance(parameter, str):
-            if not hasattr(owner.par, parameter):
-                return
-            parameter = owner.par[parameter]
-
-        # Mark the operator
-        if owner is not cls.EXT_OWNER_COMP:
-            cls.__markOperatorAsWatched(owner)
-
-        current_callbacks.val[owner][parameter] = callback
-        cls.PAREXEC_CALLBACKS.setItem(event_type, current_callbacks)
+        owners = owner if isinstance(owner, (list, tuple)) else [owner]
+        selectors = cls.__parSelectors(parameter)
+
+        reg = scope or cls
+        current_callbacks = reg.PAREXEC_CALLBACKS.setdefault(event_type, {})
+        callback = cls.__entry(event_type, callback, max_rate=max_rate, debounce=debounce, debounce_frames=debounce_frames,
+                               coalesce=coalesce, priority=priority, offload=offload)
+        for owner in owners:
+            # Handle owner resolution
+            owner = owner or cls.EXT_OWNER_COMP
+
+            if owner not in current_callbacks:
+                current_callbacks[owner] = {}
+                cls.__retainOperator(owner)
+
+            for selector in selectors:
+                current_callbacks[owner][selector] = callback
+        reg.PAREXEC_TABLE.pop(event_type, None)
+        reg.PAREXEC_LAYOUT.pop(event_type, None)
+        cls.__registryChanged()
+        cls.__scheduleSweep() # drop registrations of operators deleted meanwhile
 
         if event_type in cls.PAR_EXEC_MAP:
             cls.PAR_EXEC_MAP[event_type].par.active = True
 
     @classmethod
-    def DeregisterParExec(cls, event_type: ParExecType, owner: OP, parameter: Union[Par, str] = None) -> None:
+    def DeregisterParExec(cls, event_type: ParExecType, owner: Union[OP, List[OP]], parameter: Union[Par, str, list] = None,
+                          scope: 'NoNodeScope' = None) -> None:
         """
         Deregister a parameter execute callback.
 
         Args:
             event_type (ParExecType): The event type to deregister. 
-            owner (OP): The operator that owns the parameter.
-            parameter (Union[Par, str], optional): The parameter to deregister. If None, deregisters all parameters for the owner.
-           
+            owner (Union[OP, List[OP]]): The operator(s) that own the parameter(s).
+            parameter (Union[Par, str, list], optional): The parameter(s) to deregister, as registered. If None, deregisters all parameters for the owner.
+            scope (NoNodeScope, optional): Deregister from the tables of this scope instead of the global ones, see Scope.
         """
-        if event_type not in cls.PAREXEC_CALLBACKS.getRaw():
+        reg = scope or cls
+        if event_type not in reg.PAREXEC_CALLBACKS:
             return
 
-        current_callbacks = cls.PAREXEC_CALLBACKS.getDependency(event_type)
-        
-        # Handle owner resolution
-        owner = owner or cls.EXT_OWNER_COMP
+        current_callbacks = reg.PAREXEC_CALLBACKS[event_type]
+        owners = owner if isinstance(owner, (list, tuple)) else [owner]
 
-        if parameter is None:
-            if owner in current_callbacks.val:
-                del current_callbacks.val[owner]
-                cls.__checkAndResetOperatorColor(owner)
-        else:
-            # Convert string parameter reference to Par object if needed
-            if isinstance(parameter, str):
-                if not hasattr(owner.par, parameter):
-                    return
-                parameter = owner.par[parameter]
-
-            if owner in current_callbacks.val and parameter in current_callbacks.val[owner]:
-                del current_callbacks.val[owner][parameter]
-                
-                # If no more parameters for this owner, remove the owner entry
-                if not current_callbacks.val[owner]:
-                    del current_callbacks.val[owner]
-                    cls.__checkAndResetOperatorColor(owner)
-
-        # Update callbacks
-        cls.PAREXEC_CALLBACKS.setItem(event_type, current_callbacks)
+        for owner in owners:
+            # Handle owner resolution
+            owner = owner or cls.EXT_OWNER_COMP
+            if owner not in current_callbacks:
+                continue
+
+            if parameter is not None:
+                for selector in cls.__parSelectors(parameter):
+                    current_callbacks[owner].pop(selector, None)
+
+            # If no more parameters for this owner, remove the owner entry
+            if parameter is None or not current_callbacks[owner]:
+                del current_callbacks[owner]
+                cls.__releaseOperator(owner)
+
+        reg.PAREXEC_TABLE.pop(event_type, None)
+        reg.PAREXEC_LAYOUT.pop(event_type, None)
+        cls.__registryChanged()
 
         # Disable exec if no more callbacks
-        if not current_callbacks.val:
-            cls.DisableParExec(event_type)
+        if not current_callbacks:
+            del reg.PAREXEC_CALLBACKS[event_type]
+            cls.__disableIfUnused(event_type)
+
+    @classmethod
+    def RefreshParExec(cls, event_type: ParExecType = None) -> None:
+        """
+        Drop the resolved (owner, parameter name) lookup table, so parameters are matched again on their next event.
+
+        Called by CustomParHelper whenever the custom parameter layout of its owner changes. Moves between pages and
+        sequences are also detected on the next event, so this is rarely needed by hand. Applies to every scope.
+        """
+        for reg in cls.REGISTRIES:
+            if event_type is None:
+                reg.PAREXEC_TABLE.clear()
+                reg.PAREXEC_LAYOUT.clear()
+            else:
+                reg.PAREXEC_TABLE.pop(event_type, None)
+                reg.PAREXEC_LAYOUT.pop(event_type, None)
+
+    @classmethod
+    def __parSelectors(cls, parameter: Union[Par, str, list]) -> list:
+        """Normalize the parameter argument to registry keys: names/patterns, ('page', name) or ('sequence', name)."""
+        if isinstance(parameter, tuple) and len(parameter) == 2 and parameter[0] in ('page', 'sequence'):
+            return [parameter]
+        if isinstance(parameter, (list, tuple)):
+            return [selector for item in parameter for selector in cls.__parSelectors(item)]
+        if isinstance(parameter, str):
+            return re.split(r'[,\s]+', parameter.strip())
+        if hasattr(parameter, 'blocks'):
+            return [('sequence', parameter.name)]
+        if hasattr(parameter, 'pars'):
+            return [('page', parameter.name)]
+        return [parameter.name]
+
+    @classmethod
+    def __resolveParCallbacks(cls, reg, event_type: ParExecType, parameter: Par) -> tuple:
+        """Collect the callbacks whose selectors match a parameter and store them in the lookup table."""
+        selectors = reg.PAREXEC_CALLBACKS.get(event_type, {}).get(parameter.owner, {})
+        key = (parameter.owner, parameter.name)
+        matched = set()
+        layout = None
+        names: Dict[Callable, List[str]] = {}
+        for selector, callback in selectors.items():
+            if isinstance(selector, str):
+                names.setdefault(callback, []).append(selector)
+                continue
+            layout = layout or cls.__parLayout(parameter)
+            if layout[0 if selector[0] == 'page' else 1] == selector[1]:
+                matched.add(callback)
+        for callback, patterns in names.items():
+            # like channels, exclusions apply to the names registered before them for the same callback
+            if NameFilter(patterns)(parameter.name):
+                matched.add(callback)
+        if layout is not None:
+            reg.PAREXEC_LAYOUT.setdefault(event_type, {})[key] = layout
+        # in registration order, dict.fromkeys avoids executing the same callback twice
+        callbacks = reg.PAREXEC_TABLE.setdefault(event_type, {})[key] = tuple(
+            callback for callback in dict.fromkeys(selectors.values()) if callback in matched)
+        return callbacks
+
+    @staticmethod
+    def __parLayout(parameter: Par) -> tuple:
+        """Return the names of the page and sequence of a parameter, None where it has none."""
+        page = parameter.page
+        sequence = getattr(parameter, 'sequence', None)
+        return (page.name if page is not None else None, sequence.name if sequence is not None else None)
 
     @classmethod
     def OnParExec(cls, event_type: ParExecType, parameter: Par, value = None, prev = None) -> None:
@@ -629,22 +1771,363 @@ class NoNode:
         if not cls.PAREXEC_IS_ENABLED:
             return
 
-        if event_type not in cls.PAREXEC_CALLBACKS.getRaw():
+        key = (parameter.owner, parameter.name)
+        for reg in cls.REGISTRIES:
+            table = reg.PAREXEC_TABLE.get(event_type)
+            callbacks = table.get(key) if table is not None else None
+            if callbacks is not None:
+                layouts = reg.PAREXEC_LAYOUT.get(event_type)
+                if layouts and key in layouts and layouts[key] != cls.__parLayout(parameter):
+                    callbacks = None # moved to another page or sequence since it was matched
+            if callbacks is None:
+                if event_type not in reg.PAREXEC_CALLBACKS:
+                    continue
+                callbacks = cls.__resolveParCallbacks(reg, event_type, parameter)
+
+            for callback in callbacks:
+                callback(parameter, value, prev)
+
+    ### Scopes ###
+
+    @classmethod
+    def Scope(cls, ownerComp: COMP, enable_chopexec: bool = True, enable_datexec: bool = True, enable_parexec: bool = True,
+              enable_keyboard_shortcuts: bool = True) -> 'NoNodeScope':
+        """
+        Return the registrations of one owner component, for many components sharing the same ExtUtils.
+
+        Use instead of Init: every scope has its own tables, which dispatch walks after the global ones, so the scope
+        only drops the registrations this owner made before (eg. when its extension is reinitialized), and neither
+        Init nor other scopes touch them.
+        """
+        cls.__pruneScopes()
+        if cls.EXT_OWNER_COMP is None:
+            cls.EXT_OWNER_COMP = ownerComp
+        if enable_chopexec:
+            cls.EnableChopExec()
+        if enable_datexec:
+            cls.EnableDatExec()
+        if enable_parexec:
+            cls.EnableParExec()
+        if enable_keyboard_shortcuts:
+            cls.EnableKeyboardShortcuts()
+
+        scope = cls.SCOPES.get(ownerComp)
+        if scope is None:
+            scope = cls.SCOPES[ownerComp] = NoNodeScope(ownerComp)
+            cls.REGISTRIES = (cls, *cls.SCOPES.values())
+        else:
+            scope.Clear()
+        return scope
+
+    @classmethod
+    def __pruneScopes(cls) -> None:
+        """Drop the scopes of deleted owner components."""
+        for owner in [owner for owner in cls.SCOPES if not owner.valid]:
+            cls.SCOPES.pop(owner).Clear()
+        cls.REGISTRIES = (cls, *cls.SCOPES.values())
+
+    ### Snapshot ###
+
+    @classmethod
+    def Snapshot(cls) -> dict:
+        """
+        Return a serializable copy of the registry, keyed by operator paths and method names.
+
+        Only callbacks that are methods (eg. of an extension) can be snapshotted, other callables are left out.
+        Covers the global tables, not the ones of scopes.
+        Pass the result to Init(..., extension_self=self, restore=snapshot), eg. after storing it with ownerComp.store.
+        """
+        registrations = []
+        for event_type, chops in cls.CHOPEXEC_CALLBACKS.items():
+            for chop, channels in chops.items():
+                grouped: Dict[Callable, list] = {}
+                for channel, callback in channels.items():
+                    grouped.setdefault(callback, []).append(channel)
+                for callback, channel_list in grouped.items():
+                    cls.__snapshotRecord(registrations, callback, kind='chop', event=event_type.name, op=chop.path, channels=channel_list)
+        for event_type, dats in cls.DATEXEC_CALLBACKS.items():
+            for dat, callback in dats.items():
+                cls.__snapshotRecord(registrations, callback, kind='dat', event=event_type.name, op=dat.path)
+        for dat, regions in cls.DATEXEC_REGIONS.items():
+            for region in regions:
+                cls.__snapshotRecord(registrations, region.callback, kind='dat', event=cls.DatExecType.CellChange.name, op=dat.path,
+                                     filters={name: value for name, value in region.filters.items() if value})
+        for event_type, owners in cls.PAREXEC_CALLBACKS.items():
+            for owner, pars in owners.items():
+                grouped = {}
+                for selector, callback in pars.items():
+                    grouped.setdefault(callback, []).append(selector if isinstance(selector, str) else list(selector))
+                for callback, selectors in grouped.items():
+                    cls.__snapshotRecord(registrations, callback, kind='par', event=event_type.name, op=owner.path, selectors=selectors)
+        for shortcut, callback in cls.KEYBOARD_CALLBACKS.items():
+            cls.__snapshotRecord(registrations, callback, kind='keyboard', shortcut=shortcut)
+        return {'registrations': registrations}
+
+    @classmethod
+    def __snapshotRecord(cls, registrations: list, callback: Callable, **record) -> None:
+        """Append the record of a registry entry, if its callback is a method."""
+        while not isinstance(callback, _WeakCallback) and hasattr(callback, 'callback'):
+            callback = callback.callback # unwrap rate limiting, scheduling, offloading and profiling wrappers
+        if isinstance(callback, _WeakCallback):
+            method, extension, options = callback.method, callback.extension, dict(callback.options)
+        elif inspect.ismethod(callback): # keyboard shortcuts are stored as is
+            method, extension, options = callback.__func__.__name__, type(callback.__self__).__qualname__, {}
+        else:
             return
+        offload = options.get('offload')
+        if callable(offload):
+            if not inspect.ismethod(offload) or type(offload.__self__).__qualname__ != extension:
+                return
+            options['offload'] = offload.__func__.__name__
+        if method is not None:
+            registrations.append(dict(record, method=method, extension=extension, options=options))
+
+    @classmethod
+    def __restore(cls, snapshot: dict, extension_self) -> int:
+        """
+        Rebuild the snapshotted registrations of an extension's class on its new instance and swap them in at once.
+
+        The registry tables are built aside, without going through the Register methods, so nothing is recolored,
+        reindexed or reactivated per registration. Init recounts the watched operators afterwards.
+        """
+        extension = type(extension_self).__qualname__
+        tables = {'CHOPEXEC_CALLBACKS': {}, 'DATEXEC_CALLBACKS': {}, 'DATEXEC_REGIONS': {}, 'PAREXEC_CALLBACKS': {}, 'KEYBOARD_CALLBACKS': {}}
+        restored = 0
+        for record in snapshot.get('registrations', ()):
+            callback = getattr(extension_self, record['method'], None) if record['extension'] == extension else None
+            options = dict(record['options'])
+            if isinstance(options.get('offload'), str):
+                options['offload'] = getattr(extension_self, options['offload'], None)
+                if options['offload'] is None:
+                    continue
+            if callback is None:
+                continue
+            if record['kind'] == 'keyboard':
+                tables['KEYBOARD_CALLBACKS'][record['shortcut']] = cls.__instrument(callback, f"Keyboard.{record['shortcut']}")
+                restored += 1
+                continue
+            _op = op(record['op'])
+            if _op is None:
+                continue
+            kind = record['kind']
+            if kind == 'chop':
+                event_type = cls.ChopExecType[record['event']]
+                table = tables['CHOPEXEC_CALLBACKS'].setdefault(event_type, {})
+                entry = cls.__entry(event_type, callback, **options)
+                names = record['channels']
+            elif kind == 'par':
+                event_type = cls.ParExecType[record['event']]
+                table = tables['PAREXEC_CALLBACKS'].setdefault(event_type, {})
+                entry = cls.__entry(event_type, callback, **options)
+                names = [tuple(selector) if isinstance(selector, list) else selector for selector in record['selectors']]
+            elif record.get('filters'):
+                region = _DatRegion(None, **record['filters'])
+                region.callback = cls.__entry(cls.DatExecType[record['event']], callback, region=True, **options)
+                tables['DATEXEC_REGIONS'].setdefault(_op, []).append(region)
+                restored += 1
+                continue
+            else:
+                event_type = cls.DatExecType[record['event']]
+                table = tables['DATEXEC_CALLBACKS'].setdefault(event_type, {})
+                entry = cls.__entry(event_type, callback, **options)
+                names = None
+            if _op not in table:
+                table[_op] = {} if names is not None else entry
+            if names is not None:
+                table[_op].update(dict.fromkeys(names, entry))
+            restored += 1
+
+        for name, table in tables.items():
+            setattr(cls, name, table)
+        for event_type, chops in cls.CHOPEXEC_CALLBACKS.items():
+            for chop in chops:
+                cls.__invalidateChopIndex(cls, event_type, chop)
+        if restored:
+            cls.__registryChanged()
+            cls.__scheduleSweep() # drop registrations of operators deleted meanwhile
+        return restored
+
+    ### Frame budget ###
+
+    @classmethod
+    def SetFrameBudget(cls, budget_ms: float = None) -> None:
+        """
+        Limit the time spent per frame on callbacks registered with a priority, None for no limit.
+
+        Example:
+            NoNode.SetFrameBudget(4) # ms
+            NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, op('show'), '*', self.on_cue, priority=10)
+            NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, op('ui_table'), self.rebuild_ui, priority=-10)
+        """
+        cls.SCHEDULER.SetBudget(budget_ms)
 
-        owner = parameter.owner
-        if owner not in cls.PAREXEC_CALLBACKS.getRaw()[event_type]:
+    ### Profiling ###
+
+    @classmethod
+    def EnableProfiling(cls, dat: DAT = None, window: int = None) -> None:
+        """
+        Time every registered callback until DisableProfiling is called. Costs nothing while disabled.
+
+        Args:
+            dat (DAT, optional): A tableDAT that is filled with the stats at the end of every frame with calls.
+            window (int, optional): Number of latest durations kept per callback for the p95, default PROFILE_WINDOW.
+        """
+        if window:
+            cls.PROFILE_WINDOW = window
+        cls.PROFILE_DAT = dat
+        if not cls.PROFILE_IS_ENABLED:
+            cls.PROFILE_IS_ENABLED = True
+            cls.__instrumentRegistries()
+
+    @classmethod
+    def DisableProfiling(cls) -> None:
+        """Stop timing callbacks, the collected stats are kept until ResetStats."""
+        if cls.PROFILE_IS_ENABLED:
+            cls.PROFILE_IS_ENABLED = False
+            cls.__instrumentRegistries()
+
+    @classmethod
+    def ResetStats(cls) -> None:
+        """Clear the collected stats."""
+        for stats in cls.PROFILE_STATS.values():
+            stats.Reset(cls.PROFILE_WINDOW)
+
+    @classmethod
+    def Stats(cls) -> Dict[str, dict]:
+        """
+        Return the stats per callback, the most expensive first.
+
+        Example:
+            NoNode.EnableProfiling()
+            ...
+            for label, stats in NoNode.Stats().items():
+                print(label, stats['count'], stats['total_ms'], stats['mean_ms'], stats['p95_ms'])
+        """
+        summaries = {label: stats.Summary() for label, stats in cls.PROFILE_STATS.items() if stats.count}
+        return dict(sorted(summaries.items(), key=lambda item: item[1]['total_ms'], reverse=True))
+
+    @classmethod
+    def __instrument(cls, callback: Callable, label: str) -> Callable:
+        """Wrap the innermost callable of a registry entry in a _ProfiledCallback, or unwrap it when profiling is disabled."""
+        if isinstance(callback, (_ScheduledCallback, CallPolicy, _OffloadedCallback)):
+            # time the call itself, not its deferral, rate limiting or submission to the thread pool
+            callback.callback = cls.__instrument(callback.callback, label)
+            return callback
+        if isinstance(callback, _ProfiledCallback):
+            return callback if cls.PROFILE_IS_ENABLED else callback.callback
+        if not cls.PROFILE_IS_ENABLED:
+            return callback
+        label = f"{label} {getattr(callback, 'name', None) or getattr(callback, '__qualname__', type(callback).__name__)}"
+        stats = cls.PROFILE_STATS.get(label)
+        if stats is None:
+            stats = cls.PROFILE_STATS[label] = _CallStats(cls.PROFILE_WINDOW)
+        return _ProfiledCallback(callback, stats, on_call=cls.__scheduleStatsTable)
+
+    @classmethod
+    def __instrumentRegistries(cls) -> None:
+        """(Un)wrap the registered callbacks of the global tables and all scopes according to PROFILE_IS_ENABLED."""
+        for reg in cls.REGISTRIES:
+            for event_type, chops in reg.CHOPEXEC_CALLBACKS.items():
+                for chop, channels in chops.items():
+                    # channels sharing a callback keep sharing one wrapper, so the index still deduplicates them
+                    wrapped = {callback: cls.__instrument(callback, f'ChopExec.{event_type.name}') for callback in channels.values()}
+                    for channel, callback in channels.items():
+                        channels[channel] = wrapped[callback]
+                    cls.__invalidateChopIndex(reg, event_type, chop)
+            for event_type, dats in reg.DATEXEC_CALLBACKS.items():
+                for dat, callback in dats.items():
+                    dats[dat] = cls.__instrument(callback, f'DatExec.{event_type.name}')
+            for regions in reg.DATEXEC_REGIONS.values():
+                for region in regions:
+                    region.callback = cls.__instrument(region.callback, 'DatExec.CellChange')
+            for event_type, owners in reg.PAREXEC_CALLBACKS.items():
+                for pars in owners.values():
+                    wrapped = {callback: cls.__instrument(callback, f'ParExec.{event_type.name}') for callback in pars.values()}
+                    for selector, callback in pars.items():
+                        pars[selector] = wrapped[callback]
+            for shortcut, callback in list(reg.KEYBOARD_CALLBACKS.items()):
+                reg.KEYBOARD_CALLBACKS[shortcut] = cls.__instrument(callback, f'Keyboard.{shortcut}')
+        cls.RefreshParExec()
+
+    @classmethod
+    def __scheduleStatsTable(cls) -> None:
+        """Fill the stats tableDAT at the end of the frame, if it is not scheduled already."""
+        if cls.PROFILE_DAT is not None and not cls.PROFILE_DAT_SCHEDULED:
+            cls.PROFILE_DAT_SCHEDULED = True
+            run('args[0]()', cls.__updateStatsTable, endFrame=True)
+
+    @classmethod
+    def __updateStatsTable(cls) -> None:
+        cls.PROFILE_DAT_SCHEDULED = False
+        dat = cls.PROFILE_DAT
+        if dat is None or not dat.valid:
             return
+        dat.clear()
+        dat.appendRow(['callback', 'count', 'total_ms', 'mean_ms', 'p95_ms'])
+        for label, stats in cls.Stats().items():
+            dat.appendRow([label, stats['count'], f"{stats['total_ms']:.3f}", f"{stats['mean_ms']:.3f}", f"{stats['p95_ms']:.3f}"])
 
-        callback = cls.PAREXEC_CALLBACKS.getRaw()[event_type][owner].get(parameter)
-        
-        if callback:
-            arg_count = callback.__code__.co_argcount
-            if arg_count == 1:
-                callback()
-            elif arg_count == 2:
-                callback(value if event_type == cls.ParExecType.ValueChange else parameter)
-            elif arg_count == 3:
-                callback(parameter, value)
-            elif arg_count == 4:
-                callback(parameter, value, prev)
+
+class NoNodeScope:
+    '''
+    Registrations of one owner component, returned by NoNode.Scope(ownerComp).
+
+    Mirrors the Register/Deregister API of NoNode (with the same options) on tables of its own, named like the global
+    tables of NoNode. Dispatch walks the global tables and then every scope, so Clear, reinitializing the component or
+    NoNode.Init never touch the registrations of other components. The exec DATs, operator marking, scheduler and
+    offloader are shared.
+    '''
+    __slots__ = ('ownerComp', 'CHOPEXEC_CALLBACKS', 'CHOPEXEC_INDEX', 'CHOPEXEC_DIRTY', 'CHOP_BATCH_WATCHERS', 'DATEXEC_CALLBACKS',
+                 'DATEXEC_REGIONS', 'PAREXEC_CALLBACKS', 'PAREXEC_TABLE', 'PAREXEC_LAYOUT', 'KEYBOARD_CALLBACKS')
+
+    def __init__(self, ownerComp: COMP):
+        self.ownerComp = ownerComp
+        self.CHOPEXEC_CALLBACKS: Dict[NoNode.ChopExecType, Dict[CHOP, Dict[str, Callable]]] = {}
+        self.CHOPEXEC_INDEX: Dict[NoNode.ChopExecType, Dict[CHOP, _ChannelIndex]] = {}
+        self.CHOPEXEC_DIRTY: set[tuple] = set()
+        self.CHOP_BATCH_WATCHERS: Dict[CHOP, _ChopBatchWatcher] = {}
+        self.DATEXEC_CALLBACKS: Dict[NoNode.DatExecType, Dict[DAT, Callable]] = {}
+        self.DATEXEC_REGIONS: Dict[DAT, List[_DatRegion]] = {}
+        self.PAREXEC_CALLBACKS: Dict[NoNode.ParExecType, Dict[OP, Dict[Union[str, tuple], Callable]]] = {}
+        self.PAREXEC_TABLE: Dict[NoNode.ParExecType, Dict[tuple, tuple]] = {}
+        self.PAREXEC_LAYOUT: Dict[NoNode.ParExecType, Dict[tuple, tuple]] = {}
+        self.KEYBOARD_CALLBACKS: Dict[str, Callable] = {}
+
+    def RegisterChopExec(self, event_type: NoNode.ChopExecType, chop: CHOP, channels: Union[str, List[str]], callback: Callable, **options) -> None:
+        NoNode.RegisterChopExec(event_type, chop, channels, callback, scope=self, **options)
+
+    def RegisterDatExec(self, event_type: NoNode.DatExecType, dat: DAT, callback: Callable, **options) -> None:
+        NoNode.RegisterDatExec(event_type, dat, callback, scope=self, **options)
+
+    def RegisterParExec(self, event_type: NoNode.ParExecType, owner: Union[OP, List[OP]], parameter: Union[Par, str, list],
+                        callback: Callable, **options) -> None:
+        NoNode.RegisterParExec(event_type, owner or self.ownerComp, parameter, callback, scope=self, **options)
+
+    def RegisterKeyboardShortcut(self, shortcut: str, callback: Callable) -> None:
+        NoNode.RegisterKeyboardShortcut(shortcut, callback, scope=self)
+
+    def DeregisterChopExec(self, event_type: NoNode.ChopExecType, chop: CHOP = None, channels: Union[str, List[str]] = None) -> None:
+        NoNode.DeregisterChopExec(event_type, chop, channels, scope=self)
+
+    def DeregisterDatExec(self, event_type: NoNode.DatExecType, dat: DAT = None, callback: Callable = None, **filters) -> None:
+        NoNode.DeregisterDatExec(event_type, dat, callback, scope=self, **filters)
+
+    def DeregisterParExec(self, event_type: NoNode.ParExecType, owner: Union[OP, List[OP]] = None, parameter: Union[Par, str, list] = None) -> None:
+        NoNode.DeregisterParExec(event_type, owner or self.ownerComp, parameter, scope=self)
+
+    def DeregisterKeyboardShortcut(self, shortcut: str) -> None:
+        NoNode.DeregisterKeyboardShortcut(shortcut, scope=self)
+
+    def Clear(self) -> None:
+        """Deregister everything registered through this scope."""
+        for event_type in list(self.CHOPEXEC_CALLBACKS):
+            NoNode.DeregisterChopExec(event_type, scope=self)
+        for event_type in {*self.DATEXEC_CALLBACKS, *([NoNode.DatExecType.CellChange] if self.DATEXEC_REGIONS else [])}:
+            NoNode.DeregisterDatExec(event_type, scope=self)
+        for event_type, owners in list(self.PAREXEC_CALLBACKS.items()):
+            NoNode.DeregisterParExec(event_type, list(owners), scope=self)
+        for shortcut in list(self.KEYBOARD_CALLBACKS):
+            NoNode.DeregisterKeyboardShortcut(shortcut, scope=self)
+
+
+NoNode.REGISTRIES = (NoNode,)
@@ -0,0 +1,276 @@
+'''
+Scheduling building blocks of NoNode: rate limiting, frame budgeted deferral and offloading of callbacks.
+
+Nothing in here touches TouchDesigner. Clocks, frame counters and the function that defers a call
+(`schedule(callback, frames=0, ms=0.0)`) are passed in, NoNode hands in TouchDesigner's `run()` and
+`absTime.frame`, tests hand in fakes.
+'''
+import math
+import time
+import heapq
+import itertools
+import queue
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+# plain stand-ins for TouchDesigner objects handed to offloaded callbacks, see to_plain
+ChopValues = namedtuple('ChopValues', ['path', 'names'])
+ChannelValues = namedtuple('ChannelValues', ['owner', 'name', 'index', 'vals'])
+ParValue = namedtuple('ParValue', ['owner', 'name', 'val'])
+CellValue = namedtuple('CellValue', ['row', 'col', 'val'])
+
+
+class CallPolicy:
+    '''
+    Throttle, debounce and latest-value-wins coalescing for a NoNode callback.
+
+    Events are stored per key (eg. per channel), only the latest arguments of each key are kept, and they are
+    flushed through `schedule`, so the wrapped callback runs at most once per window and key. Pass `merge` to
+    combine the pending arguments of a key with newer ones instead of replacing them (eg. to keep every cell of
+    a table change). `frame` is only needed with `debounce_frames`.
+    '''
+    __slots__ = ('callback', 'interval', 'debounce', 'debounceFrames', 'coalesce', 'key', 'merge', 'clock', 'frame',
+                 'schedule', 'pending', 'lastCall', 'deadline', 'deadlineFrame', 'scheduled')
+
+    def __init__(self, callback: Callable, schedule: Callable, max_rate: float = None, debounce: float = None,
+                 debounce_frames: int = None, coalesce: bool = False, key: Callable = None, merge: Callable = None,
+                 clock: Callable = None, frame: Callable = None) -> None:
+        if debounce_frames and frame is None:
+            raise ValueError("debounce_frames needs a frame counter")
+        self.callback = callback
+        self.interval = 1.0 / max_rate if max_rate else 0.0
+        self.debounce = debounce / 1000.0 if debounce else 0.0
+        self.debounceFrames = debounce_frames or 0
+        self.coalesce = coalesce
+        self.key = key
+        self.merge = merge
+        self.clock = clock or time.perf_counter
+        self.frame = frame
+        self.schedule = schedule
+        self.pending: dict = {}
+        self.lastCall = -math.inf
+        self.deadline = 0.0
+        self.deadlineFrame = 0
+        self.scheduled = False
+
+    @property
+    def alive(self) -> bool:
+        """False once the wrapped callback's owner is gone."""
+        return getattr(self.callback, 'alive', True)
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, 'name', type(self).__name__)
+
+    def __call__(self, *args) -> None:
+        """Submit an event, calling through right away only if a throttle window allows it."""
+        now = self.clock()
+        if (not self.pending and not (self.coalesce or self.debounce or self.debounceFrames)
+                and now - self.lastCall >= self.interval):
+            self.lastCall = now
+            self.callback(*args)
+            return
+        key = self.key(args) if self.key else None
+        if self.merge is not None and key in self.pending:
+            args = self.merge(self.pending[key], args)
+        self.pending[key] = args
+        if self.debounceFrames:
+            self.deadlineFrame = self.frame() + self.debounceFrames
+        if self.debounce:
+            self.deadline = now + self.debounce
+        elif not self.debounceFrames:
+            self.deadline = max(now, self.lastCall + self.interval)
+        self.__schedule(now)
+
+    def __schedule(self, now: float) -> None:
+        if self.scheduled:
+            return
+        self.scheduled = True
+        if self.debounceFrames:
+            self.schedule(self.Flush, frames=max(1, self.deadlineFrame - self.frame()))
+        else:
+            self.schedule(self.Flush, ms=max(0.0, (self.deadline - now) * 1000.0))
+
+    def Flush(self) -> None:
+        """Call the callback with the latest pending arguments once their window has passed."""
+        self.scheduled = False
+        if not self.pending:
+            return
+        now = self.clock()
+        if now < self.deadline or (self.debounceFrames and self.frame() < self.deadlineFrame):
+            # debounce got extended by newer events meanwhile
+            self.__schedule(now)
+            return
+        pending, self.pending = self.pending, {}
+        self.lastCall = now
+        for args in pending.values():
+            self.callback(*args)
+
+
+class FrameScheduler:
+    '''
+    Priority queue of deferred NoNode callbacks with a per-frame time budget.
+
+    Submitted calls are drained at the end of the frame, highest priority first and in submission order
+    within a priority. Once the budget is used up the rest carries over to the next frame, where it is
+    drained again in priority order, nothing is dropped. At least one call runs per drain, so a callback
+    exceeding the budget on its own still makes progress.
+    '''
+    def __init__(self, schedule: Callable, budget_ms: float = None, clock: Callable = None) -> None:
+        self.budget = budget_ms / 1000.0 if budget_ms else None
+        self.clock = clock or time.perf_counter
+        self.schedule = schedule
+        self.queue: List[tuple] = []
+        self.counter = itertools.count()
+        self.scheduled = False
+
+    @property
+    def Pending(self) -> int:
+        """Number of calls waiting in the queue."""
+        return len(self.queue)
+
+    def SetBudget(self, budget_ms: float = None) -> None:
+        """Set the time budget per frame in milliseconds, None for no limit."""
+        self.budget = budget_ms / 1000.0 if budget_ms else None
+
+    def Submit(self, callback: Callable, args: tuple = (), priority: int = 0) -> None:
+        """Queue a call, higher priorities run first."""
+        heapq.heappush(self.queue, (-priority, next(self.counter), callback, args))
+        if not self.scheduled:
+            self.scheduled = True
+            self.schedule(self.Drain)
+
+    def Drain(self) -> int:
+        """Run queued calls until the budget is used up, returns the number of calls made."""
+        self.scheduled = False
+        start = self.clock()
+        ran = 0
+        try:
+            while self.queue:
+                _, _, callback, args = heapq.heappop(self.queue)
+                ran += 1
+                callback(*args)
+                if self.budget is not None and self.clock() - start >= self.budget:
+                    break
+        finally:
+            if self.queue and not self.scheduled:
+                self.scheduled = True
+                self.schedule(self.Drain, frames=1)
+        return ran
+
+
+class Offloader:
+    '''
+    Runs NoNode callbacks in a thread pool and marshals their results back to the main thread.
+
+    Finished jobs are put into a thread-safe queue that `Drain` empties at the end of the frame (through
+    `schedule`), polling once per frame while jobs are running. Results
+    are handed to `on_result` and exceptions are re-raised there, on the main thread. A job submitted with
+    the key of a running one supersedes it: the older job is cancelled if it didn't start yet, its result dropped
+    otherwise. Jobs only get the arguments they are submitted with, see to_plain for turning TouchDesigner objects
+    into plain values first.
+    '''
+    def __init__(self, schedule: Callable, max_workers: int = 4, executor: ThreadPoolExecutor = None) -> None:
+        self.maxWorkers = max_workers
+        self.executor = executor
+        self.schedule = schedule
+        self.results = queue.SimpleQueue()
+        self.latest: Dict[object, Future] = {}
+        self.running = 0
+        self.scheduled = False
+
+    @property
+    def Pending(self) -> int:
+        """Number of submitted jobs whose results weren't drained yet."""
+        return self.running
+
+    def Submit(self, fn: Callable, args: tuple = (), key = None, on_result: Callable = None) -> Future:
+        """Run fn(*args) in the pool, on_result receives the result on the main thread."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix='NoNode')
+        if key is not None and key in self.latest:
+            self.latest[key].cancel()
+        future = self.executor.submit(fn, *args)
+        if key is not None:
+            self.latest[key] = future
+        self.running += 1
+        # done callbacks run in the worker thread, only the queue is touched there (the one of this
+        # submission, so jobs still finishing after a Shutdown can't report into the new one)
+        results = self.results
+        future.add_done_callback(lambda done: results.put((key, done, on_result)))
+        self.__scheduleDrain()
+        return future
+
+    def __scheduleDrain(self, frames: int = 0) -> None:
+        if not self.scheduled:
+            self.scheduled = True
+            self.schedule(self.Drain, frames=frames)
+
+    def Drain(self) -> int:
+        """Deliver the finished jobs on the main thread in the order they finished, returns the number of results delivered."""
+        self.scheduled = False
+        delivered = 0
+        errors = []
+        while True:
+            try:
+                key, future, on_result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.running -= 1
+            if key is not None:
+                if self.latest.get(key) is not future:
+                    continue # superseded by a newer job
+                del self.latest[key]
+            if future.cancelled():
+                continue
+            error = future.exception()
+            try:
+                if error is not None:
+                    raise error
+                if on_result is not None:
+                    on_result(future.result())
+                delivered += 1
+            except Exception as e:
+                errors.append(e)
+        if self.running:
+            self.__scheduleDrain(frames=1)
+        if errors:
+            raise errors[0]
+        return delivered
+
+    def Shutdown(self) -> None:
+        """Cancel the jobs that didn't start yet and drop all pending results, running jobs finish unnoticed."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.latest.clear()
+        self.results = queue.SimpleQueue()
+        self.running = 0
+
+
+def to_plain(value):
+    """
+    Turn TouchDesigner objects into plain values that are safe to read off the main thread, recursing into lists and tuples.
+
+    Objects are recognized by their attributes: a DAT becomes a list of rows of cell strings, a CHOP a ChopValues,
+    a Channel a ChannelValues (with a tuple of its sample values), a Par a ParValue with its evaluated value, a Cell a
+    CellValue and any other operator its path. Everything else (numbers, strings, numpy arrays) is passed through.
+    """
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return type(value)(to_plain(item) for item in value)
+    if hasattr(value, 'rows') and hasattr(value, 'numRows'):
+        return [[cell.val for cell in row] for row in value.rows()]
+    if hasattr(value, 'chans') and hasattr(value, 'numChans'):
+        return ChopValues(value.path, tuple(chan.name for chan in value.chans()))
+    if hasattr(value, 'vals') and hasattr(value, 'index') and hasattr(value, 'owner'):
+        return ChannelValues(value.owner.path, value.name, value.index, tuple(value.vals))
+    if hasattr(value, 'eval') and hasattr(value, 'owner') and hasattr(value, 'name'):
+        return ParValue(value.owner.path, value.name, value.eval())
+    if hasattr(value, 'row') and hasattr(value, 'col') and hasattr(value, 'val'):
+        return CellValue(value.row, value.col, value.val)
+    if hasattr(value, 'path') and hasattr(value, 'valid'):
+        return value.path
+    return value
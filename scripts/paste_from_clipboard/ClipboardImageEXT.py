@@ -7,6 +7,8 @@ Features:
 - Position image at mouse location
 - Options to save as TOP or component
 - Automatically uses image's native resolution
+- Optionally saves PNGs on a background thread so large pastes don't block the UI
+- Reuses the saved file when the same image is pasted again, with a size-budgeted cache folder
 """
 from TDStoreTools import StorageManager
 import TDFunctions as TDF
@@ -14,9 +16,41 @@ import os
 import time
 import uuid
 import sys
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from dot_chat_util import DotChatUtil
 
+def _ensure_module(name):
+    """
+    Make a helper module of the extension importable
+    Components saved before it shipped as a DAT next to the extension load it from the folder the extension is synced to,
+    adding a text DAT of that name next to the extension fixes them for good
+    """
+    try:
+        __import__(name)
+        return
+    except ImportError:
+        pass
+    synced = me.par.file.eval() if hasattr(me.par, 'file') else ''
+    path = os.path.join(os.path.dirname(synced), f'{name}.py') if synced else None
+    if path is None or not os.path.isfile(path):
+        raise ImportError(f"{name} not found, add a text DAT named '{name}' next to {me.path} with the contents of {name}.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = sys.modules[name] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+# In dependency order, image_cache imports png_writer
+for _module_name in ('dib_decoder', 'png_writer', 'image_cache'):
+    _ensure_module(_module_name)
+
+from dib_decoder import decode_dib, read_header, DIBError
+from png_writer import write_png
+from image_cache import ImageCache
+
+# Index changes of a burst of pastes are written together, this long after the first one
+INDEX_FLUSH_DELAY_MS = 1000
+
 class ClipboardImageEXT(DotChatUtil):
     """
     ClipboardImageEXT allows pasting images from clipboard directly into TouchDesigner networks.
@@ -35,6 +69,14 @@ class ClipboardImageEXT(DotChatUtil):
         self.logger.log('ClipboardImageEXT initialized', 'INFO')
         # Add a flag to prevent double execution
         self._is_pasting = False
+        # Background PNG saves: (future, movie TOP) waiting to be swapped in on the main thread,
+        # the future's result is (digest, file path)
+        self._save_executor = None
+        self._pending_saves = []
+        self._polling_saves = False
+        # Content-addressed index of saved images, created for the current Folderpath on first use
+        self._image_cache = None
+        self._flush_scheduled = False
         # Setup parameters
         self.setup_parameters()
         
@@ -70,33 +112,6 @@ class ClipboardImageEXT(DotChatUtil):
         self.CF_DIB = 8
         self.CF_DIBV5 = 17
         
-        # Define bitmap header structure
-        class BITMAPINFOHEADER(ctypes.Structure):
-            _fields_ = [
-                ("biSize", wintypes.DWORD),
-                ("biWidth", wintypes.LONG),
-                ("biHeight", wintypes.LONG),
-                ("biPlanes", wintypes.WORD),
-                ("biBitCount", wintypes.WORD),
-                ("biCompression", wintypes.DWORD),
-                ("biSizeImage", wintypes.DWORD),
-                ("biXPelsPerMeter", wintypes.LONG),
-                ("biYPelsPerMeter", wintypes.LONG),
-                ("biClrUsed", wintypes.DWORD),
-                ("biClrImportant", wintypes.DWORD),
-            ]
-        self.BITMAPINFOHEADER = BITMAPINFOHEADER
-        
-        # Define RGB quad for color table
-        class RGBQUAD(ctypes.Structure):
-            _fields_ = [
-                ("rgbBlue", ctypes.c_ubyte),
-                ("rgbGreen", ctypes.c_ubyte),
-                ("rgbRed", ctypes.c_ubyte),
-                ("rgbReserved", ctypes.c_ubyte),
-            ]
-        self.RGBQUAD = RGBQUAD
-        
         # Get Windows DLLs
         self.user32 = ctypes.windll.user32
         self.kernel32 = ctypes.windll.kernel32
@@ -181,6 +196,16 @@ class ClipboardImageEXT(DotChatUtil):
                             default=True,
                             help_text='Position image at current mouse location')
         
+        self.create_parameter('Asyncsave', 'bool', 'Settings',
+                            label='Save in Background',
+                            default=True,
+                            help_text='Encode and write the PNG on a worker thread, the Movie File In TOP shows a placeholder until it is done')
+        
+        self.create_parameter('Cachebudget', 'int', 'Settings',
+                            label='Cache Budget (MB)',
+                            default=1024,
+                            help_text='Least recently pasted images are deleted when the save folder grows past this size, 0 disables eviction')
+        
         # Status indicators
         self.create_parameter('Status', 'str', 'Settings',
                             section=True,
@@ -313,20 +338,21 @@ class ClipboardImageEXT(DotChatUtil):
                         self.logger.log(f"[ClipboardImageEXT] Format ID: {format_id}", 'INFO')
                     format_id = self.EnumClipboardFormats(format_id)
                 
-                # Check for DIB format first (preferred)
-                h_dib = self.GetClipboardData(self.CF_DIB)
-                if h_dib and h_dib != 0:
-                    h_dib_uint = self.ctypes.c_void_p(h_dib).value
-                    self.logger.log(f"[ClipboardImageEXT] DIB data found: handle 0x{h_dib_uint:X}", 'INFO')
-                    return self._process_dib_handle(h_dib)
-                
-                # Check for DIBV5 format if DIB not available
+                # Check for DIBV5 format first (preferred), its header carries the alpha mask
+                # that Windows drops when it synthesizes CF_DIB from a V5 source
                 h_dibv5 = self.GetClipboardData(self.CF_DIBV5)
                 if h_dibv5 and h_dibv5 != 0:
                     h_dibv5_uint = self.ctypes.c_void_p(h_dibv5).value
                     self.logger.log(f"[ClipboardImageEXT] DIBV5 data found: handle 0x{h_dibv5_uint:X}", 'INFO')
                     return self._process_dib_handle(h_dibv5)
                 
+                # Check for DIB format if DIBV5 not available
+                h_dib = self.GetClipboardData(self.CF_DIB)
+                if h_dib and h_dib != 0:
+                    h_dib_uint = self.ctypes.c_void_p(h_dib).value
+                    self.logger.log(f"[ClipboardImageEXT] DIB data found: handle 0x{h_dib_uint:X}", 'INFO')
+                    return self._process_dib_handle(h_dib)
+                
                 self.logger.log("[ClipboardImageEXT] No image data found in clipboard", 'INFO')
                 return None
                 
@@ -361,16 +387,16 @@ class ClipboardImageEXT(DotChatUtil):
             
             try:
                 # Only check for the presence of supported formats
-                # Check for DIB format first (preferred)
-                h_dib = self.GetClipboardData(self.CF_DIB)
-                if h_dib and h_dib != 0:
-                    return True
-                
-                # Check for DIBV5 format if DIB not available
+                # Check for DIBV5 format first (preferred)
                 h_dibv5 = self.GetClipboardData(self.CF_DIBV5)
                 if h_dibv5 and h_dibv5 != 0:
                     return True
                 
+                # Check for DIB format if DIBV5 not available
+                h_dib = self.GetClipboardData(self.CF_DIB)
+                if h_dib and h_dib != 0:
+                    return True
+                
                 # Check for bitmap format as last resort
                 h_bitmap = self.GetClipboardData(self.CF_BITMAP)
                 if h_bitmap and h_bitmap != 0:
@@ -393,12 +419,6 @@ class ClipboardImageEXT(DotChatUtil):
     
     def _process_dib_handle(self, h_dib):
         """Process DIB handle and convert to numpy array without PIL"""
-        try:
-            import numpy as np
-        except ImportError:
-            self.logger.log("numpy is required but not available", 'ERROR')
-            return None
-        
         # Lock the memory
         data_ptr = self.GlobalLock(h_dib)
         if not data_ptr:
@@ -407,157 +427,37 @@ class ClipboardImageEXT(DotChatUtil):
             return None
         
         try:
-            # Get the BITMAPINFOHEADER
-            header = self.ctypes.cast(data_ptr, self.ctypes.POINTER(self.BITMAPINFOHEADER)).contents
-            
-            # Verify header size
-            if header.biSize < self.ctypes.sizeof(self.BITMAPINFOHEADER):
-                self.logger.log(f"Invalid DIB header size: {header.biSize}", 'ERROR')
-                return None
-            
-            # Get image dimensions and color depth
-            width = header.biWidth
-            height = abs(header.biHeight)  # Height can be negative for top-down DIBs
-            bit_count = header.biBitCount
-            is_top_down = header.biHeight < 0
-            
-            self.logger.log(f"[ClipboardImageEXT] Image info: {width}x{height}, {bit_count} bits per pixel", 'INFO')
-            self.logger.log(f"[ClipboardImageEXT] Image orientation: {'top-down' if is_top_down else 'bottom-up'}", 'INFO')
-            
-            # Calculate color table size
-            clr_used = header.biClrUsed
-            if clr_used == 0 and bit_count < 16:
-                clr_used = 1 << bit_count
-            
-            # Calculate offsets
-            palette_size = clr_used * self.ctypes.sizeof(self.RGBQUAD)
-            bits_offset = header.biSize + palette_size
-            
-            # For BI_BITFIELDS compression (type 3), we have three additional DWORDs
-            if header.biCompression == 3 and bit_count >= 16:
-                bits_offset += 12  # 3 DWORDs (4 bytes each)
+            # Wrap the locked memory in place instead of copying it; the decoder only reads
+            # through views and writes into its own output, so nothing references it after unlocking
+            data_size = self.GlobalSize(h_dib)
+            dib_data = (self.ctypes.c_ubyte * data_size).from_address(data_ptr)
             
-            # Get the image data directly using ctypes and pointer arithmetic
-            header_ptr = self.ctypes.cast(data_ptr, self.ctypes.c_void_p)
-            bits_ptr = self.ctypes.c_void_p(header_ptr.value + bits_offset)
+            header = read_header(dib_data)
+            self.logger.log(f"[ClipboardImageEXT] Image info: {header.width}x{header.height}, {header.bit_count} bits per pixel", 'INFO')
+            self.logger.log(f"[ClipboardImageEXT] Image orientation: {'top-down' if header.top_down else 'bottom-up'}", 'INFO')
             
-            # Calculate bytes per row (with padding to DWORD boundary)
-            bytes_per_pixel = bit_count // 8
-            if bit_count < 8:
-                bytes_per_pixel = 1
-                    
-            row_size = ((width * bit_count + 31) // 32) * 4
-            image_size = row_size * height
+            # Rows come back bottom row first, as copyNumpyArray expects
+            return decode_dib(dib_data, header)
             
-            # Get total data size
-            data_size = self.GlobalSize(h_dib)
+        except DIBError as e:
+            self.logger.log(f"Unsupported DIB data: {str(e)}", 'ERROR')
+            return None
             
-            # Safety check for buffer overrun
-            if bits_offset + image_size > data_size:
-                image_size = data_size - bits_offset
-                if image_size <= 0:
-                    self.logger.log("Invalid image size calculation", 'ERROR')
-                    return None
-            
-            # Direct approach for 32-bit BGRA
-            if bit_count == 32:
-                # Create a ctypes array for the image data
-                pixel_type = self.ctypes.c_ubyte * image_size
-                pixel_array = pixel_type()
-                
-                # Copy the data from the DIB to our buffer
-                self.ctypes.memmove(pixel_array, bits_ptr, image_size)
-                
-                # Convert to numpy array
-                array = np.frombuffer(pixel_array, dtype=np.uint8).reshape((height, width, 4))
-                
-                # Convert BGRA to RGBA using numpy
-                rgba = array[:, :, [2, 1, 0, 3]].copy()  # Important: create a contiguous copy!
-                
-                # Note: When using ctypes directly, we don't need to flip the image
-                # This would only be necessary if using PIL's ImageGrab
-                # if not is_top_down:
-                #     rgba = np.flip(rgba, 0).copy()
-                
-                # Ensure the array is contiguous and has the right stride for TouchDesigner
-                rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
-                
-                # Return the numpy array directly
-                return rgba
-                
-            elif bit_count == 24:
-                # Create a ctypes array for the image data
-                pixel_type = self.ctypes.c_ubyte * image_size
-                pixel_array = pixel_type()
-                
-                # Copy the data from the DIB to our buffer
-                self.ctypes.memmove(pixel_array, bits_ptr, image_size)
-                
-                # Create a numpy array for the RGB data (we'll handle padding)
-                array = np.zeros((height, width, 3), dtype=np.uint8)
-                
-                # Extract the image data handling row padding
-                for y in range(height):
-                    for x in range(width):
-                        row_offset = y * row_size
-                        pixel_offset = row_offset + x * 3
-                        if pixel_offset + 2 < image_size:
-                            array[y, x, 0] = pixel_array[pixel_offset]     # Blue
-                            array[y, x, 1] = pixel_array[pixel_offset + 1] # Green
-                            array[y, x, 2] = pixel_array[pixel_offset + 2] # Red
-                    
-                # Note: When using ctypes directly, we don't need to flip the image
-                # This would only be necessary if using PIL's ImageGrab
-                # if not is_top_down:
-                #     array = np.flip(array, 0)
-                
-                # Convert BGR to RGB
-                rgb = array[:, :, [2, 1, 0]]
-                
-                # Create a fresh contiguous RGBA array with correct stride
-                rgba = np.zeros((height, width, 4), dtype=np.uint8)
-                rgba[:, :, 0:3] = rgb
-                rgba[:, :, 3] = 255  # Full opacity
-                
-                # Ensure the array is contiguous
-                rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
-                
-                # Return the numpy array
-                return rgba
-                
-            else:
-                # For unsupported bit depths, return error
-                self.logger.log(f"Unsupported bit depth: {bit_count}", 'ERROR')
-                self.logger.log(f"[ClipboardImageEXT] Unsupported bit depth: {bit_count}", 'ERROR')
-                return None
-                    
         except Exception as e:
             self.logger.log(f"Error processing DIB data: {str(e)}", 'ERROR')
             import traceback
-            traceback.self.logger.log_exc()  # This will help with debugging
+            self.logger.log(traceback.format_exc(), 'ERROR')  # This will help with debugging
             return None
             
         finally:
             # Always unlock the memory
             self.GlobalUnlock(h_dib)
             
-    def save_image_to_disk(self, image_array):
+    def save_image_to_disk(self, image_array, file_path=None):
         """Save numpy array to disk using a dedicated scriptTOP within the component"""
         try:
-            # Get folder path
-            folder_path = self.ownerComp.par.Folderpath.eval()
-            if not folder_path:
-                folder_path = 'clipboard_images'
-            
-            # Create folder if it doesn't exist
-            if not os.path.exists(folder_path):
-                os.makedirs(folder_path)
-            
-            # Generate unique filename
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            filename = f"clipboard_{timestamp}_{unique_id}.png"
-            file_path = os.path.join(folder_path, filename)
+            if file_path is None:
+                file_path = self.new_image_path()
             
             # Use the dedicated scriptTOP for saving
             save_top = self.ownerComp.op('script_save')
@@ -594,13 +494,176 @@ class ClipboardImageEXT(DotChatUtil):
             self.logger.log(f"Error saving to disk: {str(e)}", 'ERROR')
             raise
             
+    def get_folder_path(self):
+        """Get the save folder, creating it if it doesn't exist"""
+        folder_path = self.ownerComp.par.Folderpath.eval()
+        if not folder_path:
+            folder_path = 'clipboard_images'
+        
+        # Create folder if it doesn't exist
+        if not os.path.exists(folder_path):
+            os.makedirs(folder_path)
+        
+        return folder_path
+    
+    def new_image_path(self):
+        """Generate a unique file path for a pasted image"""
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        unique_id = str(uuid.uuid4())[:8]
+        filename = f"clipboard_{timestamp}_{unique_id}.png"
+        return os.path.join(self.get_folder_path(), filename)
+    
+    def get_placeholder_path(self):
+        """Path of the tiny transparent PNG Movie File In TOPs show while their image is being saved"""
+        placeholder_path = os.path.join(self.get_folder_path(), '_placeholder.png')
+        if not os.path.exists(placeholder_path):
+            write_png(placeholder_path, np.zeros((1, 1, 4), dtype=np.uint8))
+        return placeholder_path
+    
+    def save_image_to_disk_async(self, image_array, movie_top):
+        """
+        Hash, encode and write the image on a worker thread, reusing the file if the same image was saved before
+        The file parameter of movie_top is pointed at the saved file on the main thread once it is written
+        Returns the future of the save, its result is (digest, file path)
+        """
+        cache = self.get_image_cache()
+        if self._save_executor is None:
+            # A single worker saves in paste order, so a repeated paste finds the file of the earlier one
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ClipboardImageSave')
+        
+        # The decoded array is owned by this paste and never modified afterwards, so the worker can read it directly
+        future = self._save_executor.submit(cache.store, image_array)
+        self.logger.log(f"[ClipboardImageEXT] Saving image in background to: {cache.folder_path}", 'INFO')
+        self._watch_pending_save(future, movie_top)
+        
+        return future
+    
+    def _watch_pending_save(self, future, movie_top):
+        """Swap the saved file into movie_top once future is done and record it in the image cache"""
+        self._pending_saves.append((future, movie_top))
+        if not self._polling_saves:
+            self._polling_saves = True
+            run('args[0]()', self._poll_pending_saves, delayFrames=1)
+    
+    def _poll_pending_saves(self):
+        """Swap finished background saves into their Movie File In TOPs, runs once per frame while saves are pending"""
+        # Check each future once, a save may finish while we are looking at the list
+        finished = []
+        still_pending = []
+        for pending in self._pending_saves:
+            if pending[0].done():
+                finished.append(pending)
+            else:
+                still_pending.append(pending)
+        self._pending_saves = still_pending
+        
+        for future, movie_top in finished:
+            error = future.exception()
+            if error is not None:
+                self.logger.log(f"Error saving to disk: {str(error)}", 'ERROR')
+                continue
+            
+            digest, file_path = future.result()
+            self.logger.log(f"Image saved to: {file_path}", 'INFO')
+            if movie_top.valid:
+                movie_top.par.file = file_path
+            self.add_to_image_cache(digest, file_path)
+        
+        if still_pending:
+            run('args[0]()', self._poll_pending_saves, delayFrames=1)
+        else:
+            self._polling_saves = False
+            
+    def get_image_cache(self):
+        """Get the image cache for the current save folder"""
+        folder_path = self.get_folder_path()
+        if self._image_cache is None or self._image_cache.folder_path != folder_path:
+            if self._image_cache is not None:
+                self._image_cache.flush()
+            self._image_cache = ImageCache(folder_path)
+        return self._image_cache
+    
+    def add_to_image_cache(self, digest, file_path):
+        """Record a saved image in the cache and evict old images if the folder is over budget"""
+        try:
+            cache = self.get_image_cache()
+            if cache.lookup(digest) is None:
+                cache.add(digest, file_path)
+            self.evict_image_cache(keep=(file_path,))
+            self._schedule_index_flush()
+        except Exception as e:
+            self.logger.log(f"Error updating image cache: {str(e)}", 'WARNING')
+    
+    def _schedule_index_flush(self):
+        """Write the image cache index a moment later, once for all pastes until then"""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            run('args[0]()', self.flush_image_cache, delayMilliSeconds=INDEX_FLUSH_DELAY_MS)
+    
+    def flush_image_cache(self):
+        """Write pending changes of the image cache index to disk"""
+        self._flush_scheduled = False
+        if self._image_cache is not None:
+            try:
+                self._image_cache.flush()
+            except Exception as e:
+                self.logger.log(f"Error writing image cache index: {str(e)}", 'WARNING')
+    
+    def onDestroyTD(self):
+        """Finish the background saves and write the image cache index before the extension goes away"""
+        if self._save_executor is not None:
+            # A reinitialized extension doesn't know about these saves, so they are swapped in and recorded here
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
+            self._poll_pending_saves()
+        self.flush_image_cache()
+    
+    def evict_image_cache(self, keep=()):
+        """Delete least recently pasted images until the save folder fits in the cache budget"""
+        budget_bytes = self.ownerComp.par.Cachebudget.eval() * 1024 * 1024
+        if budget_bytes <= 0:
+            return []
+        
+        # A background save may have picked an indexed file to reuse, evict once they are all done
+        if self._pending_saves:
+            return []
+        
+        cache = self.get_image_cache()
+        if cache.total_size() <= budget_bytes:
+            return []
+        
+        def referenced_files():
+            # Never delete files that are still loaded somewhere in the project,
+            # the project is only searched once the cache has an image to delete
+            return set(keep) | {movie_top.par.file.eval() for movie_top in root.findChildren(type=moviefileinTOP)}
+        
+        removed = cache.evict(budget_bytes, keep=referenced_files)
+        for file_path in removed:
+            self.logger.log(f"[ClipboardImageEXT] Evicted cached image: {file_path}", 'INFO')
+        return removed
+    
     def create_top_from_image(self, image_array):
         """Create a Movie File In TOP with the clipboard image"""
         try:
             self.logger.log("[ClipboardImageEXT] Starting create_top_from_image", 'INFO')
             
-            # Save image to disk first using our dedicated scriptTOP
-            file_path = self.save_image_to_disk(image_array)
+            # Identical pixels map to the same file, so repeated pastes reuse what is already on disk.
+            # Save image to disk first using our dedicated scriptTOP, or start with a placeholder
+            # and hash and save in the background, where a cached file is picked up without writing it again
+            save_async = self.ownerComp.par.Asyncsave.eval()
+            if save_async:
+                file_path = self.get_placeholder_path()
+            else:
+                cache = self.get_image_cache()
+                digest = cache.digest(image_array)
+                cached_path = cache.lookup(digest)
+                if cached_path:
+                    self.logger.log(f"[ClipboardImageEXT] Reusing cached image: {cached_path}", 'INFO')
+                    file_path = cached_path
+                    self._schedule_index_flush()
+                else:
+                    file_path = self.save_image_to_disk(image_array, cache.path_for(digest))
+                    self.add_to_image_cache(digest, file_path)
             
             # Determine the current network to paste into
             target_network = self.get_current_network()
@@ -618,6 +681,9 @@ class ClipboardImageEXT(DotChatUtil):
             movie_top.par.file = file_path
             movie_top.viewer = True
             
+            if save_async:
+                self.save_image_to_disk_async(image_array, movie_top)
+            
             # Store reference to the created TOP
             self.clipboard_top = movie_top
             self.logger.log(f"[ClipboardImageEXT] Successfully configured movie TOP: {movie_top.path}", 'INFO')
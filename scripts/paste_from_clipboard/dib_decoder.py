@@ -0,0 +1,223 @@
+"""
+Pure Python/NumPy decoder for packed Windows DIBs (CF_DIB / CF_DIBV5 clipboard data).
+
+Takes any bytes-like buffer holding a BITMAPINFO header, optional color masks/palette
+and the pixel bits, and returns an RGBA uint8 numpy array. Row padding is handled with
+strided views so no per-pixel Python code runs.
+
+Supports:
+- BITMAPCOREHEADER, BITMAPINFOHEADER, BITMAPV4HEADER and BITMAPV5HEADER
+- 1/4/8-bit palettized images
+- 16-bit RGB555 (default), RGB565 and arbitrary BI_BITFIELDS masks
+- 24-bit BGR and 32-bit BGRX/BGRA, including BI_BITFIELDS / BI_ALPHABITFIELDS
+- V4/V5 alpha masks
+- bottom-up and top-down row order
+
+Has no Windows or TouchDesigner dependencies, so it can be tested anywhere.
+"""
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+BI_RGB = 0
+BI_RLE8 = 1
+BI_RLE4 = 2
+BI_BITFIELDS = 3
+BI_JPEG = 4
+BI_PNG = 5
+BI_ALPHABITFIELDS = 6
+
+BITMAPCOREHEADER_SIZE = 12
+BITMAPINFOHEADER_SIZE = 40
+BITMAPV3INFOHEADER_SIZE = 56  # BITMAPINFOHEADER + RGBA masks
+
+DEFAULT_MASKS_16 = (0x7C00, 0x03E0, 0x001F, 0)  # RGB555
+DEFAULT_MASKS_32 = (0x00FF0000, 0x0000FF00, 0x000000FF, 0)
+
+DIBHeader = namedtuple('DIBHeader', [
+    'header_size', 'width', 'height', 'bit_count', 'compression',
+    'colors_used', 'masks', 'top_down', 'row_size', 'bits_offset', 'palette_offset',
+])
+
+
+class DIBError(ValueError):
+    """Raised when a buffer is not a DIB this module can decode"""
+
+
+def read_header(buffer):
+    """Parse the header of a packed DIB and work out where the palette and pixel bits live"""
+    view = memoryview(buffer).cast('B')
+    if len(view) < 4:
+        raise DIBError("Buffer too small for a DIB header")
+
+    header_size = struct.unpack_from('<I', view, 0)[0]
+    compression = BI_RGB
+    colors_used = 0
+    masks = None
+
+    if header_size == BITMAPCOREHEADER_SIZE:
+        if len(view) < header_size:
+            raise DIBError("Truncated BITMAPCOREHEADER")
+        width, height, _planes, bit_count = struct.unpack_from('<HHHH', view, 4)
+        palette_entry_size = 3
+    elif header_size >= BITMAPINFOHEADER_SIZE:
+        if len(view) < header_size:
+            raise DIBError(f"Truncated DIB header ({len(view)} < {header_size} bytes)")
+        (width, height, _planes, bit_count, compression,
+         _size_image, _xppm, _yppm, colors_used, _important) = struct.unpack_from('<iiHHIIiiII', view, 4)
+        palette_entry_size = 4
+        if header_size >= BITMAPV3INFOHEADER_SIZE:
+            # V3/V4/V5 headers carry the masks themselves
+            masks = struct.unpack_from('<IIII', view, BITMAPINFOHEADER_SIZE)
+    else:
+        raise DIBError(f"Invalid DIB header size: {header_size}")
+
+    if width <= 0 or height == 0:
+        raise DIBError(f"Invalid DIB dimensions: {width}x{height}")
+    if bit_count not in (1, 4, 8, 16, 24, 32):
+        raise DIBError(f"Unsupported bit depth: {bit_count}")
+    if compression not in (BI_RGB, BI_BITFIELDS, BI_ALPHABITFIELDS):
+        raise DIBError(f"Unsupported DIB compression: {compression}")
+    if compression != BI_RGB and bit_count not in (16, 32):
+        raise DIBError(f"Bitfield masks are not valid for {bit_count}-bit DIBs")
+
+    offset = header_size
+    if compression in (BI_BITFIELDS, BI_ALPHABITFIELDS) and header_size == BITMAPINFOHEADER_SIZE:
+        # Plain BITMAPINFOHEADER: the masks follow the header as 3 (or 4) DWORDs
+        count = 4 if compression == BI_ALPHABITFIELDS else 3
+        if len(view) < offset + count * 4:
+            raise DIBError("Truncated DIB color masks")
+        masks = struct.unpack_from(f'<{count}I', view, offset) + ((0,) if count == 3 else ())
+        offset += count * 4
+
+    if bit_count <= 8 and colors_used == 0:
+        colors_used = 1 << bit_count
+    palette_offset = offset
+    offset += colors_used * palette_entry_size
+
+    if compression == BI_RGB:
+        # Masks in a V4/V5 header only apply to bitfields, except for the alpha mask
+        alpha_mask = masks[3] if masks else 0
+        if bit_count == 16:
+            masks = DEFAULT_MASKS_16[:3] + (alpha_mask,)
+        elif bit_count == 32:
+            masks = DEFAULT_MASKS_32[:3] + (alpha_mask,)
+        else:
+            masks = None
+
+    row_size = ((width * bit_count + 31) // 32) * 4
+    if len(view) < offset + row_size * abs(height):
+        raise DIBError(f"Truncated DIB pixel data ({len(view) - offset} < {row_size * abs(height)} bytes)")
+
+    return DIBHeader(header_size, width, abs(height), bit_count, compression,
+                     colors_used, masks, height < 0, row_size, offset, palette_offset)
+
+
+def decode_dib(buffer, header=None, bottom_up=True, out=None):
+    """
+    Decode a packed DIB into a (height, width, 4) RGBA uint8 array.
+    Rows are returned bottom row first by default, which is what TouchDesigner's
+    copyNumpyArray expects; pass bottom_up=False for top row first.
+    The buffer is only read through views, so it can wrap foreign memory (e.g. a locked
+    clipboard handle) as long as it stays valid for the duration of the call.
+    Pass out to decode into an existing C-contiguous array instead of allocating one.
+    """
+    if header is None:
+        header = read_header(buffer)
+    width, height, bit_count = header.width, header.height, header.bit_count
+
+    # Plain BGRX/BGRA can be swizzled bytewise; other masked layouts are read as whole words
+    byte_order = bit_count == 32 and header.masks[:3] == DEFAULT_MASKS_32[:3] \
+        and header.masks[3] in (0, 0xFF000000)
+
+    # One view over the pixel bits, one row per line including the DWORD padding
+    row_dtype = np.uint8
+    if header.masks and not byte_order:
+        row_dtype = '<u2' if bit_count == 16 else '<u4'
+    itemsize = np.dtype(row_dtype).itemsize
+    rows = np.frombuffer(buffer, dtype=row_dtype, count=header.row_size * height // itemsize,
+                         offset=header.bits_offset).reshape(height, header.row_size // itemsize)
+
+    # Memory order is bottom-up unless the header says otherwise; flipping is a negative-stride view
+    if header.top_down == bottom_up:
+        rows = rows[::-1]
+
+    if out is None:
+        rgba = np.empty((height, width, 4), dtype=np.uint8)
+    elif out.shape != (height, width, 4) or out.dtype != np.uint8 or not out.flags.c_contiguous:
+        raise DIBError(f"Output buffer must be a contiguous ({height}, {width}, 4) uint8 array")
+    else:
+        rgba = out
+
+    if bit_count <= 8:
+        _decode_palette(buffer, header, rows, rgba)
+    elif bit_count == 24 or byte_order:
+        channels = bit_count // 8
+        bgr = rows[:, :width * channels].reshape(height, width, channels)
+        if channels == 4 and (header.masks[3] or header.header_size == BITMAPINFOHEADER_SIZE
+                              and header.compression == BI_RGB):
+            # A plain BITMAPINFOHEADER has no alpha mask, but clipboard producers use the 4th byte as alpha
+            rgba[..., 3] = bgr[..., 3]
+            # Many apps leave that byte zeroed; treat a fully transparent image as opaque
+            if not rgba[..., 3].any():
+                rgba[..., 3] = 255
+        else:
+            rgba[..., 3] = 255
+        # Swizzle BGR -> RGB through a reversed channel view, written straight into the output
+        rgba[..., :3] = bgr[..., 2::-1]
+    else:
+        _decode_masked(header, rows[:, :width], rgba)
+
+    return rgba
+
+
+def _decode_palette(buffer, header, rows, rgba):
+    """Expand 1/4/8-bit indices and look them up in the color table"""
+    width, bit_count = header.width, header.bit_count
+
+    if bit_count == 8:
+        indices = rows[:, :width]
+    elif bit_count == 4:
+        packed = rows[:, :(width + 1) // 2]
+        indices = np.empty((packed.shape[0], packed.shape[1] * 2), dtype=np.uint8)
+        indices[:, 0::2] = packed >> 4
+        indices[:, 1::2] = packed & 0x0F
+        indices = indices[:, :width]
+    else:
+        indices = np.unpackbits(rows[:, :(width + 7) // 8], axis=1)[:, :width]
+
+    # Pad the table to the full index range so out-of-range indices read black instead of failing
+    entry_size = 3 if header.header_size == BITMAPCOREHEADER_SIZE else 4
+    colors = np.frombuffer(buffer, dtype=np.uint8, count=header.colors_used * entry_size,
+                           offset=header.palette_offset).reshape(-1, entry_size)
+    palette = np.zeros((1 << bit_count, 4), dtype=np.uint8)
+    count = min(len(colors), len(palette))
+    palette[:count, 0] = colors[:count, 2]
+    palette[:count, 1] = colors[:count, 1]
+    palette[:count, 2] = colors[:count, 0]
+    palette[:, 3] = 255
+
+    np.take(palette, indices, axis=0, out=rgba)
+
+
+def _decode_masked(header, pixels, rgba):
+    """Extract channels from 16/32-bit pixels using the header's color masks"""
+    red_mask, green_mask, blue_mask, alpha_mask = header.masks
+    for channel, mask in enumerate((red_mask, green_mask, blue_mask)):
+        rgba[..., channel] = _extract_channel(pixels, mask)
+    rgba[..., 3] = _extract_channel(pixels, alpha_mask) if alpha_mask else 255
+
+
+def _extract_channel(pixels, mask):
+    """Isolate one masked channel and rescale it to 0-255"""
+    if not mask:
+        return 0
+    shift = (mask & -mask).bit_length() - 1
+    max_value = mask >> shift
+    values = (pixels & mask) >> shift
+    if max_value == 255:
+        return values
+    # Round to nearest when widening (5-bit 31 -> 255) or narrowing (10-bit 1023 -> 255)
+    values = values.astype(np.uint64)
+    return (values * 255 + max_value // 2) // max_value
@@ -0,0 +1,153 @@
+"""
+Content-addressed cache for images saved by ClipboardImageEXT.
+
+Images are named after a hash of their decoded pixels, so pasting the same image again
+resolves to the file that is already on disk. An index file in the cache folder keeps
+track of file sizes and when each image was last pasted, which drives a size-budgeted
+least recently used eviction pass.
+
+Only files listed in the index are ever deleted; anything else in the folder is left alone.
+Index changes are batched: lookup, add and evict only mark the index dirty and flush writes it,
+so repeated pastes don't rewrite _index.json each time.
+Has no TouchDesigner dependencies, so it can be tested anywhere.
+"""
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from png_writer import write_atomic, write_png
+
+INDEX_FILENAME = '_index.json'
+INDEX_VERSION = 1
+
+
+class ImageCache:
+    """On-disk index of pasted images keyed by pixel hash"""
+
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        self.index_path = os.path.join(folder_path, INDEX_FILENAME)
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    @staticmethod
+    def digest(image_array):
+        """Hash the shape and pixels of an image, returns a hex digest"""
+        pixels = np.ascontiguousarray(image_array, dtype=np.uint8)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(repr(pixels.shape).encode())
+        hasher.update(memoryview(pixels).cast('B'))
+        return hasher.hexdigest()
+
+    def path_for(self, digest):
+        """File path an image with this digest is stored at"""
+        return os.path.join(self.folder_path, f'clipboard_{digest}.png')
+
+    def store(self, image_array):
+        """
+        Hash an image and write it unless a file with its digest is already there, returns (digest, file path)
+        Meant for the save worker: it only touches the file system, record the result with add on the main thread
+        """
+        digest = self.digest(image_array)
+        file_path = self.path_for(digest)
+        if not os.path.exists(file_path):
+            write_png(file_path, image_array)
+        return digest, file_path
+
+    def load(self):
+        """Read the index from disk, dropping entries whose files are gone"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            entries = data.get('entries', {}) if data.get('version') == INDEX_VERSION else {}
+        except (OSError, ValueError, AttributeError):
+            entries = {}
+        self.entries = {
+            digest: entry for digest, entry in entries.items()
+            if isinstance(entry, dict) and os.path.exists(os.path.join(self.folder_path, entry.get('file', '')))
+        }
+
+    def save(self):
+        """Write the index atomically"""
+        data = json.dumps({'version': INDEX_VERSION, 'entries': self.entries}, indent=1)
+        write_atomic(self.index_path, data.encode('utf-8'))
+        self.dirty = False
+
+    def flush(self):
+        """Write the index if it changed since it was last written, returns whether it was written"""
+        if not self.dirty:
+            return False
+        self.save()
+        return True
+
+    def lookup(self, digest):
+        """Return the path of a cached image and mark it as recently used, or None if it isn't cached"""
+        entry = self.entries.get(digest)
+        if entry is None:
+            return None
+        file_path = os.path.join(self.folder_path, entry['file'])
+        if not os.path.exists(file_path):
+            del self.entries[digest]
+            self.dirty = True
+            return None
+        entry['last_used'] = time.time()
+        self.dirty = True
+        return file_path
+
+    def add(self, digest, file_path):
+        """Record a freshly written image"""
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            return
+        now = time.time()
+        self.entries[digest] = {
+            'file': os.path.basename(file_path),
+            'size': size,
+            'created': now,
+            'last_used': now,
+        }
+        self.dirty = True
+
+    def total_size(self):
+        """Size in bytes of all indexed images"""
+        return sum(entry['size'] for entry in self.entries.values())
+
+    def evict(self, budget_bytes, keep=()):
+        """
+        Delete least recently used images until the cache fits in budget_bytes
+        Paths in keep (e.g. files still referenced in the project) are never deleted, keep can also be
+        a function returning them, which is only called once there is an image to delete
+        Returns the list of deleted file paths
+        """
+        if budget_bytes <= 0:
+            return []
+
+        removed = []
+        protected = None
+        total = self.total_size()
+        for digest, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= budget_bytes:
+                break
+            if protected is None:
+                protected = {os.path.normcase(os.path.abspath(path)) for path in (keep() if callable(keep) else keep)}
+            file_path = os.path.join(self.folder_path, entry['file'])
+            if os.path.normcase(os.path.abspath(file_path)) in protected:
+                continue
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            del self.entries[digest]
+            total -= entry['size']
+            removed.append(file_path)
+
+        if removed:
+            self.dirty = True
+        return removed
@@ -0,0 +1,95 @@
+"""
+PNG encoding for ClipboardImageEXT that is safe to run off the main thread.
+
+Encodes RGBA uint8 numpy arrays without touching any TouchDesigner operator, so it can
+run in a worker thread while the UI keeps going. Uses OpenCV when it is available
+(TouchDesigner ships it) and falls back to a pure Python/NumPy + zlib encoder otherwise.
+Both release the GIL for the heavy lifting.
+
+Files are written atomically: the PNG goes to a temporary file next to the target
+which is then renamed over it, so readers never see a half written image.
+"""
+import os
+import struct
+import tempfile
+import zlib
+
+import numpy as np
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def encode_png(rgba, flip=True, compress_level=6, use_cv2=True):
+    """
+    Encode a (height, width, 4) RGBA uint8 array to PNG bytes.
+    Arrays coming from TouchDesigner are stored bottom row first, flip writes them top row first.
+    """
+    rgba = np.asarray(rgba, dtype=np.uint8)
+    if rgba.ndim != 3 or rgba.shape[2] != 4:
+        raise ValueError(f"Expected a (height, width, 4) array, got {rgba.shape}")
+
+    if use_cv2 and cv2 is not None:
+        bgra = cv2.cvtColor(np.ascontiguousarray(rgba), cv2.COLOR_RGBA2BGRA)
+        if flip:
+            bgra = cv2.flip(bgra, 0)
+        ok, encoded = cv2.imencode('.png', bgra, [cv2.IMWRITE_PNG_COMPRESSION, compress_level])
+        if not ok:
+            raise RuntimeError("OpenCV failed to encode PNG")
+        return encoded.tobytes()
+
+    return _encode_png_zlib(rgba[::-1] if flip else rgba, compress_level)
+
+
+def _encode_png_zlib(rgba, compress_level):
+    """Minimal RGBA8 PNG encoder using the Sub filter on every scanline"""
+    height, width = rgba.shape[:2]
+    pixels = rgba.reshape(height, width * 4)
+
+    # Each scanline is a filter type byte followed by the filtered bytes.
+    # Sub stores the difference to the pixel on the left, which compresses flat UI screenshots well
+    scanlines = np.empty((height, 1 + width * 4), dtype=np.uint8)
+    scanlines[:, 0] = 1
+    scanlines[:, 1:5] = pixels[:, :4]
+    np.subtract(pixels[:, 4:], pixels[:, :-4], out=scanlines[:, 5:])
+
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return b''.join((
+        PNG_SIGNATURE,
+        _chunk(b'IHDR', ihdr),
+        _chunk(b'IDAT', zlib.compress(scanlines, compress_level)),
+        _chunk(b'IEND', b''),
+    ))
+
+
+def _chunk(chunk_type, data):
+    """Wrap data in a PNG chunk with length and CRC"""
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', crc)
+
+
+def write_atomic(file_path, data):
+    """Write bytes to a temporary file in the target folder and rename it into place"""
+    folder = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(folder, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=folder)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return file_path
+
+
+def write_png(file_path, rgba, flip=True, compress_level=6):
+    """Encode an RGBA array and write it atomically, returns the file path"""
+    return write_atomic(file_path, encode_png(rgba, flip=flip, compress_level=compress_level))
@@ -0,0 +1,291 @@
+"""
+Shared fixtures for the tests of the TouchDesigner-free ExtUtils and paste_from_clipboard modules.
+
+The modules are imported by name like TouchDesigner does for DATs in the same COMP,
+so their folders are put on the import path.
+"""
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+EXTUTILS = os.path.join(os.path.dirname(__file__), os.pardir, 'scripts', 'QuickExt', 'templates', 'ExtUtils')
+PASTE_FROM_CLIPBOARD = os.path.join(os.path.dirname(__file__), os.pardir, 'scripts', 'paste_from_clipboard')
+sys.path.insert(0, os.path.abspath(os.path.join(EXTUTILS, 'NoNode')))
+sys.path.insert(0, os.path.abspath(PASTE_FROM_CLIPBOARD))
+
+
+class FakeClock:
+    """Manually advanced clock in seconds, with a frame counter"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.frame = 0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSchedule:
+    """Records deferred calls like run() would and runs them on demand"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, callback, frames=0, ms=0.0):
+        self.calls.append((callback, frames, ms))
+
+    def run_next(self):
+        callback, _frames, _ms = self.calls.pop(0)
+        callback()
+
+    def run_all(self):
+        while self.calls:
+            self.run_next()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def schedule():
+    return FakeSchedule()
+
+
+class FakePar:
+    def __init__(self, owner, name, val=0, page=None):
+        self.owner, self.name, self.val, self.page = owner, name, val, page
+        self.isCustom = self.isPulse = False
+        self.sequence = None
+        self.mode = 0 # ParMode.CONSTANT
+        self.parGroup = FakeParGroup(name, [self])
+
+    def eval(self):
+        return self.val
+
+
+class FakeParGroup(list):
+    def __init__(self, name, pars):
+        super().__init__(pars)
+        self.name = name
+
+    def eval(self):
+        return tuple(par.eval() for par in self)
+
+
+class FakePars:
+    def __init__(self, owner):
+        self.__dict__['_owner'] = owner
+        self.__dict__['_pars'] = {}
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['_pars'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, val):
+        self.add(name).val = val
+
+    def __getitem__(self, name):
+        return self.__dict__['_pars'][name]
+
+    def add(self, name, val=0):
+        pars = self.__dict__['_pars']
+        if name not in pars:
+            pars[name] = FakePar(self.__dict__['_owner'], name, val)
+        return pars[name]
+
+
+class FakeOP:
+    def __init__(self, name='op'):
+        self.name = name
+        self.path = '/' + name
+        self.color = (0.55, 0.55, 0.55)
+        self.valid = True
+        self.par = FakePars(self)
+        self.par.add('active', False)
+        self.parGroup = types.SimpleNamespace()
+        self.customPars = []
+        self.customParGroups = []
+        self.storage = {}
+        self.children = {}
+
+    def addCustomPar(self, name, val=0, page='Main', group=None):
+        """Add a custom parameter, to the parGroup named group if given"""
+        par = self.par.add(name, val)
+        par.isCustom = True
+        par.page = types.SimpleNamespace(name=page)
+        self.customPars.append(par)
+        if group is None:
+            self.customParGroups.append(par.parGroup)
+        else:
+            pargroup = getattr(self.parGroup, group, None)
+            if pargroup is None:
+                pargroup = FakeParGroup(group, [])
+                setattr(self.parGroup, group, pargroup)
+                self.customParGroups.append(pargroup)
+            pargroup.append(par)
+            par.parGroup = pargroup
+        return par
+
+    def store(self, key, value):
+        self.storage[key] = value
+        return value
+
+    def fetch(self, key, default=None, search=True, storeDefault=False):
+        return self.storage.get(key, default)
+
+    def op(self, name):
+        return self.children.get(name)
+
+    def create(self, optype, name):
+        self.children[name] = optype(name)
+        return self.children[name]
+
+    def __repr__(self):
+        return f'FakeOP({self.name})'
+
+
+class FakeTextDAT(FakeOP):
+    """Text DAT whose module is compiled from its text like TouchDesigner does, counting the compiles"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.text = ''
+        self.compiles = 0
+
+    @property
+    def module(self):
+        self.compiles += 1
+        module = types.ModuleType(self.name)
+        exec(compile(self.text, self.name, 'exec'), module.__dict__)
+        return module
+
+
+class FakeCell:
+    def __init__(self, row, col, val):
+        self.row, self.col, self.val = row, col, val
+
+
+class FakeDAT(FakeOP):
+    """Table DAT with a header row and a key column"""
+
+    def __init__(self, name, rows):
+        super().__init__(name)
+        self.cells = [[FakeCell(r, c, val) for c, val in enumerate(row)] for r, row in enumerate(rows)]
+
+    def __getitem__(self, index):
+        row, col = index
+        return self.cells[row][col]
+
+    @property
+    def numRows(self):
+        return len(self.cells)
+
+    def rows(self):
+        return self.cells
+
+
+class FakeChannel:
+    def __init__(self, owner, name):
+        self.owner, self.name = owner, name
+
+
+class FakeCHOP(FakeOP):
+    """CHOP with a single sample per channel, channels are added, renamed and reordered through values"""
+
+    def __init__(self, name, values=None):
+        super().__init__(name)
+        self.values = dict(values or {})
+
+    def chans(self):
+        return [FakeChannel(self, name) for name in self.values]
+
+    @property
+    def numSamples(self):
+        return 1
+
+    def numpyArray(self):
+        return np.array(list(self.values.values()), dtype=np.float32).reshape(-1, 1)
+
+
+class FakeTD:
+    """Just enough of the td module to load NoNode outside TouchDesigner"""
+    OP = FakeOP
+    DAT = FakeDAT
+    CHOP = FakeCHOP
+    Cell = FakeCell
+
+    def __init__(self):
+        self.ops = {}
+        self.runs = []
+        self.frame = 0
+
+    def op(self, name):
+        name = name.lstrip('/') # operators are looked up by name or by path
+        return self.ops.setdefault(name, FakeOP(name))
+
+    def run(self, script, *args, delayFrames=0, **kwargs):
+        self.runs.append((args[0], self.frame + delayFrames))
+
+    def pump(self):
+        """Advance one frame, running what was scheduled up to it, including what those calls schedule for it"""
+        self.frame += 1
+        while True:
+            due = [callback for callback, frame in self.runs if frame <= self.frame]
+            if not due:
+                break
+            self.runs = [(callback, frame) for callback, frame in self.runs if frame > self.frame]
+            for callback in due:
+                callback()
+
+
+@pytest.fixture
+def td(monkeypatch):
+    """Install a fake td module into builtins"""
+    import builtins
+    import fnmatch
+
+    fake = FakeTD()
+    tdu = types.SimpleNamespace(
+        Dependency=lambda val=None: types.SimpleNamespace(val=val),
+        match=lambda pattern, inputs: [i for i in inputs if any(fnmatch.fnmatchcase(i, p) for p in pattern.split())],
+    )
+    abs_time = type('AbsTime', (), {'frame': property(lambda _: fake.frame)})()
+    names = dict(op=fake.op, run=fake.run, tdu=tdu, absTime=abs_time, me=types.SimpleNamespace(docked=[]),
+                 OP=FakeOP, COMP=FakeOP, DAT=FakeDAT, CHOP=FakeOP, Par=FakePar, Channel=object, Cell=FakeCell,
+                 ParGroup=FakeParGroup, textDAT=FakeTextDAT, ParMode=types.SimpleNamespace(CONSTANT=0, EXPRESSION=1, EXPORT=2, BIND=3), debug=print)
+    for name, value in names.items():
+        monkeypatch.setattr(builtins, name, value, raising=False)
+    return fake
+
+
+def load(name, *folders):
+    """Run a DAT module from the ExtUtils folder in a fresh namespace, like TouchDesigner does"""
+    path = os.path.join(EXTUTILS, *folders, f'{name}.py')
+    namespace = {'__name__': name}
+    with open(path, encoding='utf-8') as f:
+        exec(compile(f.read(), path, 'exec'), namespace)
+    return types.SimpleNamespace(**namespace)
+
+
+@pytest.fixture
+def NoNode(td, monkeypatch):
+    """A freshly loaded NoNode class, initialized for a fake owner component"""
+    import builtins
+
+    module = load('NoNode', 'NoNode')
+    monkeypatch.setattr(builtins, 'mod', {'NoNode': module}.__getitem__, raising=False)
+    module.NoNode.Init(td.op('owner'))
+    return module.NoNode
+
+
+@pytest.fixture
+def CustomParHelper(NoNode):
+    """A freshly loaded CustomParHelper class, importing the NoNode module it shares helpers with"""
+    return load('CustomParHelper', 'CustomParHelper').CustomParHelper
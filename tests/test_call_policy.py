@@ -0,0 +1,124 @@
+import pytest
+
+from NoNodeScheduling import CallPolicy
+
+
+def make_policy(clock, schedule, calls, **options):
+    return CallPolicy(lambda *args: calls.append(args), schedule, clock=clock, frame=lambda: clock.frame, **options)
+
+
+def test_throttle_calls_through_then_holds_back_latest_per_key(clock, schedule):
+    calls = []
+    policy = make_policy(clock, schedule, calls, max_rate=10, key=lambda args: args[0])
+
+    policy('a', 1)
+    policy('a', 2)
+    policy('a', 3)
+    policy('b', 1)
+
+    assert calls == [('a', 1)]
+    assert [(frames, ms) for _, frames, ms in schedule.calls] == [(0, pytest.approx(100.0))]
+
+    clock.now = 0.1
+    schedule.run_all()
+    assert calls == [('a', 1), ('a', 3), ('b', 1)]
+
+
+def test_throttle_flush_before_window_reschedules(clock, schedule):
+    calls = []
+    policy = make_policy(clock, schedule, calls, max_rate=10)
+
+    policy(1)
+    policy(2)
+    clock.now = 0.05
+    schedule.run_next()
+
+    assert calls == [(1,)]
+    assert len(schedule.calls) == 1
+
+    clock.now = 0.1
+    schedule.run_next()
+    assert calls == [(1,), (2,)]
+
+
+def test_debounce_waits_for_quiet_period(clock, schedule):
+    calls = []
+    policy = make_policy(clock, schedule, calls, debounce=50)
+
+    policy(1)
+    clock.now = 0.03
+    policy(2)
+    clock.now = 0.05
+    schedule.run_next() # the first deadline passed, but it got extended by the second event
+
+    assert calls == []
+    assert len(schedule.calls) == 1
+
+    clock.now = 0.08
+    schedule.run_next()
+    assert calls == [(2,)]
+
+
+def test_debounce_frames_counts_frames(clock, schedule):
+    calls = []
+    policy = make_policy(clock, schedule, calls, debounce_frames=2)
+
+    policy(1)
+    assert schedule.calls[-1][1] == 2
+    clock.frame = 1
+    policy(2)
+    clock.frame = 2
+    schedule.run_next()
+
+    assert calls == []
+    assert schedule.calls[-1][1] == 1
+
+    clock.frame = 3
+    schedule.run_next()
+    assert calls == [(2,)]
+
+
+def test_debounce_frames_needs_a_frame_counter(schedule):
+    with pytest.raises(ValueError):
+        CallPolicy(print, schedule, debounce_frames=1)
+
+
+def test_coalesce_delivers_latest_value_per_key_at_end_of_frame(clock, schedule):
+    calls = []
+    policy = make_policy(clock, schedule, calls, coalesce=True, key=lambda args: args[0])
+
+    policy('a', 1)
+    policy('b', 1)
+    policy('a', 2)
+
+    assert calls == []
+    assert [(frames, ms) for _, frames, ms in schedule.calls] == [(0, 0.0)]
+
+    schedule.run_all()
+    assert calls == [('a', 2), ('b', 1)]
+
+
+def test_coalesce_merge_combines_pending_arguments(clock, schedule):
+    calls = []
+    policy = make_policy(clock, schedule, calls, coalesce=True, merge=lambda pending, args: pending + args)
+
+    policy(1)
+    policy(2)
+    policy(3)
+    schedule.run_all()
+
+    assert calls == [(1, 2, 3)]
+
+
+def test_wrapped_callback_liveness_and_name_are_forwarded(schedule):
+    class Entry:
+        alive = False
+        name = 'Ext.onChange'
+
+        def __call__(self, *args):
+            pass
+
+    policy = CallPolicy(Entry(), schedule, coalesce=True)
+
+    assert policy.alive is False
+    assert policy.name == 'Ext.onChange'
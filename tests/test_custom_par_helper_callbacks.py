@@ -0,0 +1,79 @@
+import types
+
+import pytest
+
+
+class Extension:
+    def __init__(self, ownerComp):
+        self.ownerComp = ownerComp
+        self.calls = []
+
+    def onParSpeed(self, _par, _val, _prev):
+        self.calls.append(('onParSpeed', _val, _prev))
+
+    def onSeqLightsNLevel(self, _par, idx, _val):
+        self.calls.append(('onSeqLightsNLevel', _par.name, idx, _val))
+
+    def onSeqLightsNTrigger(self, idx):
+        self.calls.append(('onSeqLightsNTrigger', idx))
+
+    def onValueChange(self, _par, _val):
+        self.calls.append(('onValueChange', _par.name, _val))
+
+    def onPulse(self, _par):
+        self.calls.append(('onPulse', _par.name))
+
+
+@pytest.fixture
+def owner(td):
+    owner = td.op('owner')
+    owner.addCustomPar('Speed', 1)
+    owner.addCustomPar('Gain', 2)
+    owner.addCustomPar('Reset').isPulse = True
+    lights = types.SimpleNamespace(name='Lights')
+    for name in ('Lights0level', 'Lights1level', 'Lights1trigger'):
+        owner.addCustomPar(name, 0.5).sequence = lights
+    owner.par.Lights1trigger.isPulse = True
+    return owner
+
+
+def test_callbacks_resolve_to_the_most_specific_handler(CustomParHelper, owner):
+    ext = Extension(owner)
+    CustomParHelper.Init(ext, owner)
+
+    assert set(CustomParHelper.VALUE_HANDLERS) == {'Speed', 'Gain', 'Lights0level', 'Lights1level'}
+    assert set(CustomParHelper.PULSE_HANDLERS) == {'Reset', 'Lights1trigger'}
+    for name in ('Speed', 'Gain', 'Lights1level'):
+        CustomParHelper.OnValueChange(owner, owner.par[name], 0)
+    for name in ('Reset', 'Lights1trigger'):
+        CustomParHelper.OnPulse(owner, owner.par[name])
+
+    assert ext.calls == [
+        ('onParSpeed', 1, 0),
+        ('onValueChange', 'Gain', 2),
+        ('onSeqLightsNLevel', 'Lights1level', 1, 0.5),
+        ('onPulse', 'Reset'),
+        ('onSeqLightsNTrigger', 1),
+    ]
+
+
+def test_general_callbacks_can_be_disabled(CustomParHelper, owner):
+    ext = Extension(owner)
+    CustomParHelper.Init(ext, owner, general_callback_enable=False)
+
+    assert CustomParHelper.VALUE_HANDLERS['Gain'] is None and CustomParHelper.PULSE_HANDLERS['Reset'] is None
+    assert CustomParHelper.VALUE_HANDLERS['Speed'] is not None
+
+
+def test_table_is_rebuilt_when_the_custom_parameters_change(CustomParHelper, owner):
+    ext = Extension(owner)
+    CustomParHelper.Init(ext, owner, except_callbacks=['Gain'])
+    assert CustomParHelper.VALUE_HANDLERS['Gain'] is None
+
+    owner.customPars = [par for par in owner.customPars if par.name != 'Speed']
+    owner.addCustomPar('Volume', 3)
+    CustomParHelper.UpdateCustomParsAsProperties() # called by the DAT exec watching the custom parameter table
+
+    assert 'Speed' not in CustomParHelper.VALUE_HANDLERS and CustomParHelper.VALUE_HANDLERS['Gain'] is None
+    CustomParHelper.OnValueChange(owner, owner.par.Volume, 0)
+    assert ext.calls == [('onValueChange', 'Volume', 3)]
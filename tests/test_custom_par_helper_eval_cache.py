@@ -0,0 +1,40 @@
+import pytest
+
+
+@pytest.fixture
+def ext(CustomParHelper, td):
+    class Extension:
+        def __init__(self, ownerComp):
+            self.ownerComp = ownerComp
+
+    owner = td.op('owner')
+    owner.addCustomPar('Speed', 1)
+    for name, val in (('Colorr', 0.1), ('Colorg', 0.2), ('Colorb', 0.3)):
+        owner.addCustomPar(name, val, group='Color')
+    ext = Extension(owner)
+    CustomParHelper.Init(ext, owner, cache_constants=True)
+    return ext
+
+
+def test_constant_parameters_are_served_from_the_cache(CustomParHelper, ext):
+    assert ext.evalSpeed == 1 and ext.evalSpeed == 1
+    assert CustomParHelper.EvalCacheStats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    ext.ownerComp.par.Speed.val = 2 # changed behind the cache, until extParExec reports it
+    assert ext.evalSpeed == 1
+    CustomParHelper.OnValueChange(None, ext.ownerComp.par.Speed, 1)
+    assert ext.evalSpeed == 2
+
+
+@pytest.mark.parametrize('prop, value, expected', [
+    ('parSpeed', 5, {'Speed': 5}),
+    ('evalGroupColor', (5, 6, 7), {'Colorr': 5, 'Colorg': 6, 'Colorb': 7}),
+    ('parGroupColor', (5, 6, 7), {'Colorr': 5, 'Colorg': 6, 'Colorb': 7}),
+])
+def test_every_setter_drops_the_cached_values_it_writes(ext, prop, value, expected):
+    cached = {name: getattr(ext, f'eval{name}') for name in expected}
+
+    setattr(ext, prop, value)
+
+    assert cached != expected
+    assert {name: getattr(ext, f'eval{name}') for name in expected} == expected
@@ -0,0 +1,84 @@
+import pytest
+
+
+@pytest.fixture
+def owner(td):
+    owner = td.op('owner')
+    owner.addCustomPar('Speed', 1)
+    for name, val in (('Colorr', 0.1), ('Colorg', 0.2), ('Colorb', 0.3)):
+        owner.addCustomPar(name, val, group='Color')
+    for par in owner.customPars:
+        par.style = 'Float'
+    return owner
+
+
+def make_extension(*bases):
+    class Extension(*bases):
+        def __init__(self, ownerComp):
+            self.ownerComp = ownerComp
+            self.calls = []
+
+        def onParSpeed(self, _val):
+            self.calls.append(_val)
+    return Extension
+
+
+def generate(td, CustomParHelper, owner):
+    """Run the first Init, which leaves generating the mixin to the next frame"""
+    ext = make_extension()(owner)
+    CustomParHelper.Init(ext, owner, use_mixin=True)
+    assert owner.op('ExtensionMixin') is None
+    td.pump()
+    td.pump()
+    return owner.op('ExtensionMixin')
+
+
+def test_mixin_is_generated_after_init_and_its_hash_stored_on_the_owner(td, CustomParHelper, owner):
+    ext = make_extension()(owner)
+    CustomParHelper.Init(ext, owner, use_mixin=True)
+
+    assert owner.op('ExtensionMixin') is None and CustomParHelper.MIXIN_PROPERTIES is None
+    assert ext.evalSpeed == 1 # resolved as usual meanwhile
+    td.pump()
+    td.pump()
+
+    dat = owner.op('ExtensionMixin')
+    assert dat.module.LAYOUT_HASH == owner.fetch(CustomParHelper.MIXIN_STORAGE_KEY) == CustomParHelper.LayoutHash()
+
+
+def test_init_with_a_matching_mixin_walks_no_parameters(td, CustomParHelper, owner, monkeypatch):
+    mixin = generate(td, CustomParHelper, owner).module
+    monkeypatch.setattr(CustomParHelper, 'LayoutHash', lambda: pytest.fail('Init must not hash the layout'))
+    owner.customPars = None # iterating the parameters would fail
+
+    ext = make_extension(mixin.ExtensionMixin)(owner)
+    CustomParHelper.Init(ext, owner, use_mixin=True)
+
+    assert CustomParHelper.MIXIN_PROPERTIES == mixin.PROPERTIES
+    assert CustomParHelper.PROPERTIES_RESOLVED == set() # nothing installed on the extension class
+    assert not any(type(value).__name__ == '_LazyProperty' for value in vars(type(ext)).values())
+    CustomParHelper.OnValueChange(owner, owner.par.Speed, 0)
+    assert ext.calls == [1]
+
+
+def test_mixin_class_carries_real_properties(td, CustomParHelper, owner):
+    mixin = generate(td, CustomParHelper, owner).module
+    ext = make_extension(mixin.ExtensionMixin)(owner)
+
+    assert isinstance(vars(mixin.ExtensionMixin)['evalSpeed'], property)
+    assert ext.evalSpeed == 1 and ext.parGroupColor is owner.parGroup.Color
+    ext.evalGroupColor = (1, 2, 3)
+    owner.par.Speed.mode = ParMode.EXPRESSION
+    ext.parSpeed = 5
+    assert owner.parGroup.Color.eval() == (1, 2, 3) and owner.par.Speed.val == 1
+
+
+def test_layout_changes_regenerate_the_mixin(td, CustomParHelper, owner):
+    dat = generate(td, CustomParHelper, owner)
+    CustomParHelper.Init(make_extension()(owner), owner, use_mixin=True)
+
+    owner.addCustomPar('Gain', 2).style = 'Float'
+    CustomParHelper.UpdateCustomParsAsProperties()
+
+    assert 'evalGain' in dat.module.PROPERTIES and 'evalGain' in CustomParHelper.MIXIN_PROPERTIES
+    assert owner.fetch(CustomParHelper.MIXIN_STORAGE_KEY) == dat.module.LAYOUT_HASH
@@ -0,0 +1,55 @@
+import pytest
+
+
+@pytest.fixture
+def Extension():
+    """A fresh extension class, properties are installed on the class"""
+    class Extension:
+        def __init__(self):
+            self.parent = 'kept'
+    return Extension
+
+
+@pytest.fixture
+def owner(td):
+    owner = td.op('owner')
+    owner.addCustomPar('Speed', 1)
+    for name, val in (('Colorr', 0.1), ('Colorg', 0.2), ('Colorb', 0.3)):
+        owner.addCustomPar(name, val, group='Color')
+    owner.addCustomPar('Version', 2, page='About')
+    return owner
+
+
+def test_properties_are_placeholders_until_first_access(CustomParHelper, owner, Extension):
+    ext = Extension()
+    CustomParHelper.Init(ext, owner)
+
+    assert type(Extension.__dict__['evalSpeed']).__name__ == '_LazyProperty'
+    assert '__setattr__' not in Extension.__dict__ and '__getattr__' not in Extension.__dict__
+    assert ext.evalSpeed == 1
+    assert isinstance(Extension.__dict__['evalSpeed'], property)
+    assert ext.parGroupColor is owner.parGroup.Color
+    assert ext.parent == 'kept'
+
+
+def test_setting_an_unresolved_property_sets_the_parameter(CustomParHelper, owner, Extension):
+    ext = Extension()
+    CustomParHelper.Init(ext, owner)
+
+    ext.evalSpeed = 5
+    ext.evalGroupColor = [1, 2, 3]
+
+    assert owner.par.Speed.val == 5 and 'evalSpeed' not in ext.__dict__
+    assert owner.parGroup.Color.eval() == (1, 2, 3)
+
+
+def test_excluded_parameters_fall_back_to_plain_attributes(CustomParHelper, owner, Extension):
+    ext = Extension()
+    CustomParHelper.Init(ext, owner)
+
+    with pytest.raises(AttributeError):
+        ext.evalVersion # on the excluded About page
+    assert 'evalVersion' not in Extension.__dict__
+
+    ext.evalVersion = 7
+    assert ext.evalVersion == 7 and owner.par.Version.val == 2
@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.fixture
+def replicas(td):
+    class Replica:
+        """One extension class shared by all replicas, like a replicated component"""
+
+        def __init__(self, ownerComp, calls):
+            self.ownerComp = ownerComp
+            self.calls = calls
+
+        def onParSpeed(self, _val):
+            self.calls.append((self.ownerComp.name, _val, self.evalSpeed))
+
+    calls = []
+    owners = [td.op(f'replica{i}') for i in range(3)]
+    for i, owner in enumerate(owners):
+        owner.addCustomPar('Speed', i)
+    return [Replica(owner, calls) for owner in owners], calls
+
+
+def test_scopes_are_slotted_state_objects_not_subclasses(CustomParHelper, replicas):
+    exts, _ = replicas
+    scopes = [CustomParHelper.Init(ext, ext.ownerComp, scoped=True) for ext in exts]
+
+    assert not isinstance(scopes[0], type) and not hasattr(scopes[0], '__dict__')
+    assert type(scopes[0]).__name__ == 'CustomParScope'
+    assert CustomParHelper.Init(exts[0], exts[0].ownerComp, scoped=True) is scopes[0]
+    assert CustomParHelper.EXT_SELF is None and scopes[1].EXT_SELF is exts[1]
+
+
+def test_replicas_sharing_an_extension_class_read_and_set_their_own_parameters(CustomParHelper, replicas):
+    exts, _ = replicas
+    for ext in exts:
+        CustomParHelper.Init(ext, ext.ownerComp, scoped=True)
+
+    assert [ext.evalSpeed for ext in exts] == [0, 1, 2]
+    exts[1].evalSpeed = 5
+    assert [ext.ownerComp.par.Speed.val for ext in exts] == [0, 5, 2]
+    assert exts[2].parSpeed is exts[2].ownerComp.par.Speed
+
+
+def test_events_are_routed_to_the_scope_of_the_parameter_owner(CustomParHelper, replicas):
+    exts, calls = replicas
+    for ext in exts:
+        CustomParHelper.Init(ext, ext.ownerComp, scoped=True)
+
+    CustomParHelper.OnValueChange(None, exts[2].ownerComp.par.Speed, 0)
+    CustomParHelper.OnValueChange(None, exts[0].ownerComp.par.Speed, 0)
+
+    assert calls == [('replica2', 2, 2), ('replica0', 0, 0)]
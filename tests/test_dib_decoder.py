@@ -0,0 +1,162 @@
+import struct
+
+import numpy as np
+import pytest
+
+from dib_decoder import (BI_BITFIELDS, BI_RGB, BI_RLE8, BITMAPCOREHEADER_SIZE, BITMAPINFOHEADER_SIZE,
+                         BITMAPV3INFOHEADER_SIZE, DIBError, decode_dib, read_header)
+
+BITMAPV4HEADER_SIZE = 108
+BITMAPV5HEADER_SIZE = 124
+MASKS_565 = (0xF800, 0x07E0, 0x001F, 0)
+MASKS_BGRA = (0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000)
+
+
+def dib(rows, width, bit_count, header_size=BITMAPINFOHEADER_SIZE, compression=BI_RGB, masks=None,
+        palette=(), colors_used=0, top_down=False):
+    """Pack a DIB from its rows of pixel bytes, top row first, padding every row to a DWORD"""
+    height = len(rows)
+    if header_size == BITMAPCOREHEADER_SIZE:
+        data = struct.pack('<IHHHH', header_size, width, height, 1, bit_count)
+        data += b''.join(bytes((b, g, r)) for r, g, b in palette)
+    else:
+        data = struct.pack('<IiiHHIIiiII', header_size, width, -height if top_down else height, 1, bit_count,
+                           compression, 0, 0, 0, colors_used, 0)
+        if header_size >= BITMAPV3INFOHEADER_SIZE:
+            data += struct.pack('<IIII', *(masks or (0, 0, 0, 0)))
+        data = data.ljust(header_size, b'\0')
+        if masks and header_size == BITMAPINFOHEADER_SIZE:
+            data += struct.pack('<III', *masks[:3])
+        data += b''.join(bytes((b, g, r, 0)) for r, g, b in palette)
+    row_size = ((width * bit_count + 31) // 32) * 4
+    padded = [bytes(row).ljust(row_size, b'\xAA') for row in rows]
+    return data + b''.join(padded if top_down else padded[::-1])
+
+
+def decode(buffer):
+    return decode_dib(buffer, bottom_up=False).tolist()
+
+
+def test_core_header_with_an_rgb_triple_palette():
+    buffer = dib([[0, 1]], 2, 8, header_size=BITMAPCOREHEADER_SIZE, palette=[(255, 0, 0)] + [(0, 0, 255)] * 255)
+
+    assert read_header(buffer).colors_used == 256
+    assert decode(buffer) == [[[255, 0, 0, 255], [0, 0, 255, 255]]]
+
+
+@pytest.mark.parametrize('header_size', [BITMAPINFOHEADER_SIZE, BITMAPV3INFOHEADER_SIZE, BITMAPV4HEADER_SIZE, BITMAPV5HEADER_SIZE])
+def test_info_and_v3_to_v5_headers_find_the_pixel_bits(header_size):
+    buffer = dib([[1, 2, 3], [4, 5, 6]], 1, 24, header_size=header_size)
+
+    header = read_header(buffer)
+    assert header.header_size == header_size and header.bits_offset == header_size
+    assert decode(buffer) == [[[3, 2, 1, 255]], [[6, 5, 4, 255]]]
+
+
+def test_1_bit_palette_unpacks_bits_msb_first_and_skips_row_padding():
+    buffer = dib([[0b10100000, 0b01000000], [0b01011111, 0b11000000]], 10, 1, palette=[(0, 0, 0), (255, 255, 255)], colors_used=2)
+
+    bits = [[pixel[0] // 255 for pixel in row] for row in decode(buffer)]
+    assert bits == [[1, 0, 1, 0, 0, 0, 0, 0, 0, 1], [0, 1, 0, 1, 1, 1, 1, 1, 1, 1]]
+
+
+def test_4_bit_palette_unpacks_nibbles():
+    palette = [(i * 16, 0, 0) for i in range(16)]
+    buffer = dib([[0x1F, 0x20]], 3, 4, palette=palette)
+
+    assert [pixel[0] for pixel in decode(buffer)[0]] == [16, 240, 32]
+
+
+def test_8_bit_palette_reads_indices_past_a_short_table_as_black():
+    buffer = dib([[0, 1, 2]], 3, 8, palette=[(10, 20, 30), (40, 50, 60)], colors_used=2)
+
+    assert decode(buffer) == [[[10, 20, 30, 255], [40, 50, 60, 255], [0, 0, 0, 255]]]
+
+
+def test_16_bit_defaults_to_rgb555():
+    pixels = struct.pack('<HHH', 0x7C00, 0x03E0, 0x0010)
+    buffer = dib([pixels], 3, 16)
+
+    assert decode(buffer) == [[[255, 0, 0, 255], [0, 255, 0, 255], [0, 0, 132, 255]]]
+
+
+@pytest.mark.parametrize('header_size', [BITMAPINFOHEADER_SIZE, BITMAPV3INFOHEADER_SIZE])
+def test_16_bit_bitfields_decode_rgb565(header_size):
+    pixels = struct.pack('<HHH', 0xF800, 0x07E0, 0x0400)
+    buffer = dib([pixels], 3, 16, header_size=header_size, compression=BI_BITFIELDS, masks=MASKS_565)
+
+    assert read_header(buffer).masks == MASKS_565
+    assert decode(buffer) == [[[255, 0, 0, 255], [0, 255, 0, 255], [0, 130, 0, 255]]]
+
+
+def test_32_bit_bitfields_with_other_masks_read_whole_words():
+    masks = (0x000003FF, 0x000FFC00, 0x3FF00000, 0) # 10-bit channels, red lowest
+    buffer = dib([struct.pack('<I', 0x3FF | 0x200 << 10)], 1, 32, compression=BI_BITFIELDS, masks=masks)
+
+    assert decode(buffer) == [[[255, 128, 0, 255]]]
+
+
+def test_24_bit_rows_are_padded_to_dwords():
+    buffer = dib([[1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]], 2, 24)
+
+    assert read_header(buffer).row_size == 8
+    assert decode(buffer) == [[[3, 2, 1, 255], [6, 5, 4, 255]], [[9, 8, 7, 255], [12, 11, 10, 255]]]
+
+
+@pytest.mark.parametrize('top_down', [False, True])
+def test_rows_come_back_bottom_row_first_by_default(top_down):
+    buffer = dib([[255, 0, 0], [0, 0, 255]], 1, 24, top_down=top_down) # blue above red
+
+    assert read_header(buffer).top_down == top_down
+    assert decode_dib(buffer).tolist() == [[[255, 0, 0, 255]], [[0, 0, 255, 255]]]
+    assert decode(buffer) == [[[0, 0, 255, 255]], [[255, 0, 0, 255]]]
+
+
+def test_32_bit_info_header_uses_the_fourth_byte_as_alpha():
+    buffer = dib([[1, 2, 3, 128, 4, 5, 6, 0]], 2, 32)
+
+    assert decode(buffer) == [[[3, 2, 1, 128], [6, 5, 4, 0]]]
+
+
+def test_32_bit_all_zero_alpha_is_opaque():
+    buffer = dib([[1, 2, 3, 0, 4, 5, 6, 0]], 2, 32)
+
+    assert decode(buffer) == [[[3, 2, 1, 255], [6, 5, 4, 255]]]
+
+
+def test_v5_alpha_mask_delivers_alpha():
+    buffer = dib([[1, 2, 3, 64]], 1, 32, header_size=BITMAPV5HEADER_SIZE, compression=BI_BITFIELDS, masks=MASKS_BGRA)
+
+    assert decode(buffer) == [[[3, 2, 1, 64]]]
+
+
+def test_v4_header_without_alpha_mask_is_opaque():
+    buffer = dib([[1, 2, 3, 64]], 1, 32, header_size=BITMAPV4HEADER_SIZE, masks=MASKS_BGRA[:3] + (0,))
+
+    assert decode(buffer) == [[[3, 2, 1, 255]]]
+
+
+def test_decodes_into_a_given_output_array():
+    buffer = dib([[1, 2, 3]], 1, 24)
+    out = np.zeros((1, 1, 4), dtype=np.uint8)
+
+    assert decode_dib(buffer, out=out) is out and out.tolist() == [[[3, 2, 1, 255]]]
+    with pytest.raises(DIBError):
+        decode_dib(buffer, out=np.zeros((2, 1, 4), dtype=np.uint8))
+
+
+@pytest.mark.parametrize('buffer, message', [
+    (b'\x28\0', 'too small'),
+    (struct.pack('<I', 20).ljust(64, b'\0'), 'header size'),
+    (dib([[1, 2, 3]], 1, 24)[:30], 'Truncated DIB header'),
+    (dib([[1, 2, 3]], 1, 24, header_size=BITMAPCOREHEADER_SIZE)[:8], 'Truncated BITMAPCOREHEADER'),
+    (dib([[1, 2, 3], [4, 5, 6]], 1, 24)[:-1], 'Truncated DIB pixel data'),
+    (dib([[0, 0]], 1, 16, compression=BI_BITFIELDS, masks=MASKS_565)[:BITMAPINFOHEADER_SIZE + 8], 'Truncated DIB color masks'),
+    (dib([[0]], 1, 2), 'bit depth'),
+    (dib([[0]], 1, 8, compression=BI_RLE8), 'compression'),
+    (dib([[1, 2, 3]], 1, 24, compression=BI_BITFIELDS, masks=MASKS_565), 'not valid'),
+    (dib([[]], 0, 24), 'dimensions'),
+])
+def test_truncated_or_unsupported_data_raises(buffer, message):
+    with pytest.raises(DIBError, match=message):
+        decode_dib(buffer)
@@ -0,0 +1,90 @@
+from NoNodeScheduling import FrameScheduler
+
+
+def test_drains_highest_priority_first_in_submission_order(clock, schedule):
+    calls = []
+    scheduler = FrameScheduler(schedule, clock=clock)
+
+    scheduler.Submit(calls.append, ('low',), priority=-1)
+    scheduler.Submit(calls.append, ('first',), priority=5)
+    scheduler.Submit(calls.append, ('default',))
+    scheduler.Submit(calls.append, ('second',), priority=5)
+
+    assert len(schedule.calls) == 1 # one drain per frame, however many submissions
+    assert scheduler.Pending == 4
+
+    schedule.run_all()
+    assert calls == ['first', 'second', 'default', 'low']
+    assert scheduler.Pending == 0
+
+
+def test_budget_carries_the_rest_over_to_the_next_frame(clock, schedule):
+    calls = []
+
+    def slow(name):
+        calls.append(name)
+        clock.now += 0.003
+
+    scheduler = FrameScheduler(schedule, budget_ms=5, clock=clock)
+    for priority, name in enumerate(('d', 'c', 'b', 'a')):
+        scheduler.Submit(slow, (name,), priority)
+
+    assert scheduler.Drain() == 2
+    assert calls == ['a', 'b']
+    assert [(frames, ms) for _, frames, ms in schedule.calls] == [(0, 0.0), (1, 0.0)]
+
+    # a late high priority submission overtakes the calls carried over
+    scheduler.Submit(slow, ('urgent',), priority=10)
+    schedule.calls.clear()
+    assert scheduler.Drain() == 2
+    assert calls == ['a', 'b', 'urgent', 'c']
+
+    assert scheduler.Drain() == 1
+    assert calls == ['a', 'b', 'urgent', 'c', 'd']
+    assert schedule.calls == [(scheduler.Drain, 1, 0.0)]
+
+
+def test_a_call_over_budget_still_makes_progress(clock, schedule):
+    calls = []
+
+    def too_slow():
+        calls.append(clock.now)
+        clock.now += 1.0
+
+    scheduler = FrameScheduler(schedule, budget_ms=1, clock=clock)
+    scheduler.Submit(too_slow)
+    scheduler.Submit(too_slow)
+
+    assert scheduler.Drain() == 1
+    assert scheduler.Drain() == 1
+    assert len(calls) == 2
+
+
+def test_without_budget_everything_runs_in_one_frame(clock, schedule):
+    calls = []
+    scheduler = FrameScheduler(schedule, clock=clock)
+    for i in range(100):
+        scheduler.Submit(calls.append, (i,))
+    clock.now += 10.0
+
+    assert scheduler.Drain() == 100
+    assert calls == list(range(100))
+    assert scheduler.Pending == 0
+
+
+def test_failing_call_keeps_the_rest_queued(clock, schedule):
+    calls = []
+    scheduler = FrameScheduler(schedule, clock=clock)
+    scheduler.Submit(lambda: 1 / 0, priority=1)
+    scheduler.Submit(calls.append, ('next',))
+    schedule.calls.clear()
+
+    try:
+        scheduler.Drain()
+    except ZeroDivisionError:
+        pass
+    assert scheduler.Pending == 1
+    assert len(schedule.calls) == 1
+
+    schedule.run_all()
+    assert calls == ['next']
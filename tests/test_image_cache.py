@@ -0,0 +1,156 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import image_cache
+from image_cache import INDEX_VERSION, ImageCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manually advanced time.time of the cache module"""
+    now = [1000.0]
+    monkeypatch.setattr(image_cache.time, 'time', lambda: now[0])
+    return now
+
+
+def image(value, shape=(2, 2, 4)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def cached(cache, value, size):
+    """Write a file of the given size for an image and add it to the cache, returns its digest and path"""
+    digest = cache.digest(image(value))
+    file_path = cache.path_for(digest)
+    with open(file_path, 'wb') as f:
+        f.write(b'\0' * size)
+    cache.add(digest, file_path)
+    return digest, file_path
+
+
+def test_digest_depends_on_pixels_and_shape_only():
+    pixels = np.arange(16, dtype=np.uint8).reshape(2, 2, 4)
+
+    assert ImageCache.digest(pixels) == ImageCache.digest(pixels.copy())
+    assert ImageCache.digest(pixels) == ImageCache.digest(np.asfortranarray(pixels))
+    assert ImageCache.digest(pixels) != ImageCache.digest(pixels.reshape(1, 4, 4))
+    assert ImageCache.digest(pixels) != ImageCache.digest(pixels[::-1])
+
+
+def test_store_writes_once_and_leaves_the_index_alone(tmp_path, monkeypatch):
+    cache = ImageCache(str(tmp_path))
+    writes = []
+    monkeypatch.setattr(image_cache, 'write_png', lambda file_path, rgba: writes.append(file_path) or open(file_path, 'wb').close())
+
+    digest, file_path = cache.store(image(1))
+    assert cache.store(image(1)) == (digest, file_path)
+
+    assert writes == [file_path] and file_path == cache.path_for(digest)
+    assert cache.entries == {} and not cache.dirty and not os.path.exists(cache.index_path)
+
+
+def test_load_drops_entries_whose_files_are_missing(tmp_path):
+    cache = ImageCache(str(tmp_path))
+    kept, _ = cached(cache, 1, 10)
+    gone, gone_path = cached(cache, 2, 10)
+    cache.save()
+    os.remove(gone_path)
+
+    assert list(ImageCache(str(tmp_path)).entries) == [kept]
+
+
+@pytest.mark.parametrize('index', [
+    {'version': INDEX_VERSION + 1, 'entries': {}},
+    {'entries': {}},
+    'not an object',
+])
+def test_load_ignores_indexes_of_other_versions_or_shapes(tmp_path, index):
+    cache = ImageCache(str(tmp_path))
+    digest, file_path = cached(cache, 1, 10)
+    if isinstance(index, dict):
+        index['entries'] = {digest: {'file': os.path.basename(file_path), 'size': 10, 'created': 0, 'last_used': 0}}
+    with open(cache.index_path, 'w') as f:
+        json.dump(index, f)
+
+    assert ImageCache(str(tmp_path)).entries == {}
+
+
+def test_lookup_marks_images_as_recently_used(tmp_path, clock):
+    cache = ImageCache(str(tmp_path))
+    digest, file_path = cached(cache, 1, 10)
+    cache.flush()
+
+    clock[0] += 5
+    assert cache.lookup(digest) == file_path
+    assert cache.entries[digest]['last_used'] == 1005.0 and cache.dirty
+    assert cache.lookup('unknown') is None
+
+
+def test_lookup_forgets_images_whose_file_was_deleted(tmp_path):
+    cache = ImageCache(str(tmp_path))
+    digest, file_path = cached(cache, 1, 10)
+    os.remove(file_path)
+
+    assert cache.lookup(digest) is None and digest not in cache.entries
+
+
+def test_evict_removes_least_recently_used_until_within_budget(tmp_path, clock):
+    cache = ImageCache(str(tmp_path))
+    paths = []
+    for value in range(4):
+        clock[0] += 1
+        paths.append(cached(cache, value, 10)[1])
+    clock[0] += 1
+    cache.lookup(cache.digest(image(0))) # oldest becomes the most recent
+
+    assert cache.evict(25) == [paths[1], paths[2]]
+    assert cache.total_size() == 20
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in (paths[0], paths[3]))
+
+
+def test_evict_skips_kept_files(tmp_path, clock):
+    cache = ImageCache(str(tmp_path))
+    paths = []
+    for value in range(3):
+        clock[0] += 1
+        paths.append(cached(cache, value, 10)[1])
+
+    assert cache.evict(15, keep=[paths[0]]) == [paths[1], paths[2]]
+    assert os.path.exists(paths[0])
+
+
+def test_evict_asks_for_kept_files_only_when_it_has_something_to_delete(tmp_path):
+    cache = ImageCache(str(tmp_path))
+    _, file_path = cached(cache, 1, 10)
+    calls = []
+
+    def keep():
+        calls.append(True)
+        return [file_path]
+
+    assert cache.evict(10, keep=keep) == [] and calls == []
+    assert cache.evict(5, keep=keep) == [] and calls == [True]
+
+
+def test_budget_zero_disables_eviction(tmp_path):
+    cache = ImageCache(str(tmp_path))
+    cached(cache, 1, 10)
+
+    assert cache.evict(0) == [] and cache.total_size() == 10
+
+
+def test_flush_writes_only_changed_indexes(tmp_path, monkeypatch):
+    cache = ImageCache(str(tmp_path))
+    assert not cache.flush() and not os.path.exists(cache.index_path)
+
+    digest, _ = cached(cache, 1, 10)
+    cache.lookup(digest)
+    writes = []
+    save = cache.save
+    monkeypatch.setattr(cache, 'save', lambda: writes.append(True) or save())
+
+    assert cache.flush() and not cache.flush()
+    assert writes == [True]
+    assert list(ImageCache(str(tmp_path)).entries) == [digest]
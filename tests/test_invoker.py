@@ -0,0 +1,89 @@
+import builtins
+import functools
+
+import pytest
+
+FORMS = ((), (2,), (0, 2), (0, 1, 2)) # (channel, sampleIndex, val) like CHOP_FORMS
+ARGS = ('chan', 0, 0.5)
+
+
+@pytest.fixture
+def Invoker(NoNode):
+    return builtins.mod('NoNode').Invoker
+
+
+def decorated(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
+class Extension:
+    def onValue(self, val):
+        return (val,)
+
+    def onAll(self, *args):
+        return args
+
+    @decorated
+    def onDecorated(self, channel, val):
+        return (channel, val)
+
+    def onDefaults(self, channel, val=None, index=None):
+        return (channel, val, index)
+
+
+class Callable:
+    def __call__(self, channel, val):
+        return (channel, val)
+
+
+def both(channel, val):
+    return (channel, val)
+
+
+@pytest.mark.parametrize('callback, expected', [
+    (functools.partial(lambda prefix, val: (prefix, val), 'p'), ('p', 0.5)),
+    (Callable(), ('chan', 0.5)),
+    (Extension().onAll, ('chan', 0, 0.5)),
+    (Extension().onDecorated, ('chan', 0.5)),
+    (decorated(lambda: 'none'), 'none'),
+    (Extension().onDefaults, ('chan', 0, 0.5)),
+    (Extension().onValue, (0.5,)),
+])
+def test_callables_receive_the_arguments_they_accept(Invoker, callback, expected):
+    assert Invoker.Call(callback, FORMS, *ARGS) == expected
+    assert Invoker.Adapt(callback, FORMS)(*ARGS) == expected
+
+
+def test_unsupported_signatures_are_not_called(Invoker):
+    forms = (None, (0,))
+    assert Invoker.Plan(lambda: None, forms) is None
+    assert Invoker.Adapt(lambda: pytest.fail('must not be called'), forms)(*ARGS) is None
+
+
+@pytest.mark.parametrize('make_callback', [
+    lambda: functools.partial(both, 'chan'),
+    lambda: decorated(both),
+    lambda: Extension().onDecorated,
+    lambda: Extension().onValue,
+    lambda: Callable(),
+])
+def test_plans_are_inspected_once_per_callable(Invoker, monkeypatch, make_callback):
+    callback = make_callback()
+    Invoker.Call(callback, FORMS, *ARGS)
+    # fresh bound methods of the same method share the plan of the first one
+    if hasattr(callback, '__self__'):
+        callback = getattr(callback.__self__, callback.__name__)
+    monkeypatch.setattr(Invoker, '_Invoker__resolvePlan', classmethod(lambda *args: pytest.fail('plan resolved again')))
+
+    Invoker.Call(callback, FORMS, *ARGS)
+
+
+def test_partials_of_the_same_function_get_their_own_plans(Invoker):
+    full = functools.partial(lambda a, b, c: (a, b, c))
+    one = functools.partial(full, 'a', 'b')
+
+    assert Invoker.Plan(full, FORMS) == (0, 1, 2)
+    assert Invoker.Plan(one, FORMS) == (2,)
@@ -0,0 +1,68 @@
+import builtins
+import types
+
+import pytest
+
+
+@pytest.fixture
+def NameFilter(NoNode):
+    return builtins.mod('NoNode').NameFilter # the module NoNode was loaded from
+
+
+@pytest.mark.parametrize('patterns, expected', [
+    ('Color* ^Colora', ['Colorr', 'Colorg']),
+    ('Color*, ^Colora,^Colorg', ['Colorr']),
+    (['*', '^Color?', 'Colora'], ['Speed', 'Colora', 'Version Ctrl']),
+    (['Version Ctrl', 'Speed'], ['Speed', 'Version Ctrl']),
+    ('^Speed', []),
+    ('Col[ob]*', ['Colorr', 'Colorg', 'Colora']),
+])
+def test_name_filter_matches_like_tdu_match(NameFilter, patterns, expected):
+    names = ['Speed', 'Colorr', 'Colorg', 'Colora', 'Version Ctrl']
+    name_filter = NameFilter(patterns)
+
+    assert [name for name in names if name_filter(name)] == expected
+
+
+def test_channel_exclusions_apply_to_the_patterns_of_the_same_callback(td, NoNode):
+    chop = td.op('lfo1')
+    calls = []
+    NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop, 'chan* ^chan2', lambda channel, val: calls.append(('all', channel.name)))
+    NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop, 'chan2', lambda channel, val: calls.append(('chan2', channel.name)))
+
+    for name in ('chan1', 'chan2'):
+        NoNode.OnChopExec(NoNode.ChopExecType.ValueChange, types.SimpleNamespace(owner=chop, name=name), 0, 1.0, 0.0)
+
+    assert calls == [('all', 'chan1'), ('chan2', 'chan2')]
+
+
+def test_parameter_exclusions_apply_to_the_selectors_of_the_same_callback(td, NoNode):
+    owner = td.op('base1')
+    pars = [owner.par.add(name) for name in ('Speed', 'Speedmax', 'Gain')]
+    calls = []
+    NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, owner, 'Speed* ^Speedmax', lambda par, val: calls.append(par.name))
+
+    for par in pars:
+        NoNode.OnParExec(NoNode.ParExecType.ValueChange, par, 1, 0)
+
+    assert calls == ['Speed']
+
+
+def test_callback_table_leaves_out_excluded_parameters(CustomParHelper, td):
+    class Extension:
+        def __init__(self, ownerComp):
+            self.ownerComp = ownerComp
+            self.calls = []
+
+        def onValueChange(self, _par):
+            self.calls.append(_par.name)
+
+    owner = td.op('owner')
+    pars = [owner.addCustomPar(name) for name in ('Speed', 'Colorr', 'Colora')] + [owner.addCustomPar('Gain', page='Setup')]
+    ext = Extension(owner)
+    CustomParHelper.Init(ext, owner, par_callbacks=['*', '^Color?', 'Colorr'], except_pages=['Setup'])
+
+    for par in pars:
+        CustomParHelper.OnValueChange(owner, par, 0)
+
+    assert ext.calls == ['Speed', 'Colorr']
@@ -0,0 +1,107 @@
+import pytest
+
+
+@pytest.fixture
+def chop(td):
+    return td.CHOP('lfo1', {'a': 0.0, 'b': 0.0, 'c': 0.0})
+
+
+def register(NoNode, event_type, chop, channels='*'):
+    """Register a batched callback recording (indices, vals, prevs) as plain lists"""
+    calls = []
+    NoNode.RegisterChopExec(getattr(NoNode.ChopExecType, event_type), chop, channels,
+                            lambda chop, indices, vals, prevs: calls.append((indices.tolist(), vals.tolist(), prevs.tolist())))
+    return calls
+
+
+def test_value_change_batch_reports_the_changed_channels_once_per_frame(td, NoNode, chop):
+    calls = register(NoNode, 'ValueChangeBatch', chop)
+    td.pump() # first read, nothing to compare against
+
+    chop.values.update(a=1.0, c=0.5)
+    td.pump()
+    td.pump()
+
+    assert calls == [([0, 2], [1.0, 0.5], [0.0, 0.0])]
+
+
+@pytest.mark.parametrize('event_type, expected', [
+    ('OffToOnBatch', [([0], [0.75], [0.5])]),
+    ('OnToOffBatch', [([1], [0.5], [0.75])]),
+])
+def test_transitions_cross_the_threshold_strictly(td, NoNode, event_type, expected):
+    NoNode.CHOP_BATCH_THRESHOLD = 0.5 # on means above the threshold, at it is off
+    chop = td.CHOP('lfo1', {'a': 0.5, 'b': 0.75, 'c': 0.25, 'd': 0.75})
+    calls = register(NoNode, event_type, chop)
+    td.pump()
+
+    chop.values.update(a=0.75, b=0.5, c=0.5, d=1.0)
+    td.pump()
+
+    assert calls == expected
+
+
+def test_selections_are_resolved_again_when_channels_are_renamed_or_reordered(td, NoNode, chop):
+    calls = register(NoNode, 'ValueChangeBatch', chop, 'b')
+    td.pump()
+
+    chop.values = {'b': 0.0, 'a': 0.0, 'c': 0.0} # reordered
+    td.pump()
+    chop.values['b'] = 1.0
+    td.pump()
+    chop.values = {'x': 1.0, 'y': 2.0, 'b': 3.0} # renamed, values at the old positions of b differ
+    td.pump()
+    chop.values['b'] = 4.0
+    td.pump()
+
+    assert calls == [([0], [1.0], [0.0]), ([2], [4.0], [3.0])]
+
+
+def test_channel_layout_changes_reset_the_previous_values(td, NoNode, chop):
+    calls = register(NoNode, 'ValueChangeBatch', chop)
+    td.pump()
+
+    chop.values = {'a': 1.0, 'b': 2.0, 'c': 3.0, 'd': 4.0} # a channel was added
+    td.pump()
+
+    assert calls == []
+
+
+def test_selecting_every_channel_skips_the_index_lookup(td, NoNode, chop):
+    register(NoNode, 'ValueChangeBatch', chop, '*')
+    register(NoNode, 'ValueChangeBatch', chop, 'a c')
+    td.pump()
+
+    subscriptions = NoNode.CHOP_BATCH_WATCHERS[chop].subscriptions[NoNode.ChopExecType.ValueChangeBatch]
+    selections = [None if selection is None else selection.tolist() for selection, _callback in subscriptions]
+    assert sorted(selections, key=str) == [None, [0, 2]]
+
+
+@pytest.mark.parametrize('event_type, expected', [
+    ('WhileOnBatch', [([1], [1.0], [1.0]), ([1], [1.0], [1.0]), ([0, 1], [0.5, 1.0], [0.0, 1.0])]),
+    ('WhileOffBatch', [([0, 2], [0.0, 0.0], [0.0, 0.0]), ([0, 2], [0.0, 0.0], [0.0, 0.0]), ([2], [0.0], [0.0])]),
+])
+def test_while_batches_get_the_active_channels_once_per_frame(td, NoNode, chop, event_type, expected):
+    chop.values['b'] = 1.0
+    calls = register(NoNode, event_type, chop)
+
+    td.pump()
+    td.pump()
+    chop.values['a'] = 0.5
+    td.pump()
+
+    assert calls == expected
+
+
+@pytest.mark.parametrize('event_type, values', [
+    ('WhileOnBatch', {'a': 0.0, 'b': -1.0}),
+    ('WhileOffBatch', {'a': 1.0, 'b': 0.5}),
+])
+def test_while_batches_are_not_called_without_active_channels(td, NoNode, event_type, values):
+    chop = td.CHOP('lfo1', values)
+    calls = register(NoNode, event_type, chop)
+
+    td.pump()
+    td.pump()
+
+    assert calls == []
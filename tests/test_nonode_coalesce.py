@@ -0,0 +1,32 @@
+def table(td):
+    return td.DAT('config', [['name', 'value'], ['speed', '1'], ['gain', '0']])
+
+
+def test_coalesced_cell_changes_keep_every_cell(td, NoNode):
+    dat = table(td)
+    calls = []
+    NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat, lambda dat, cells, prev: calls.append((cells, prev)), coalesce=True)
+
+    speed, gain = dat[1, 1], dat[2, 1]
+    NoNode.OnDatExec(NoNode.DatExecType.CellChange, dat, cells=[speed], prev=['0'])
+    NoNode.OnDatExec(NoNode.DatExecType.CellChange, dat, cells=[gain], prev=['1'])
+    NoNode.OnDatExec(NoNode.DatExecType.CellChange, dat, cells=[speed], prev=['1'])
+    td.pump()
+
+    assert calls == [([speed, gain], ['0', '1'])]
+
+
+def test_coalesced_region_diffs_keep_first_old_and_last_new_value(td, NoNode):
+    dat = table(td)
+    calls = []
+    NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat, lambda diffs: calls.append(diffs), coalesce=True, cols='value')
+
+    speed = dat[1, 1]
+    speed.val = '2'
+    NoNode.OnDatExec(NoNode.DatExecType.CellChange, dat, cells=[speed], prev=['1'])
+    NoNode.OnDatExec(NoNode.DatExecType.CellChange, dat, cells=[dat[2, 1]], prev=['1'])
+    speed.val = '3'
+    NoNode.OnDatExec(NoNode.DatExecType.CellChange, dat, cells=[speed], prev=['2'])
+    td.pump()
+
+    assert calls == [[('speed', 'value', '1', '3'), ('gain', 'value', '1', '0')]]
@@ -0,0 +1,48 @@
+import pytest
+
+
+@pytest.fixture
+def config(td):
+    return td.DAT('config', [['name', 'value'], ['speed', '1'], ['gain', '0']])
+
+
+def change(NoNode, dat, row, col, old):
+    NoNode.OnDatExec(NoNode.DatExecType.CellChange, dat, cells=[dat[row, col]], prev=[old])
+
+
+def test_filters_are_rejected_for_other_event_types(NoNode, config):
+    with pytest.raises(ValueError):
+        NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, config, print, rows='speed')
+    with pytest.raises(ValueError):
+        NoNode.DeregisterDatExec(NoNode.DatExecType.RowChange, config, cols='value')
+    assert not NoNode.DATEXEC_REGIONS
+
+
+def test_identical_region_replaces_the_earlier_one(NoNode, config):
+    calls = []
+    NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, config, calls.append, rows='speed gain', cols='value')
+    NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, config, calls.append, rows=['gain', 'speed'], cols='value')
+
+    assert len(NoNode.DATEXEC_REGIONS[config]) == 1
+    assert NoNode.WATCHED_OPS[config] == 1
+
+    change(NoNode, config, 1, 1, '0')
+    assert calls == [[('speed', 'value', '0', '1')]]
+
+
+def test_deregister_a_single_region(NoNode, config):
+    speed, gain = [], []
+    NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, config, speed.append, rows='speed', cols='value')
+    NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, config, gain.append, rows='gain', cols='value')
+
+    NoNode.DeregisterDatExec(NoNode.DatExecType.CellChange, config, speed.append, rows='speed', cols='value')
+    change(NoNode, config, 1, 1, '0')
+    change(NoNode, config, 2, 1, '1')
+
+    assert speed == []
+    assert gain == [[('gain', 'value', '1', '0')]]
+    assert NoNode.WATCHED_OPS[config] == 1
+
+    NoNode.DeregisterDatExec(NoNode.DatExecType.CellChange, config, gain.append)
+    assert config not in NoNode.DATEXEC_REGIONS
+    assert config not in NoNode.WATCHED_OPS
@@ -0,0 +1,48 @@
+import gc
+import time
+
+
+def drain(td, NoNode, timeout=5):
+    deadline = time.monotonic() + timeout
+    while NoNode.OFFLOADER.Pending and time.monotonic() < deadline:
+        td.pump()
+        time.sleep(0.001)
+    td.pump()
+
+
+def test_worker_gets_plain_values(td, NoNode):
+    dat = td.DAT('config', [['name', 'value'], ['speed', '1']])
+    results = []
+
+    class Ext:
+        def parse(self, rows):
+            return {row[0]: float(row[1]) for row in rows[1:]}
+
+        def apply(self, result):
+            results.append(result)
+
+    ext = Ext()
+    NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, dat, ext.parse, offload=ext.apply)
+    NoNode.OnDatExec(NoNode.DatExecType.TableChange, dat)
+    drain(td, NoNode)
+
+    assert results == [{'speed': 1.0}]
+
+
+def test_dead_callback_is_not_submitted_and_swept(td, NoNode):
+    dat = td.DAT('config', [['name', 'value']])
+
+    class Ext:
+        def parse(self, rows):
+            return rows
+
+    ext = Ext()
+    NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, dat, ext.parse, offload=True)
+    del ext
+    gc.collect()
+
+    NoNode.OnDatExec(NoNode.DatExecType.TableChange, dat)
+
+    assert NoNode.OFFLOADER.Pending == 0
+    td.pump()
+    assert dat not in NoNode.DATEXEC_CALLBACKS.get(NoNode.DatExecType.TableChange, {})
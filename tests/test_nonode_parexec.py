@@ -0,0 +1,59 @@
+import types
+
+
+def change(NoNode, par, val):
+    prev, par.val = par.val, val
+    NoNode.OnParExec(NoNode.ParExecType.ValueChange, par, val, prev)
+
+
+def test_coalesced_parameters_changed_in_the_same_frame_are_all_delivered(td, NoNode):
+    owner = td.op('base1')
+    speed, speedy = owner.par.add('Speed'), owner.par.add('Speedy')
+    calls = []
+    NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, owner, 'Speed*', lambda par, val: calls.append((par.name, val)),
+                           coalesce=True)
+
+    change(NoNode, speed, 1)
+    change(NoNode, speedy, 2)
+    change(NoNode, speed, 3)
+    td.pump()
+
+    assert calls == [('Speed', 3), ('Speedy', 2)]
+
+
+def test_page_selector_follows_a_parameter_to_another_page(td, NoNode):
+    owner = td.op('base1')
+    setup, animation = types.SimpleNamespace(name='Setup'), types.SimpleNamespace(name='Animation')
+    speed = owner.par.add('Speed')
+    speed.page = setup
+    calls = []
+    NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, owner, ('page', 'Animation'), lambda val: calls.append(val))
+
+    change(NoNode, speed, 1)
+    speed.page = animation
+    change(NoNode, speed, 2)
+
+    assert calls == [2]
+
+
+def test_sweep_keeps_the_resolved_table_unless_a_parameter_registration_was_pruned(td, NoNode):
+    owner = td.op('base1')
+    speed = owner.par.add('Speed')
+    NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, owner, 'Speed', lambda val: None)
+    change(NoNode, speed, 1)
+    table = NoNode.PAREXEC_TABLE[NoNode.ParExecType.ValueChange]
+
+    NoNode.Sweep()
+    assert NoNode.PAREXEC_TABLE[NoNode.ParExecType.ValueChange] is table
+
+    class Extension:
+        def on_gain(self, val):
+            pass
+
+    ext = Extension()
+    gain = owner.par.add('Gain')
+    NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, owner, 'Gain', ext.on_gain)
+    del ext
+    change(NoNode, gain, 1) # reports the entry dead
+    NoNode.Sweep()
+    assert NoNode.ParExecType.ValueChange not in NoNode.PAREXEC_TABLE
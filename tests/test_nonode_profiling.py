@@ -0,0 +1,123 @@
+import builtins
+import time
+
+import pytest
+
+
+@pytest.fixture
+def module(NoNode):
+    return builtins.mod('NoNode')
+
+
+@pytest.fixture
+def durations(monkeypatch):
+    """perf_counter advancing by the durations appended to the list, one per timed call"""
+    durations = []
+    now = [0.0]
+
+    def perf_counter():
+        if durations:
+            now[0] += durations.pop(0)
+        return now[0]
+
+    monkeypatch.setattr(time, 'perf_counter', perf_counter)
+    return durations
+
+
+class StatsTable:
+    def __init__(self):
+        self.valid = True
+        self.rows = []
+
+    def clear(self):
+        self.rows = []
+
+    def appendRow(self, row):
+        self.rows.append(row)
+
+
+def table(td):
+    return td.DAT('config', [['name', 'value'], ['speed', '1']])
+
+
+def test_stats_hold_count_total_mean_and_p95(module):
+    stats = module._CallStats(window=20)
+    for ms in range(1, 21):
+        stats.Add(ms / 1000.0)
+
+    summary = stats.Summary()
+    assert summary['count'] == 20
+    assert summary['total_ms'] == pytest.approx(210.0)
+    assert summary['mean_ms'] == pytest.approx(10.5)
+    assert summary['p95_ms'] == pytest.approx(19.05)
+
+
+def test_ring_buffer_keeps_the_latest_durations_for_the_p95(module):
+    stats = module._CallStats(window=3)
+    for ms in (100, 1, 2, 3):
+        stats.Add(ms / 1000.0)
+
+    assert list(stats.samples) == pytest.approx([0.001, 0.002, 0.003])
+    assert stats.Summary()['count'] == 4 and stats.Summary()['p95_ms'] == pytest.approx(2.9)
+
+    stats.Reset(window=5)
+    assert stats.count == 0 and stats.total == 0.0 and stats.samples.maxlen == 5
+    assert stats.Summary() == {'count': 0, 'total_ms': 0.0, 'mean_ms': 0.0, 'p95_ms': 0.0}
+
+
+def test_profiled_callbacks_are_timed_and_written_to_the_stats_table(td, NoNode, durations):
+    dat = table(td)
+    stats_table = StatsTable()
+
+    def rebuild(dat):
+        durations.append(0.002)
+
+    NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, dat, rebuild)
+    NoNode.EnableProfiling(stats_table)
+    NoNode.OnDatExec(NoNode.DatExecType.TableChange, dat)
+    NoNode.OnDatExec(NoNode.DatExecType.TableChange, dat)
+    td.pump()
+
+    [(label, stats)] = NoNode.Stats().items()
+    assert label.startswith('DatExec.TableChange') and label.endswith('rebuild')
+    assert stats['count'] == 2 and stats['total_ms'] == pytest.approx(4.0) and stats['mean_ms'] == pytest.approx(2.0)
+    assert stats_table.rows == [['callback', 'count', 'total_ms', 'mean_ms', 'p95_ms'], [label, 2, '4.000', '2.000', '2.000']]
+
+
+def test_reset_stats_starts_a_new_window(td, NoNode, durations):
+    dat = table(td)
+    NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, dat, lambda: durations.append(0.001))
+    NoNode.EnableProfiling()
+    NoNode.OnDatExec(NoNode.DatExecType.TableChange, dat)
+
+    NoNode.EnableProfiling(window=2)
+    NoNode.ResetStats()
+
+    assert NoNode.Stats() == {}
+    assert [stats.samples.maxlen for stats in NoNode.PROFILE_STATS.values()] == [2]
+
+
+@pytest.mark.parametrize('options', [{}, {'priority': 0}, {'coalesce': True}])
+def test_disabling_profiling_unwraps_the_bare_callback(td, NoNode, module, options):
+    dat = table(td)
+    NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, dat, lambda: None, **options)
+    callbacks = NoNode.DATEXEC_CALLBACKS[NoNode.DatExecType.TableChange]
+
+    def innermost(callback):
+        while hasattr(callback, 'callback'):
+            callback = callback.callback
+        return callback
+
+    def profiled(callback):
+        while not isinstance(callback, module._WeakCallback):
+            if isinstance(callback, module._ProfiledCallback):
+                return True
+            callback = callback.callback
+        return False
+
+    entry, bare = callbacks[dat], innermost(callbacks[dat])
+    NoNode.EnableProfiling()
+    assert profiled(callbacks[dat]) and innermost(callbacks[dat]) is bare
+
+    NoNode.DisableProfiling()
+    assert callbacks[dat] is entry and not profiled(entry) and innermost(entry) is bare
@@ -0,0 +1,65 @@
+import pytest
+
+
+class Extension:
+    def __init__(self):
+        self.calls = []
+
+    def on_table(self, dat):
+        self.calls.append(('table', dat.name))
+
+    def on_speed(self, par, val):
+        self.calls.append(('speed', val))
+
+    def on_region(self, dat, diffs):
+        self.calls.append(('region', diffs))
+
+
+def register(td, NoNode, ext):
+    config, base = td.op('config'), td.op('base1')
+    base.par.add('Speed')
+    NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, config, ext.on_table)
+    NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, config, ext.on_region, rows='speed', coalesce=True)
+    NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, base, 'Speed Gain', ext.on_speed)
+
+
+def fire(td, NoNode):
+    base = td.op('base1')
+    NoNode.OnDatExec(NoNode.DatExecType.TableChange, td.op('config'))
+    NoNode.OnParExec(NoNode.ParExecType.ValueChange, base.par.Speed, 1, 0)
+
+
+@pytest.mark.parametrize('from_dict', [False, True])
+def test_restore_swaps_rebuilt_tables_in_for_the_new_instance(td, NoNode, monkeypatch, from_dict):
+    old = Extension()
+    register(td, NoNode, old)
+    watched = dict(NoNode.WATCHED_OPS)
+    snapshot = NoNode.Snapshot() if from_dict else True
+
+    new = Extension()
+    for name in ('RegisterChopExec', 'RegisterDatExec', 'RegisterParExec', 'RegisterKeyboardShortcut'):
+        monkeypatch.setattr(NoNode, name, lambda *args, **kwargs: pytest.fail('restore must not replay registrations'))
+    assert NoNode.Init(td.op('owner'), extension_self=new, restore=snapshot)
+
+    assert NoNode.WATCHED_OPS == watched
+    assert NoNode.DAT_EXEC_MAP[NoNode.DatExecType.TableChange].par.active.val is True
+    assert NoNode.DAT_EXEC_MAP[NoNode.DatExecType.RowChange].par.active.val is False
+    [region] = NoNode.DATEXEC_REGIONS[td.op('config')]
+    assert region.key == (('speed',), (), ())
+    assert set(NoNode.PAREXEC_CALLBACKS[NoNode.ParExecType.ValueChange][td.op('base1')]) == {'Speed', 'Gain'}
+
+    fire(td, NoNode)
+    assert new.calls == [('table', 'config'), ('speed', 1)]
+    assert old.calls == []
+
+
+def test_restore_leaves_out_registrations_of_other_classes(td, NoNode):
+    register(td, NoNode, Extension())
+
+    class Other:
+        pass
+
+    assert not NoNode.Init(td.op('owner'), extension_self=Other(), restore=True)
+    assert NoNode.WATCHED_OPS == {}
+    assert NoNode.DATEXEC_CALLBACKS == {}
+    assert td.op('config').color == (0.55, 0.55, 0.55)
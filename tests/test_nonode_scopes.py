@@ -0,0 +1,73 @@
+import types
+
+
+def fire_chop(NoNode, chop, name='x', val=1.0):
+    NoNode.OnChopExec(NoNode.ChopExecType.ValueChange, types.SimpleNamespace(owner=chop, name=name), 0, val, 0.0)
+
+
+def test_scopes_keep_their_own_tables_and_both_get_the_event(td, NoNode):
+    chop = td.op('lfo1')
+    calls = []
+    a, b = NoNode.Scope(td.op('a')), NoNode.Scope(td.op('b'))
+    a.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop, 'x', lambda val: calls.append(('a', val)))
+    b.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop, 'x', lambda val: calls.append(('b', val)))
+
+    assert NoNode.CHOPEXEC_CALLBACKS == {}
+    assert set(a.CHOPEXEC_CALLBACKS[NoNode.ChopExecType.ValueChange]) == {chop}
+    fire_chop(NoNode, chop)
+    assert calls == [('a', 1.0), ('b', 1.0)]
+    assert NoNode.WATCHED_OPS[chop] == 2
+
+
+def test_clearing_a_scope_leaves_other_scopes_and_the_exec_dat_alone(td, NoNode):
+    dat = td.op('config')
+    calls = []
+    a, b = NoNode.Scope(td.op('a')), NoNode.Scope(td.op('b'))
+    a.RegisterDatExec(NoNode.DatExecType.TableChange, dat, lambda: calls.append('a'))
+    b.RegisterDatExec(NoNode.DatExecType.TableChange, dat, lambda: calls.append('b'))
+    a.RegisterKeyboardShortcut('ctrl.k', lambda: calls.append('key a'))
+
+    a.Clear()
+    NoNode.OnDatExec(NoNode.DatExecType.TableChange, dat)
+    NoNode.OnKeyboardShortcut('ctrl.k')
+
+    assert calls == ['b']
+    assert a.DATEXEC_CALLBACKS == {} and a.KEYBOARD_CALLBACKS == {}
+    assert NoNode.DAT_EXEC_MAP[NoNode.DatExecType.TableChange].par.active.val is True
+    assert NoNode.WATCHED_OPS == {dat: 1}
+
+    b.Clear()
+    assert NoNode.DAT_EXEC_MAP[NoNode.DatExecType.TableChange].par.active.val is False
+    assert NoNode.WATCHED_OPS == {}
+
+
+def test_init_and_rescoping_only_drop_their_own_registrations(td, NoNode):
+    owner, base = td.op('a'), td.op('base1')
+    speed = base.par.add('Speed')
+    calls = []
+    a = NoNode.Scope(owner)
+    a.RegisterParExec(NoNode.ParExecType.ValueChange, base, 'Speed', lambda val: calls.append(('a', val)))
+    NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, base, 'Speed', lambda val: calls.append(('global', val)))
+
+    NoNode.Init(td.op('owner'))
+    NoNode.OnParExec(NoNode.ParExecType.ValueChange, speed, 1, 0)
+    assert calls == [('a', 1)]
+    assert NoNode.WATCHED_OPS == {base: 1}
+    assert NoNode.PAR_EXEC_MAP[NoNode.ParExecType.ValueChange].par.active.val is True
+
+    assert NoNode.Scope(owner) is a
+    NoNode.OnParExec(NoNode.ParExecType.ValueChange, speed, 2, 1)
+    assert calls == [('a', 1)]
+    assert NoNode.WATCHED_OPS == {}
+
+
+def test_deleted_owners_lose_their_scope(td, NoNode):
+    owner, chop = td.op('a'), td.op('lfo1')
+    NoNode.Scope(owner).RegisterChopExec(NoNode.ChopExecType.ValueChange, chop, '*', lambda: None)
+
+    owner.valid = False
+    NoNode.Scope(td.op('b'))
+
+    assert owner not in NoNode.SCOPES
+    assert NoNode.REGISTRIES == (NoNode, NoNode.SCOPES[td.op('b')])
+    assert NoNode.WATCHED_OPS == {}
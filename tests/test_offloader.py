@@ -0,0 +1,147 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from NoNodeScheduling import Offloader, to_plain
+
+
+class ManualExecutor:
+    """Executor running each job only when the test finishes it"""
+
+    def __init__(self):
+        self.jobs = []
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.jobs.append((future, fn, args))
+        return future
+
+    def finish(self, index):
+        future, fn, args = self.jobs[index]
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+        if cancel_futures:
+            for future, _, _ in self.jobs:
+                future.cancel()
+
+
+@pytest.fixture
+def executor():
+    return ManualExecutor()
+
+
+def test_results_are_delivered_on_drain_in_the_order_jobs_finished(schedule, executor):
+    results = []
+    offloader = Offloader(schedule, executor=executor)
+    for name in ('a', 'b', 'c'):
+        offloader.Submit(str.upper, (name,), on_result=results.append)
+
+    assert len(schedule.calls) == 1
+    executor.finish(2)
+    executor.finish(0)
+    assert results == [] # never delivered from the worker
+
+    assert offloader.Drain() == 2
+    assert results == ['C', 'A']
+    assert offloader.Pending == 1
+    assert schedule.calls[-1][1] == 1 # keeps polling while jobs run
+
+    executor.finish(1)
+    assert offloader.Drain() == 1
+    assert results == ['C', 'A', 'B']
+    assert offloader.Pending == 0
+
+
+def test_newer_job_of_a_key_supersedes_the_older_one(schedule, executor):
+    results = []
+    offloader = Offloader(schedule, executor=executor)
+    offloader.Submit(str.upper, ('first',), key='k', on_result=results.append)
+    executor.finish(0)
+    second = offloader.Submit(str.upper, ('second',), key='k', on_result=results.append)
+    third = offloader.Submit(str.upper, ('third',), key='k', on_result=results.append)
+
+    assert second.cancelled()
+    executor.finish(2)
+    offloader.Drain()
+
+    assert results == ['THIRD']
+    assert not third.cancelled()
+    assert offloader.Pending == 0
+
+
+def test_exceptions_are_raised_on_drain_after_delivering_the_rest(schedule, executor):
+    results = []
+    offloader = Offloader(schedule, executor=executor)
+    offloader.Submit(lambda: 1 / 0)
+    offloader.Submit(str.upper, ('ok',), on_result=results.append)
+    executor.finish(0)
+    executor.finish(1)
+
+    with pytest.raises(ZeroDivisionError):
+        offloader.Drain()
+    assert results == ['OK']
+
+
+def test_shutdown_cancels_waiting_jobs_and_drops_results(schedule, executor):
+    results = []
+    offloader = Offloader(schedule, executor=executor)
+    offloader.Submit(str.upper, ('done',), on_result=results.append)
+    offloader.Submit(str.upper, ('waiting',), key='k', on_result=results.append)
+    executor.finish(0)
+
+    offloader.Shutdown()
+
+    assert executor.shut_down
+    assert executor.jobs[1][0].cancelled()
+    assert offloader.Pending == 0
+    assert offloader.Drain() == 0
+    assert results == []
+
+
+def test_jobs_finishing_after_shutdown_are_not_delivered(schedule):
+    results = []
+    gate = threading.Event()
+    offloader = Offloader(schedule, max_workers=1)
+    running = offloader.Submit(gate.wait, (5,), on_result=results.append)
+
+    offloader.Shutdown()
+    gate.set()
+    running.result(timeout=5)
+
+    assert offloader.Drain() == 0
+    assert results == []
+    assert offloader.Pending == 0
+
+
+def test_pool_is_created_again_after_shutdown(schedule):
+    results = []
+    offloader = Offloader(schedule, max_workers=1)
+    offloader.Shutdown()
+    offloader.Submit(threading.current_thread).result(timeout=5)
+    offloader.Submit(str.upper, ('again',), on_result=results.append)
+
+    deadline = time.monotonic() + 5
+    while offloader.Pending and time.monotonic() < deadline:
+        offloader.Drain()
+        time.sleep(0.001)
+    assert results == ['AGAIN']
+    offloader.Shutdown()
+
+
+def test_to_plain_replaces_touchdesigner_objects(td):
+    dat = td.DAT('config', [['name', 'value'], ['speed', '1']])
+    speed = td.op('base1').par.add('Speed', 2.5)
+
+    plain = to_plain((dat, [dat[1, 1]], speed, 3, None))
+
+    assert plain == ([['name', 'value'], ['speed', '1']], [(1, 1, '1')], ('/base1', 'Speed', 2.5), 3, None)
+    assert plain[2].val == 2.5
@@ -0,0 +1,92 @@
+import os
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+import png_writer
+from png_writer import PNG_SIGNATURE, encode_png, write_atomic, write_png
+
+
+def read_chunks(data):
+    """Split PNG bytes into (type, data) chunks, checking the signature and every CRC"""
+    assert data[:8] == PNG_SIGNATURE
+    chunks, offset = [], 8
+    while offset < len(data):
+        length, = struct.unpack_from('>I', data, offset)
+        chunk_type, body = data[offset + 4:offset + 8], data[offset + 8:offset + 8 + length]
+        crc, = struct.unpack_from('>I', data, offset + 8 + length)
+        assert crc == zlib.crc32(chunk_type + body)
+        chunks.append((chunk_type, body))
+        offset += 12 + length
+    return chunks
+
+
+def decode_png(data):
+    """Decode an RGBA8 PNG written with the Sub filter into a (height, width, 4) array, top row first"""
+    chunks = read_chunks(data)
+    assert [chunk_type for chunk_type, _body in chunks] == [b'IHDR', b'IDAT', b'IEND']
+    width, height, depth, color_type, compression, filter_method, interlace = struct.unpack('>IIBBBBB', chunks[0][1])
+    assert (depth, color_type, compression, filter_method, interlace) == (8, 6, 0, 0, 0)
+    scanlines = np.frombuffer(zlib.decompress(chunks[1][1]), dtype=np.uint8).reshape(height, 1 + width * 4)
+    assert (scanlines[:, 0] == 1).all() # Sub on every scanline
+    # undo Sub: every byte is the difference to the same channel of the pixel on the left
+    pixels = np.cumsum(scanlines[:, 1:].reshape(height, width, 4), axis=1, dtype=np.uint8)
+    return pixels
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (3, 5, 4), dtype=np.uint8)
+
+
+def test_zlib_encoder_round_trips_through_the_sub_filter(image):
+    assert np.array_equal(decode_png(png_writer._encode_png_zlib(image, 6)), image)
+
+
+@pytest.mark.parametrize('flip', [True, False])
+def test_rows_are_flipped_to_top_row_first(image, flip):
+    decoded = decode_png(encode_png(image, flip=flip, use_cv2=False))
+
+    assert np.array_equal(decoded, image[::-1] if flip else image)
+
+
+def test_encode_rejects_arrays_without_four_channels():
+    with pytest.raises(ValueError):
+        encode_png(np.zeros((2, 2, 3), dtype=np.uint8))
+
+
+def test_write_png_writes_a_decodable_file(tmp_path, image, monkeypatch):
+    monkeypatch.setattr(png_writer, 'cv2', None)
+    file_path = str(tmp_path / 'sub' / 'image.png')
+
+    assert write_png(file_path, image) == file_path
+    with open(file_path, 'rb') as f:
+        assert np.array_equal(decode_png(f.read()), image[::-1])
+
+
+def test_write_atomic_replaces_the_file_and_leaves_no_temporary_files(tmp_path):
+    file_path = str(tmp_path / 'index.json')
+    write_atomic(file_path, b'old')
+    write_atomic(file_path, b'new')
+
+    assert os.listdir(tmp_path) == ['index.json']
+    with open(file_path, 'rb') as f:
+        assert f.read() == b'new'
+
+
+def test_failed_write_keeps_the_previous_file(tmp_path, monkeypatch):
+    file_path = str(tmp_path / 'index.json')
+    write_atomic(file_path, b'old')
+
+    def fail(src, dst):
+        raise OSError('disk full')
+    monkeypatch.setattr(os, 'replace', fail)
+
+    with pytest.raises(OSError):
+        write_atomic(file_path, b'new')
+    assert os.listdir(tmp_path) == ['index.json']
+    with open(file_path, 'rb') as f:
+        assert f.read() == b'old'
@@ -1,4 +1,9 @@
 import re
+import hashlib
+from pathlib import Path
+from typing import Callable, Union
+Invoker = mod('NoNode').Invoker
+NameFilter = mod('NoNode').NameFilter
 
 class CustomParHelper:
     """
@@ -33,7 +38,7 @@ class CustomParHelper:
        CustomParHelper.Init(self, ownerComp, enable_properties: bool = True, enable_callbacks: bool = True, enable_parGroups: bool = True, enable_seq: bool = True, expose_public: bool = False,
              par_properties: list[str] = ['*'], par_callbacks: list[str] = ['*'], 
              except_properties: list[str] = [], except_sequences: list[str] = [], except_callbacks: list[str] = [], except_pages: list[str] = [], 
-             enable_stubs: bool = False, general_callback_enable: bool = True)
+             enable_stubs: bool = False, general_callback_enable: bool = True, cache_constants: bool = False, use_mixin: bool = False, scoped: bool = False)
        ```
 
         Additional options:
@@ -48,8 +53,15 @@ class CustomParHelper:
         - `except_callbacks`: List of parameter names to exclude from callback handling
         - `except_pages`: List of parameter pages to exclude from property and callback handling
         - `except_sequences`: List of sequence names to exclude from property and callback handling
+          The lists above take tdu.match patterns: wildcards, and `^` to exclude names from the patterns before it (eg. `par_callbacks=['Color*', '^Colora']`)
         - `enable_stubs`: If True, automatically creates and updates stubs for the extension (default: False) (thanks to AlphaMoonbase.berlin for Stubser)
         - `general_callback_enable`: If True, enables general callbacks that catch all parameter changes (default: True)
+        - `cache_constants`: If True, `eval<ParamName>` of parameters in CONSTANT mode is served from a cache invalidated on value and mode changes, see `CustomParHelper.EvalCacheStats()` (default: False, needs enable_callbacks)
+        - `use_mixin`: If True, properties and callbacks come from a generated `<ExtClass>Mixin` DAT next to the extension, see `CustomParHelper.GenerateMixin()` (default: False).
+          Inherit from its class to get real properties reading `self.ownerComp` (then Init installs none, and cache_constants does not apply to them).
+          Init only compares the mixin with the layout hash stored on the owner, the mixin is generated the frame after Init if missing and regenerated on parameter layout changes
+        - `scoped`: If True, the owner gets its own helper state (a CustomParScope with the same methods, returned by Init), so many components sharing the same ExtUtils do not overwrite each other (default: False).
+          The exec DATs of the package are shared: they watch all owners and route each event to the scope of the parameter's owner
 
     3. Access and set custom parameters as properties (if enable_properties=True (default)):
        
@@ -89,6 +101,7 @@ class CustomParHelper:
          ```
 
        > NOTE: to expose public properties, eg. self.Par<ParamName> instead of self.par<ParamName>, set expose_public=True in the Init function
+       > NOTE: Init only puts a placeholder per name on the extension class, the parameter lookup, filtering and property are resolved on first access and cached
 
     4. Implement callbacks (if enable_callbacks=True (default)):
        a) Parameter-specific callbacks:
@@ -138,11 +151,24 @@ class CustomParHelper:
            # _par can be omitted if not needed
          ```
 
+       c) Callbacks are resolved once per parameter on Init and whenever the custom parameters change. If you add
+       callback methods to the extension at runtime, refresh the table:
+         ```python
+         CustomParHelper.UpdateCallbackTable()
+         ```
+
+       d) Aggregated callback, called once per frame with all custom parameter changes of the frame (opt-in by implementing it):
+         ```python
+         def onParsChanged(self, changes):
+           # changes: {par_name: (val, prev), ...}, eg. to rebuild state that depends on several parameters once
+         ```
+
     > NOTE: This class is part of the extUtils package, and is designed to work with the QuickExt framework.
     > NOTE: The reason this is implemented with static methods, is to omit the need to instantiate the class, providing a simpler interface (arguably).
     """
     EXT_SELF = None
     EXT_OWNERCOMP = None
+    SCOPES: dict[COMP, 'CustomParScope'] = {}
     PAR_EXEC = op('extParExec')
     DAT_EXEC = op('extParPropDatExec')
     PAR_GROUP_EXEC = op('extParGroupExec')
@@ -156,18 +182,49 @@ class CustomParHelper:
     PAR_PROPS: list[str] = ['*']
     PAR_CALLBACKS: list[str] = ['*']
     SEQUENCE_PATTERN: str = '(\\w+?)(\\d+)(.+)'
+    SEQUENCE_MATCH: Callable = re.compile(SEQUENCE_PATTERN).match
+    PAR_PROPS_FILTER: NameFilter = NameFilter(PAR_PROPS)
+    PAR_CALLBACKS_FILTER: NameFilter = NameFilter(PAR_CALLBACKS)
+    EXCEPT_PROPS_FILTER: NameFilter = NameFilter(EXCEPT_PROPS)
+    EXCEPT_CALLBACKS_FILTER: NameFilter = NameFilter(EXCEPT_CALLBACKS)
+    EXCEPT_PAGES_FILTER: NameFilter = NameFilter(EXCEPT_PAGES)
+    EXCEPT_SEQUENCES_FILTER: NameFilter = NameFilter(EXCEPT_SEQUENCES)
     IS_EXPOSE_PUBLIC: bool = False
     STUBS_ENABLED: bool = False
     GENERAL_CALLBACK_ENABLE: bool = True
+    ENABLE_PARGROUPS: bool = True
+    PROPERTY_CLASS: type = None
+    PROPERTIES_RESOLVED: set[str] = set()
+    PROPERTIES_MISSING: set[str] = set()
+    EVAL_CACHE_ENABLED: bool = False
+    EVAL_CACHE: dict[str, object] = {}
+    EVAL_CACHE_HITS: int = 0
+    EVAL_CACHE_MISSES: int = 0
+    SEQ_VALUE_FORMS: tuple = (None, (1,), (1, 2), (0, 1, 2), (0, 1, 2, 3))
+    PAR_VALUE_FORMS: tuple = (None, (1,), (0, 1), (0, 1, 2))
+    GENERAL_VALUE_FORMS: tuple = (None, (0,), (0, 1), (0, 1, 2))
+    SEQ_PULSE_FORMS: tuple = (None, (1,), (1, 0))
+    PAR_PULSE_FORMS: tuple = ((), (0,))
+    PARGROUP_FORMS: tuple = (None, (1,), (0, 1))
+    SEQ_BLOCK_FORMS: tuple = (None, (0,))
+    PARS_CHANGED_FORMS: tuple = (None, (0,))
+    VALUE_HANDLERS: dict[str, Callable] = {}
+    PULSE_HANDLERS: dict[str, Callable] = {}
+    PARS_CHANGED_HANDLER: Callable = None
+    USE_MIXIN: bool = False
+    MIXIN_STORAGE_KEY: str = 'CustomParHelperLayoutHash'
+    MIXIN_PROPERTIES: dict[str, tuple] = None
+    MIXIN_CALLBACKS: dict[str, tuple] = None
+    MIXIN_EVAL_TYPES: dict[str, str] = {'Float': 'float', 'Int': 'int', 'Toggle': 'bool', 'Momentary': 'bool', 'Pulse': 'bool', 'Str': 'str', 'StrMenu': 'str', 'Menu': 'str', 'File': 'str', 'FileSave': 'str', 'Folder': 'str', 'OP': 'OP', 'COMP': 'COMP', 'TOP': 'TOP', 'CHOP': 'CHOP', 'SOP': 'SOP', 'DAT': 'DAT', 'MAT': 'MAT'}
 
     @classmethod
-    def Init(cls, extension_self, ownerComp: COMP, enable_properties: bool=True, enable_callbacks: bool=True, enable_parGroups: bool=True, enable_seq: bool=True, expose_public: bool=False, par_properties: list[str]=['*'], par_callbacks: list[str]=['*'], except_properties: list[str]=[], except_sequences: list[str]=[], except_callbacks: list[str]=[], except_pages: list[str]=[], enable_stubs: bool=False, general_callback_enable: bool=True) -> None:
-        """Initialize the CustomParHelper."""
+    def Init(cls, extension_self, ownerComp: COMP, enable_properties: bool=True, enable_callbacks: bool=True, enable_parGroups: bool=True, enable_seq: bool=True, expose_public: bool=False, par_properties: list[str]=['*'], par_callbacks: list[str]=['*'], except_properties: list[str]=[], except_sequences: list[str]=[], except_callbacks: list[str]=[], except_pages: list[str]=[], enable_stubs: bool=False, general_callback_enable: bool=True, cache_constants: bool=False, use_mixin: bool=False, scoped: bool=False) -> Union['CustomParScope', None]:
+        """Initialize the CustomParHelper. With scoped=True the owner gets its own helper state, which is returned."""
         pass
 
     @classmethod
     def CustomParsAsProperties(cls, extension_self, ownerComp: COMP, enable_parGroups: bool=True) -> None:
-        """Create properties for custom parameters."""
+        """Expose custom parameters as properties, resolved lazily on first access."""
         pass
 
     @classmethod
@@ -175,6 +232,29 @@ class CustomParHelper:
         """Update the properties for custom parameters."""
         pass
 
+    @classmethod
+    def ResolveAllProperties(cls) -> None:
+        """Install the properties of all custom parameters right away, e.g. for stubs or autocompletion."""
+        pass
+
+    @classmethod
+    def ResetEvalCache(cls) -> None:
+        """Drop the cached eval<Name> values and reset the hit/miss counters."""
+        pass
+
+    @classmethod
+    def EvalCacheStats(cls) -> dict:
+        """Return the hits, misses and size of the eval cache, for tuning."""
+        pass
+
+    @classmethod
+    def UpdateCallbackTable(cls) -> None:
+        """
+        Resolve the callback of every custom parameter up front, so dispatching an event is a single dict lookup.
+        Parameters excluded by par_callbacks, except_callbacks or except_pages get no callback.
+        """
+        pass
+
     @classmethod
     def EnableCallbacks(cls, enable_parGroups: bool=True, enable_seq: bool=True) -> None:
         """Enable callbacks for custom parameters."""
@@ -195,9 +275,14 @@ class CustomParHelper:
         """Handle pulse events for custom parameters."""
         pass
 
+    @classmethod
+    def OnModeChange(cls, comp: COMP, _par: Par) -> None:
+        """Handle mode change events for custom parameters, a parameter leaving CONSTANT mode must not be served from the eval cache."""
+        pass
+
     @classmethod
     def OnValuesChanged(cls, changes: list[tuple[Par, Par]]) -> None:
-        """Handle value change events for ParGroups."""
+        """Handle value change events for ParGroups, and deliver all changes of the frame to onParsChanged."""
         pass
 
     @classmethod
@@ -218,4 +303,27 @@ class CustomParHelper:
     @classmethod
     def UpdateStubs(cls) -> None:
         """Update the stubs for the extension."""
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    def LayoutHash(cls) -> str:
+        """Return a hash of the custom parameter layout of the owner and of the options the generated mixin depends on."""
+        pass
+
+    @classmethod
+    def GenerateMixin(cls) -> Union[DAT, None]:
+        """
+        Write the mixin module of the extension next to it: the property and callback tables, a mixin class with the
+        properties and the layout hash, which is also stored on the owner. If the extension DAT is synced to a file, a .pyi
+        stub is written next to it. Called after Init when the mixin is missing and on custom parameter layout changes.
+        """
+        pass
+
+class CustomParScope:
+    """
+    Helper state of one owner component, returned by CustomParHelper.Init(..., scoped=True).
+
+    Holds the per-owner attributes of CustomParHelper in slots and shares its methods and constants, so a scope is
+    used like the class itself (eg. scope.UpdateCallbackTable(), scope.EvalCacheStats()).
+    """
+    __slots__ = ('EXT_SELF', 'EXT_OWNERCOMP', 'IS_EXPOSE_PUBLIC', 'STUBS_ENABLED', 'GENERAL_CALLBACK_ENABLE', 'ENABLE_PARGROUPS', 'PAR_PROPS', 'PAR_CALLBACKS', 'EXCEPT_PAGES', 'EXCEPT_PROPS', 'EXCEPT_CALLBACKS', 'EXCEPT_SEQUENCES', 'PAR_PROPS_FILTER', 'PAR_CALLBACKS_FILTER', 'EXCEPT_PROPS_FILTER', 'EXCEPT_CALLBACKS_FILTER', 'EXCEPT_PAGES_FILTER', 'EXCEPT_SEQUENCES_FILTER', 'PROPERTY_CLASS', 'PROPERTIES', 'PROPERTIES_RESOLVED', 'PROPERTIES_MISSING', 'EVAL_CACHE_ENABLED', 'EVAL_CACHE', 'EVAL_CACHE_HITS', 'EVAL_CACHE_MISSES', 'VALUE_HANDLERS', 'PULSE_HANDLERS', 'PARS_CHANGED_HANDLER', 'USE_MIXIN', 'MIXIN_PROPERTIES', 'MIXIN_CALLBACKS')
\ No newline at end of file
@@ -1,7 +1,62 @@
 import re
-import TDStoreTools
+import time
+import weakref
+import fnmatch
+import inspect
+import operator
+import functools
+import threading
+from collections import deque
+import numpy as np
 from typing import Callable, Dict, Union, List
 from enum import Enum, auto
+from NoNodeScheduling import CallPolicy, FrameScheduler, Offloader, to_plain
+
+class Invoker:
+    """
+    Signature-aware callback invocation, shared by NoNode and CustomParHelper.
+
+    Callbacks may omit arguments from their signature. Instead of reading `__code__.co_argcount`
+    on every event, a callback is inspected once and the arguments it accepts are cached as a plan.
+    `forms` describe the accepted argument forms of an event: `forms[n]` holds the indices into the
+    full event arguments that a callback taking `n` positional arguments receives (None if unsupported).
+    Works with bound methods, functions, `functools.partial`, callable objects, `*args` and decorated callables.
+
+    Plans are keyed weakly by the code object of the callback (or the class of a callable object), so caching
+    never keeps a callback or its owner alive and the cache shrinks when extensions are reloaded.
+    """
+    PLANS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def Plan(cls, callback: Callable, forms: tuple) -> Union[tuple, None]:
+        """Return the argument indices a callback receives for the given forms, inspecting it only once."""
+        pass
+
+    @classmethod
+    def Adapt(cls, callback: Callable, forms: tuple) -> Callable:
+        """Return a ready-made adapter that takes the full event arguments and calls the callback with what it accepts."""
+        pass
+
+    @classmethod
+    def Call(cls, callback: Callable, forms: tuple, *args):
+        """Call a callback with the arguments it accepts, using the cached plan."""
+        pass
+
+class NameFilter:
+    """
+    Match names like tdu.match, shared by NoNode and CustomParHelper.
+
+    `*`, `?` and `[]` are wildcards and a pattern starting with `^` excludes the names it matches from the patterns
+    before it (eg. 'Color* ^Colora'). A string is split at whitespace and commas, list items are single patterns, so
+    names containing spaces (eg. the 'Version Ctrl' page) can be listed. Compiled once: without exclusions exact names
+    go into a frozenset, everything else into a single regex. Results are cached per name.
+    """
+    __slots__ = ('exact', 'wildcard', 'resolved')
+
+    @staticmethod
+    def IsPattern(pattern: str) -> bool:
+        """Return whether a pattern has wildcards or is an exclusion, rather than being an exact name."""
+        pass
 
 class NoNode:
     """
@@ -29,6 +84,18 @@ class NoNode:
     ```python
     NoNode.Init(enable_chopexec=True, enable_datexec=True, enable_parexec=True, enable_keyboard_shortcuts=True)
     ```
+    To make extension reloads faster and avoid exec DATs turning off and on, restore the previous registrations in one step:
+    ```python
+    if not NoNode.Init(ownerComp, extension_self=self, restore=True): # or restore=<dict from NoNode.Snapshot()>
+        NoNode.RegisterChopExec(...) # only needed on the first run
+    ```
+    When many components (eg. replicas) share the same ExtUtils, give each owner its own scope instead of calling Init.
+    A scope has the same Register/Deregister methods on tables of its own, dispatch walks all scopes, so reinitializing
+    one owner (or calling Init) only drops its own registrations:
+    ```python
+    self.NoNode = NoNode.Scope(ownerComp)
+    self.NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop_op, channel_name(s), self.on_value_change_function)
+    ```
 
     4. CHOP executions:
     - Register a callback for CHOP value changes:
@@ -43,6 +110,35 @@ class NoNode:
         # callback signature: def on_activate_function(self, channel: Channel, sampleIndex: int, val: float, prev: float):
         # can omit parameters from the right side of the signature if not needed
         ```
+    - Handle wide CHOPs in one call per frame with numpy arrays (ValueChangeBatch, OffToOnBatch, OnToOffBatch, WhileOnBatch, WhileOffBatch):
+        ```python
+        NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChangeBatch, chop_op, channel_name(s), self.on_batch_function)
+        # callback signature: def on_batch_function(self, chop: CHOP, indices: np.ndarray, vals: np.ndarray, prevs: np.ndarray):
+        # can omit parameters from the left side of the signature if not needed, eg. def on_batch_function(self, indices, vals):
+        ```
+
+    - Limit how often expensive callbacks run (also for RegisterDatExec and RegisterParExec):
+        ```python
+        NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop_op, channel_name(s), self.on_value_change_function, max_rate=10) # at most 10 Hz
+        # debounce=<ms> or debounce_frames=<n> waits for the events to settle, coalesce=True calls once at the end of the frame
+        # only the latest value per channel is delivered
+        ```
+    - Keep heavy handlers from causing frame drops with priorities and a frame budget (also for RegisterDatExec and RegisterParExec):
+        ```python
+        NoNode.SetFrameBudget(4) # ms per frame for callbacks registered with a priority, default no limit
+        NoNode.RegisterChopExec(NoNode.ChopExecType.OffToOn, chop_op, channel_name(s), self.on_cue_function, priority=10)
+        NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, chop_op, channel_name(s), self.on_ui_function, priority=-10)
+        # prioritized callbacks run at the end of the frame, highest priority first, the rest carries over to the next frame
+        ```
+    - Run slow handlers (file parsing, hashing, subprocesses) in a thread pool (also for RegisterDatExec and RegisterParExec):
+        ```python
+        NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, dat_op, self.parse_function, offload=self.apply_function)
+        # parse_function runs in a worker thread and gets plain values instead of TouchDesigner objects: the DAT as a list
+        # of rows of strings, channels and parameters as (owner path, name, ...) and cells as (row, col, val) tuples, see to_plain
+        # def parse_function(self, rows: list[list[str]]): return {row[0]: float(row[1]) for row in rows[1:]}
+        # its return value is passed to apply_function on the main thread at the end of the frame, exceptions are re-raised there
+        # a newer event supersedes a still running call, offload=True discards the return value
+        ```
 
     5. DAT executions:
     - React to table changes in a DAT:
@@ -55,6 +151,14 @@ class NoNode:
         NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_cell_change_function)
         # callback signature depends on the event type, eg.: def on_cell_change_function(self, dat: DAT, cells: list[Cell], prev: Cell):
         ```
+    - Watch only a region of a table, by row keys (first column), column names (first row) and/or single cells:
+        ```python
+        NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_region_change_function, rows='speed gain*', cols='value')
+        NoNode.RegisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_region_change_function, cells=[('speed', 'value'), ('*', 'enabled')])
+        # callback signature: def on_region_change_function(self, dat: DAT, diffs: list[tuple]): with (row, col, old, new) diffs of the watched cells
+        # called only when the watched region changes, any number of callbacks can watch the same DAT
+        # filters are CellChange only, registering the same callback and filters again replaces the subscription
+        ```
 
     6. Parameter executions:
     - Register a callback for parameter value changes:
@@ -63,6 +167,12 @@ class NoNode:
         # callback signature depends on the event type, eg.: def on_value_change_function(self, par: Par, val: float, prev: float):
         # can omit prev, or use val only
         ```
+    - Watch many parameters with one registration, by name patterns, pages or sequences, on one or more operators:
+        ```python
+        NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, [par_op1, par_op2], 'Color* Speed', self.on_value_change_function)
+        NoNode.RegisterParExec(NoNode.ParExecType.ValueChange, par_op, [par_op.customPages[0], par_op.seq.Points], self.on_value_change_function)
+        # parameters are resolved by name on their first event and matched again after moving between pages or sequences
+        ```
     - Handle pulse parameters:
         ```python
         NoNode.RegisterParExec(NoNode.ParExecType.OnPulse, par_op, par_name, self.on_pulse_function)
@@ -85,6 +195,8 @@ class NoNode:
     - Deregister a DAT execution:
         ```python
         NoNode.DeregisterDatExec(NoNode.DatExecType.TableChange, dat_op)
+        # a single callback or region, keeping the other subscriptions of the DAT
+        NoNode.DeregisterDatExec(NoNode.DatExecType.CellChange, dat_op, self.on_region_change_function, rows='speed gain*', cols='value')
         ```
     - Deregister a parameter execution:
         ```python
@@ -94,6 +206,16 @@ class NoNode:
         ```python
         NoNode.DeregisterKeyboardShortcut('ctrl.k')
         ```
+    - Callbacks are held weakly (bound methods via weakref.WeakMethod), registrations of deleted operators and of
+        reinitialized extensions are dropped automatically. To drop them right away:
+        ```python
+        NoNode.Sweep()
+        ```
+    - Registrations are plain dicts; NoNode.REGISTRY_VERSION is a tdu.Dependency bumped once at the end of every frame
+        in which registrations changed, so expressions or UIs listing them can depend on it:
+        ```python
+        NoNode.REGISTRY_VERSION.val # an expression reading this re-evaluates when registrations change
+        ```
 
     8. Visual indication:
     - Operators with registered callbacks are marked with a color for easy identification
@@ -102,6 +224,14 @@ class NoNode:
         NoNode.SetMarkColor((r, g, b))
         ```
 
+    9. Profiling:
+    - Find the callbacks eating the frame budget (costs nothing while disabled):
+        ```python
+        NoNode.EnableProfiling(dat=op('table_stats')) # dat is optional
+        NoNode.Stats() # {'ChopExec.ValueChange MyExt.on_value_change_function': {'count', 'total_ms', 'mean_ms', 'p95_ms'}, ...}
+        NoNode.DisableProfiling()
+        ```
+
     """
 
     class ChopExecType(Enum):
@@ -110,6 +240,11 @@ class NoNode:
         OnToOff = auto()
         WhileOff = auto()
         ValueChange = auto()
+        ValueChangeBatch = auto()
+        OffToOnBatch = auto()
+        OnToOffBatch = auto()
+        WhileOnBatch = auto()
+        WhileOffBatch = auto()
 
     class DatExecType(Enum):
         TableChange = auto()
@@ -121,6 +256,11 @@ class NoNode:
     class ParExecType(Enum):
         ValueChange = auto()
         OnPulse = auto()
+    CHOP_FORMS: tuple = ((), (2,), (0, 2), (0, 1, 2), (0, 1, 2, 3))
+    CHOP_BATCH_FORMS: tuple = ((), (1,), (1, 2), (1, 2, 3), (0, 1, 2, 3))
+    DAT_FORMS: Dict[DatExecType, tuple] = {DatExecType.TableChange: ((), (0,)), DatExecType.RowChange: ((), (0,), (0, 1)), DatExecType.ColChange: ((), (0,), (0, 2)), DatExecType.CellChange: ((), (0,), (0, 3), (0, 3, 4)), DatExecType.SizeChange: ((), (0,))}
+    DAT_REGION_FORMS: tuple = ((), (1,), (0, 1))
+    PAR_FORMS: Dict[ParExecType, tuple] = {ParExecType.ValueChange: ((), (1,), (0, 1), (0, 1, 2)), ParExecType.OnPulse: ((), (0,), (0, 1), (0, 1, 2))}
     MARK_COLOR = (0.5, 0.05, 0.5)
     CHOP_VALUECHANGE_EXEC: DAT = op('extChopValueChangeExec')
     CHOP_OFFTOON_EXEC: DAT = op('extChopOffToOnExec')
@@ -137,9 +277,19 @@ class NoNode:
     DAT_EXECS: list[DAT] = [DAT_TABLECHANGE_EXEC, DAT_ROWCHANGE_EXEC, DAT_COLCHANGE_EXEC, DAT_CELLCHANGE_EXEC, DAT_SIZECHANGE_EXEC]
     CHOP_EXEC_MAP: Dict[ChopExecType, COMP] = {ChopExecType.ValueChange: CHOP_VALUECHANGE_EXEC, ChopExecType.OffToOn: CHOP_OFFTOON_EXEC, ChopExecType.OnToOff: CHOP_ONTOOFF_EXEC, ChopExecType.WhileOn: CHOP_WHILEON_EXEC, ChopExecType.WhileOff: CHOP_WHILEOFF_EXEC}
     DAT_EXEC_MAP: Dict[DatExecType, COMP] = {DatExecType.TableChange: DAT_TABLECHANGE_EXEC, DatExecType.RowChange: DAT_ROWCHANGE_EXEC, DatExecType.ColChange: DAT_COLCHANGE_EXEC, DatExecType.CellChange: DAT_CELLCHANGE_EXEC, DatExecType.SizeChange: DAT_SIZECHANGE_EXEC}
-    CHOPEXEC_CALLBACKS: TDStoreTools.DependDict[ChopExecType, dict[CHOP, dict[str, Callable]]] = TDStoreTools.DependDict()
-    DATEXEC_CALLBACKS: TDStoreTools.DependDict[DatExecType, dict[DAT, Callable]] = TDStoreTools.DependDict()
-    KEYBOARD_CALLBACKS: TDStoreTools.DependDict[str, Callable] = TDStoreTools.DependDict()
+    CHOPEXEC_CALLBACKS: Dict[ChopExecType, Dict[CHOP, Dict[str, Callable]]] = {}
+    CHOPEXEC_INDEX: Dict[ChopExecType, Dict[CHOP, _ChannelIndex]] = {}
+    CHOPEXEC_DIRTY: set[tuple] = set()
+    CHOP_BATCH_TYPES: set[ChopExecType] = {ChopExecType.ValueChangeBatch, ChopExecType.OffToOnBatch, ChopExecType.OnToOffBatch, ChopExecType.WhileOnBatch, ChopExecType.WhileOffBatch}
+    CHOP_BATCH_WATCHERS: Dict[CHOP, _ChopBatchWatcher] = {}
+    CHOP_BATCH_THRESHOLD: float = 0.0
+    FRAME_PUMP_SCHEDULED: bool = False
+    SWEEP_SCHEDULED: bool = False
+    REGISTRY_VERSION: tdu.Dependency = tdu.Dependency(0)
+    REGISTRY_CHANGE_SCHEDULED: bool = False
+    DATEXEC_CALLBACKS: Dict[DatExecType, Dict[DAT, Callable]] = {}
+    DATEXEC_REGIONS: Dict[DAT, List[_DatRegion]] = {}
+    KEYBOARD_CALLBACKS: Dict[str, Callable] = {}
     CHOPEXEC_IS_ENABLED: bool = False
     DATEXEC_IS_ENABLED: bool = False
     KEYBOARD_IS_ENABLED: bool = False
@@ -147,14 +297,35 @@ class NoNode:
     PAR_ONPULSE_EXEC: DAT = op('extParExecNoNodeOnPulse')
     PAR_EXECS: list[DAT] = [PAR_VALUECHANGE_EXEC, PAR_ONPULSE_EXEC]
     PAR_EXEC_MAP: Dict[ParExecType, COMP] = {ParExecType.ValueChange: PAR_VALUECHANGE_EXEC, ParExecType.OnPulse: PAR_ONPULSE_EXEC}
-    PAREXEC_CALLBACKS: TDStoreTools.DependDict[ParExecType, dict[OP, dict[Union[Par, str], Callable]]] = TDStoreTools.DependDict()
+    PAREXEC_CALLBACKS: Dict[ParExecType, Dict[OP, Dict[Union[str, tuple], Callable]]] = {}
+    PAREXEC_TABLE: Dict[ParExecType, Dict[tuple, tuple]] = {}
+    PAREXEC_LAYOUT: Dict[ParExecType, Dict[tuple, tuple]] = {}
     PAREXEC_IS_ENABLED: bool = False
     ALL_EXECS: list[DAT] = CHOP_EXECS + DAT_EXECS + PAR_EXECS + [KEYBOARD_EXEC]
     EXT_OWNER_COMP: COMP = None
+    SCOPES: Dict[COMP, 'NoNodeScope'] = {}
+    REGISTRIES: tuple = ()
+    WATCHED_OPS: Dict[OP, int] = {}
+    SCHEDULER: FrameScheduler = FrameScheduler(_runScheduler)
+    OFFLOADER: Offloader = Offloader(_runScheduler)
+    PROFILE_IS_ENABLED: bool = False
+    PROFILE_WINDOW: int = 256
+    PROFILE_STATS: Dict[str, _CallStats] = {}
+    PROFILE_DAT: DAT = None
+    PROFILE_DAT_SCHEDULED: bool = False
 
     @classmethod
-    def Init(cls, ownerComp, enable_chopexec: bool=True, enable_datexec: bool=True, enable_parexec: bool=True, enable_keyboard_shortcuts: bool=True) -> None:
-        """Initialize the NoNode functionality."""
+    def Init(cls, ownerComp, enable_chopexec: bool=True, enable_datexec: bool=True, enable_parexec: bool=True, enable_keyboard_shortcuts: bool=True, extension_self=None, restore: Union[bool, dict]=False) -> bool:
+        """
+        Initialize the NoNode functionality.
+
+        With extension_self and restore=True the registrations of the previous instance of the extension are restored
+        from the registry (or from a dict returned by Snapshot), keeping exec DATs that stay in use active.
+        Only the global tables are reset and restored, the registrations of scopes (see Scope) are left alone.
+        Returns True if registrations were restored, so the Register calls can be skipped:
+            if not NoNode.Init(ownerComp, extension_self=self, restore=True):
+                NoNode.RegisterChopExec(...)
+        """
         pass
 
     @classmethod
@@ -178,7 +349,7 @@ class NoNode:
         pass
 
     @classmethod
-    def RegisterChopExec(cls, event_type: ChopExecType, chop: CHOP, channels: Union[str, List[str]], callback: Callable) -> None:
+    def RegisterChopExec(cls, event_type: ChopExecType, chop: CHOP, channels: Union[str, List[str]], callback: Callable, max_rate: float=None, debounce: float=None, debounce_frames: int=None, coalesce: bool=False, priority: int=None, offload: Union[bool, Callable]=False, scope: 'NoNodeScope'=None) -> None:
         """
         Register a CHOP execute callback.
 
@@ -187,6 +358,17 @@ class NoNode:
             chop (CHOP): The CHOP operator to register the callback for.
             channels (Union[str, List[str]]): The channel(s) to listen to. Can be a whitespace and/or comma separated string, or a list. Use '*' for all channels.
             callback (Callable): The callback function to be called on CHOP execution.
+            max_rate (float, optional): Call the callback at most this many times per second (Hz).
+            debounce (float, optional): Call the callback only after no new events arrived for this many milliseconds.
+            debounce_frames (int, optional): Call the callback only after no new events arrived for this many frames.
+            coalesce (bool, optional): Collect the events of a frame and call the callback once at the end of the frame.
+            With any of these only the latest value per channel is delivered, see CallPolicy.
+            priority (int, optional): Defer the callback to the end of the frame, higher priorities run first. Calls left when
+            the frame budget (SetFrameBudget) is used up carry over to the next frame, see FrameScheduler.
+            offload (Union[bool, Callable], optional): Run the callback in a thread pool, see Offloader. Pass a callable to receive
+            its return value on the main thread. A newer event (per channel) supersedes a still running call. The callback runs
+            in a worker thread and gets plain values captured on the main thread instead of TouchDesigner objects, see to_plain.
+            scope (NoNodeScope, optional): Register in the tables of this scope instead of the global ones, see Scope.
 
         Example:
             def my_callback(event_type, channel, index, value, prev):
@@ -197,11 +379,25 @@ class NoNode:
             NoNode.RegisterChopExec(ChopExecType.VALUE_CHANGE, op('constant1'), ['chan1', 'chan2'], my_callback)
             # Or with comma and/or whitespace separated channels:
             NoNode.RegisterChopExec(ChopExecType.VALUE_CHANGE, op('constant1'), 'chan1, chan2 chan3,chan4', my_callback)
+
+        Batched event types (ValueChangeBatch, OffToOnBatch, OnToOffBatch, WhileOnBatch, WhileOffBatch) read the CHOP
+        once per frame and call the callback once with numpy arrays instead of once per channel:
+            def my_batch_callback(chop, indices, vals, prevs):
+                # indices of the changed channels, their current and previous values
+            
+            NoNode.RegisterChopExec(ChopExecType.ValueChangeBatch, op('midiin1'), '*', my_batch_callback)
+            # WhileOnBatch/WhileOffBatch are called every frame with the channels that are currently on/off
+            NoNode.RegisterChopExec(ChopExecType.WhileOnBatch, op('midiin1'), 'b*', my_batch_callback)
         """
         pass
 
     @classmethod
-    def RegisterDatExec(cls, event_type: DatExecType, dat: DAT, callback: Callable) -> None:
+    def Sweep(cls) -> None:
+        """Drop the registrations of deleted operators and of callbacks whose extension instance is gone, in every scope."""
+        pass
+
+    @classmethod
+    def RegisterDatExec(cls, event_type: DatExecType, dat: DAT, callback: Callable, max_rate: float=None, debounce: float=None, debounce_frames: int=None, coalesce: bool=False, priority: int=None, offload: Union[bool, Callable]=False, rows: Union[str, List[str]]=None, cols: Union[str, List[str]]=None, cells: List[tuple]=None, scope: 'NoNodeScope'=None) -> None:
         """
         Register a DAT execute callback.
 
@@ -209,17 +405,32 @@ class NoNode:
             event_type (DatExecType): The type of event to listen for.
             dat (DAT): The DAT operator to register the callback for.
             callback (Callable): The callback function to be called on DAT execution.
+            max_rate, debounce, debounce_frames, coalesce, priority, offload: Optional rate limiting, deferral and offloading, see RegisterChopExec.
+            Held back CellChange events are merged per cell: the callback gets every changed cell once, with its oldest previous value.
+            rows (Union[str, List[str]], optional): CellChange only (ValueError otherwise), row keys (first column) to watch, wildcards allowed.
+            cols (Union[str, List[str]], optional): CellChange only, column names (first row) to watch, wildcards allowed.
+            cells (List[tuple], optional): CellChange only, (row key, column name) patterns of single cells to watch.
+            With any filter the callback is only called when the watched region changes, with a list of
+            (row, col, old, new) diffs instead of the raw cells, and any number of callbacks can watch the same DAT.
+            Registering the same callback with the same filters again replaces the earlier subscription.
+            scope (NoNodeScope, optional): Register in the tables of this scope instead of the global ones, see Scope.
 
         Example:
             def my_callback(dat, rows, cols):
                 print(f"DAT {dat} changed. New size: {rows}x{cols}")
             
             NoNode.RegisterDatExec(DatExecType.SizeChange, op('table1'), my_callback)
+
+            def my_region_callback(dat, diffs):
+                for row, col, old, new in diffs:
+                    print(f"{row}/{col} changed from {old} to {new}")
+
+            NoNode.RegisterDatExec(DatExecType.CellChange, op('config'), my_region_callback, rows='speed gain*', cols='value')
         """
         pass
 
     @classmethod
-    def DeregisterChopExec(cls, event_type: ChopExecType, chop: CHOP=None, channels: Union[str, List[str]]=None) -> None:
+    def DeregisterChopExec(cls, event_type: ChopExecType, chop: CHOP=None, channels: Union[str, List[str]]=None, scope: 'NoNodeScope'=None) -> None:
         """
         Deregister a chopExec callback
 
@@ -227,17 +438,26 @@ class NoNode:
             event_type (ChopExecType): The event type to deregister.
             chop (CHOP, optional): The CHOP operator to deregister the callback for. If None, deregisters all CHOPs for the event type.
             channels (Union[str, List[str]], optional): The channel(s) to deregister. Can be a string (single channel, comma/space-separated list, or wildcard pattern) or a list of strings. If None, deregisters all channels for the specified CHOP.
+            scope (NoNodeScope, optional): Deregister from the tables of this scope instead of the global ones, see Scope.
         """
         pass
 
     @classmethod
-    def DeregisterDatExec(cls, event_type: DatExecType, dat: DAT=None) -> None:
+    def DeregisterDatExec(cls, event_type: DatExecType, dat: DAT=None, callback: Callable=None, rows: Union[str, List[str]]=None, cols: Union[str, List[str]]=None, cells: List[tuple]=None, scope: 'NoNodeScope'=None) -> None:
         """
         Deregister a datExec callback
 
         Args:
             event_type (DatExecType): The event type to deregister.
             dat (DAT, optional): The DAT operator to deregister the callback for. If None, deregisters all DATs for the event type.
+            Deregistering CellChange also removes the filtered subscriptions (rows, cols, cells) of the DAT(s).
+            callback (Callable, optional): Only deregister this callback.
+            rows, cols, cells (optional): CellChange only, only remove the filtered subscriptions registered with these filters.
+            scope (NoNodeScope, optional): Deregister from the tables of this scope instead of the global ones, see Scope.
+
+        Example:
+            # remove one region, keeping the other subscriptions of the DAT
+            NoNode.DeregisterDatExec(DatExecType.CellChange, op('config'), self.onSpeed, rows='speed', cols='value')
         """
         pass
 
@@ -262,7 +482,7 @@ class NoNode:
         pass
 
     @classmethod
-    def RegisterKeyboardShortcut(cls, shortcut: str, callback: callable) -> None:
+    def RegisterKeyboardShortcut(cls, shortcut: str, callback: callable, scope: 'NoNodeScope'=None) -> None:
         """ Register a keyboard shortcut and its callback.
         Handle keyboard shortcuts (if enable_keyboard_shortcuts=True (default is False)):
        - Enable keyboard shortcuts:
@@ -276,8 +496,8 @@ class NoNode:
         pass
 
     @classmethod
-    def DeregisterKeyboardShortcut(cls, shortcut: str) -> None:
-        """Unregister a keyboard shortcut."""
+    def DeregisterKeyboardShortcut(cls, shortcut: str, scope: 'NoNodeScope'=None) -> None:
+        """Unregister a keyboard shortcut, of a scope if given."""
         pass
 
     @classmethod
@@ -301,15 +521,22 @@ class NoNode:
         pass
 
     @classmethod
-    def RegisterParExec(cls, event_type: ParExecType, owner: OP, parameter: Union[Par, str], callback: Callable) -> None:
+    def RegisterParExec(cls, event_type: ParExecType, owner: Union[OP, List[OP]], parameter: Union[Par, str, list], callback: Callable, max_rate: float=None, debounce: float=None, debounce_frames: int=None, coalesce: bool=False, priority: int=None, offload: Union[bool, Callable]=False, scope: 'NoNodeScope'=None) -> None:
         """
         Register a parameter execute callback.
 
         Args:   
             event_type (ParExecType): The type of event to listen for.
-            owner (OP): The operator that owns the parameter.
-            parameter (Union[Par, str]): The parameter to watch. Can be a Par object or parameter name.
+            owner (Union[OP, List[OP]]): The operator(s) that own the parameter(s).
+            parameter (Union[Par, str, list]): The parameter(s) to watch. Can be a Par object, a parameter name or pattern
+                (whitespace and/or comma separated), a parameter Page, a parameter Sequence, or a list of these.
             callback (Callable): The callback function to be called on parameter execution.
+            max_rate, debounce, debounce_frames, coalesce, priority, offload: Optional rate limiting, deferral and offloading, see RegisterChopExec.
+            scope (NoNodeScope, optional): Register in the tables of this scope instead of the global ones, see Scope.
+
+        Parameters are matched by name when their first event arrives, so custom parameters added later are picked up.
+        Parameters matched through a page or sequence are matched again once they moved to another page or sequence.
+        With rate limiting the latest value of every parameter is delivered, not only of the last one that changed.
 
         Example:
             def my_callback(par, prev):
@@ -317,23 +544,143 @@ class NoNode:
             
             # Using Par object from any operator
             NoNode.RegisterParExec(op('base1'), ParExecType.ValueChange, op('base1').par.v, self.my_callback)
+            # Patterns, pages and sequences of several operators at once
+            NoNode.RegisterParExec(ParExecType.ValueChange, [op('base1'), op('base2')], ['Color*', op('base1').customPages[0]], self.my_callback)
         """
         pass
 
     @classmethod
-    def DeregisterParExec(cls, event_type: ParExecType, owner: OP, parameter: Union[Par, str]=None) -> None:
+    def DeregisterParExec(cls, event_type: ParExecType, owner: Union[OP, List[OP]], parameter: Union[Par, str, list]=None, scope: 'NoNodeScope'=None) -> None:
         """
         Deregister a parameter execute callback.
 
         Args:
             event_type (ParExecType): The event type to deregister. 
-            owner (OP): The operator that owns the parameter.
-            parameter (Union[Par, str], optional): The parameter to deregister. If None, deregisters all parameters for the owner.
-           
+            owner (Union[OP, List[OP]]): The operator(s) that own the parameter(s).
+            parameter (Union[Par, str, list], optional): The parameter(s) to deregister, as registered. If None, deregisters all parameters for the owner.
+            scope (NoNodeScope, optional): Deregister from the tables of this scope instead of the global ones, see Scope.
+        """
+        pass
+
+    @classmethod
+    def RefreshParExec(cls, event_type: ParExecType=None) -> None:
+        """
+        Drop the resolved (owner, parameter name) lookup table, so parameters are matched again on their next event.
+
+        Called by CustomParHelper whenever the custom parameter layout of its owner changes. Moves between pages and
+        sequences are also detected on the next event, so this is rarely needed by hand. Applies to every scope.
         """
         pass
 
     @classmethod
     def OnParExec(cls, event_type: ParExecType, parameter: Par, value=None, prev=None) -> None:
         """Handle parameter execute events."""
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    def Scope(cls, ownerComp: COMP, enable_chopexec: bool=True, enable_datexec: bool=True, enable_parexec: bool=True, enable_keyboard_shortcuts: bool=True) -> 'NoNodeScope':
+        """
+        Return the registrations of one owner component, for many components sharing the same ExtUtils.
+
+        Use instead of Init: every scope has its own tables, which dispatch walks after the global ones, so the scope
+        only drops the registrations this owner made before (eg. when its extension is reinitialized), and neither
+        Init nor other scopes touch them.
+        """
+        pass
+
+    @classmethod
+    def Snapshot(cls) -> dict:
+        """
+        Return a serializable copy of the registry, keyed by operator paths and method names.
+
+        Only callbacks that are methods (eg. of an extension) can be snapshotted, other callables are left out.
+        Covers the global tables, not the ones of scopes.
+        Pass the result to Init(..., extension_self=self, restore=snapshot), eg. after storing it with ownerComp.store.
+        """
+        pass
+
+    @classmethod
+    def SetFrameBudget(cls, budget_ms: float=None) -> None:
+        """
+        Limit the time spent per frame on callbacks registered with a priority, None for no limit.
+
+        Example:
+            NoNode.SetFrameBudget(4) # ms
+            NoNode.RegisterChopExec(NoNode.ChopExecType.ValueChange, op('show'), '*', self.on_cue, priority=10)
+            NoNode.RegisterDatExec(NoNode.DatExecType.TableChange, op('ui_table'), self.rebuild_ui, priority=-10)
+        """
+        pass
+
+    @classmethod
+    def EnableProfiling(cls, dat: DAT=None, window: int=None) -> None:
+        """
+        Time every registered callback until DisableProfiling is called. Costs nothing while disabled.
+
+        Args:
+            dat (DAT, optional): A tableDAT that is filled with the stats at the end of every frame with calls.
+            window (int, optional): Number of latest durations kept per callback for the p95, default PROFILE_WINDOW.
+        """
+        pass
+
+    @classmethod
+    def DisableProfiling(cls) -> None:
+        """Stop timing callbacks, the collected stats are kept until ResetStats."""
+        pass
+
+    @classmethod
+    def ResetStats(cls) -> None:
+        """Clear the collected stats."""
+        pass
+
+    @classmethod
+    def Stats(cls) -> Dict[str, dict]:
+        """
+        Return the stats per callback, the most expensive first.
+
+        Example:
+            NoNode.EnableProfiling()
+            ...
+            for label, stats in NoNode.Stats().items():
+                print(label, stats['count'], stats['total_ms'], stats['mean_ms'], stats['p95_ms'])
+        """
+        pass
+
+class NoNodeScope:
+    """
+    Registrations of one owner component, returned by NoNode.Scope(ownerComp).
+
+    Mirrors the Register/Deregister API of NoNode (with the same options) on tables of its own, named like the global
+    tables of NoNode. Dispatch walks the global tables and then every scope, so Clear, reinitializing the component or
+    NoNode.Init never touch the registrations of other components. The exec DATs, operator marking, scheduler and
+    offloader are shared.
+    """
+    __slots__ = ('ownerComp', 'CHOPEXEC_CALLBACKS', 'CHOPEXEC_INDEX', 'CHOPEXEC_DIRTY', 'CHOP_BATCH_WATCHERS', 'DATEXEC_CALLBACKS', 'DATEXEC_REGIONS', 'PAREXEC_CALLBACKS', 'PAREXEC_TABLE', 'PAREXEC_LAYOUT', 'KEYBOARD_CALLBACKS')
+
+    def RegisterChopExec(self, event_type: NoNode.ChopExecType, chop: CHOP, channels: Union[str, List[str]], callback: Callable, **options) -> None:
+        pass
+
+    def RegisterDatExec(self, event_type: NoNode.DatExecType, dat: DAT, callback: Callable, **options) -> None:
+        pass
+
+    def RegisterParExec(self, event_type: NoNode.ParExecType, owner: Union[OP, List[OP]], parameter: Union[Par, str, list], callback: Callable, **options) -> None:
+        pass
+
+    def RegisterKeyboardShortcut(self, shortcut: str, callback: Callable) -> None:
+        pass
+
+    def DeregisterChopExec(self, event_type: NoNode.ChopExecType, chop: CHOP=None, channels: Union[str, List[str]]=None) -> None:
+        pass
+
+    def DeregisterDatExec(self, event_type: NoNode.DatExecType, dat: DAT=None, callback: Callable=None, **filters) -> None:
+        pass
+
+    def DeregisterParExec(self, event_type: NoNode.ParExecType, owner: Union[OP, List[OP]]=None, parameter: Union[Par, str, list]=None) -> None:
+        pass
+
+    def DeregisterKeyboardShortcut(self, shortcut: str) -> None:
+        pass
+
+    def Clear(self) -> None:
+        """Deregister everything registered through this scope."""
+        pass
+NoNode.REGISTRIES = (NoNode,)
\ No newline at end of file
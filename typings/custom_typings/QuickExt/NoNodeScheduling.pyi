@@ -0,0 +1,92 @@
+import math
+import time
+import heapq
+import itertools
+import queue
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List
+ChopValues = namedtuple('ChopValues', ['path', 'names'])
+ChannelValues = namedtuple('ChannelValues', ['owner', 'name', 'index', 'vals'])
+ParValue = namedtuple('ParValue', ['owner', 'name', 'val'])
+CellValue = namedtuple('CellValue', ['row', 'col', 'val'])
+
+class CallPolicy:
+    """
+    Throttle, debounce and latest-value-wins coalescing for a NoNode callback.
+
+    Events are stored per key (eg. per channel), only the latest arguments of each key are kept, and they are
+    flushed through `schedule`, so the wrapped callback runs at most once per window and key. Pass `merge` to
+    combine the pending arguments of a key with newer ones instead of replacing them (eg. to keep every cell of
+    a table change). `frame` is only needed with `debounce_frames`.
+    """
+    __slots__ = ('callback', 'interval', 'debounce', 'debounceFrames', 'coalesce', 'key', 'merge', 'clock', 'frame', 'schedule', 'pending', 'lastCall', 'deadline', 'deadlineFrame', 'scheduled')
+
+    @property
+    def alive(self) -> bool:
+        """False once the wrapped callback's owner is gone."""
+        pass
+
+    @property
+    def name(self) -> str:
+        pass
+
+    def Flush(self) -> None:
+        """Call the callback with the latest pending arguments once their window has passed."""
+        pass
+
+class FrameScheduler:
+    """
+    Priority queue of deferred NoNode callbacks with a per-frame time budget.
+
+    Submitted calls are drained at the end of the frame, highest priority first and in submission order
+    within a priority. Once the budget is used up the rest carries over to the next frame, where it is
+    drained again in priority order, nothing is dropped. At least one call runs per drain, so a callback
+    exceeding the budget on its own still makes progress.
+    """
+
+    @property
+    def Pending(self) -> int:
+        """Number of calls waiting in the queue."""
+        pass
+
+    def SetBudget(self, budget_ms: float=None) -> None:
+        """Set the time budget per frame in milliseconds, None for no limit."""
+        pass
+
+    def Submit(self, callback: Callable, args: tuple=(), priority: int=0) -> None:
+        """Queue a call, higher priorities run first."""
+        pass
+
+    def Drain(self) -> int:
+        """Run queued calls until the budget is used up, returns the number of calls made."""
+        pass
+
+class Offloader:
+    """
+    Runs NoNode callbacks in a thread pool and marshals their results back to the main thread.
+
+    Finished jobs are put into a thread-safe queue that `Drain` empties at the end of the frame (through
+    `schedule`), polling once per frame while jobs are running. Results
+    are handed to `on_result` and exceptions are re-raised there, on the main thread. A job submitted with
+    the key of a running one supersedes it: the older job is cancelled if it didn't start yet, its result dropped
+    otherwise. Jobs only get the arguments they are submitted with, see to_plain for turning TouchDesigner objects
+    into plain values first.
+    """
+
+    @property
+    def Pending(self) -> int:
+        """Number of submitted jobs whose results weren't drained yet."""
+        pass
+
+    def Submit(self, fn: Callable, args: tuple=(), key=None, on_result: Callable=None) -> Future:
+        """Run fn(*args) in the pool, on_result receives the result on the main thread."""
+        pass
+
+    def Drain(self) -> int:
+        """Deliver the finished jobs on the main thread in the order they finished, returns the number of results delivered."""
+        pass
+
+    def Shutdown(self) -> None:
+        """Cancel the jobs that didn't start yet and drop all pending results, running jobs finish unnoticed."""
+        pass
\ No newline at end of file